@@ -0,0 +1,101 @@
+from asgiref.sync import sync_to_async
+
+from django.http import HttpResponse
+from django.views import View
+
+from rest_framework.exceptions import ValidationError
+
+from apps.api_root.renderers import FastJSONRenderer
+
+
+class Delegate(Exception):
+    """
+    Raised by async handlers to let the viewset serve the request
+    """
+
+
+def get_route_view(router, name: str):
+    """
+    Gets the view of a router route
+
+    Args:
+        router(SimpleRouter): router with the route
+        name(str): route name
+
+    Returns:
+        route view
+    """
+    for pattern in router.urls:
+        if pattern.name == name:
+            return pattern.callback
+
+    raise KeyError(name)
+
+
+class AsyncReadView(View):
+    """
+    Async read path of a viewset route served under ASGI
+
+    Json GET requests are served with the async ORM and cache api, writes,
+    other formats, invalid filters and unusual lookups are delegated to the
+    viewset view, that runs in a thread like every sync view
+    """
+
+    fallback = None  # viewset view of the same route
+
+    filterset_class = None
+
+    renderer = FastJSONRenderer()
+
+    def accepts_json(self, request) -> bool:
+        """
+        Checks if the viewset would negotiate json for entered request
+        """
+        url_format = request.GET.get("format", None)
+
+        if url_format is not None:
+            return url_format == "json"
+
+        return "text/html" not in request.headers.get("Accept", "")  # browsable api
+
+    async def dispatch(self, request, *args, **kwargs):
+        """
+        Serves json reads asynchronously and delegates the rest
+        """
+        if request.method in ("GET", "HEAD") and self.accepts_json(request):
+            try:
+                return await super().dispatch(request, *args, **kwargs)
+            except (Delegate, ValidationError):
+                pass
+
+        return await sync_to_async(self.fallback)(request, *args, **kwargs)
+
+    async def filter_queryset(self, request, queryset) -> dict:
+        """
+        Filters the queryset with the viewset filterset
+
+        Filters may count or query the database, so they run in a thread
+
+        Args:
+            request(HttpRequest): current request
+            queryset(QuerySet): queryset to filter
+
+        Returns:
+            dict with filtered queryset, total results, ordering and limit
+        """
+
+        def get_filter_data():
+            filterset = self.filterset_class(request.GET, queryset=queryset, request=request)
+
+            if not filterset.is_valid():
+                raise ValidationError(filterset.errors)
+
+            return filterset.qs
+
+        return await sync_to_async(get_filter_data)()
+
+    def render(self, data, status: int = 200) -> HttpResponse:
+        """
+        Gets a json response with the rendered data
+        """
+        return HttpResponse(self.renderer.render(data), status=status, content_type=self.renderer.media_type)
@@ -0,0 +1,75 @@
+from django.http import StreamingHttpResponse
+
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+
+from apps.api_root.renderers import CSVRenderer, NDJSONRenderer
+from core.settings.base import EXPORT_CONFIG
+
+
+class StreamingExportMixin:
+    """
+    Streams list actions as ndjson or csv with '?format=ndjson|csv'
+
+    Rows are read with a server side cursor and rendered by chunks, so the
+    memory used doesn't depend on the exported rows
+    """
+
+    export_renderer_classes = (NDJSONRenderer, CSVRenderer)
+    export_permission_classes = (IsAuthenticated, IsAdminUser)
+    export_actions = ("list",)
+
+    def get_renderers(self):
+        """
+        Adds the export renderers on export actions
+        """
+        renderers = super().get_renderers()
+
+        if self.action in self.export_actions:
+            renderers += [renderer() for renderer in self.export_renderer_classes]
+
+        return renderers
+
+    def is_export(self) -> bool:
+        """
+        Checks if the request negotiated an export renderer
+        """
+        return isinstance(getattr(self.request, "accepted_renderer", None), self.export_renderer_classes)
+
+    def get_export_rows(self, queryset):
+        """
+        Gets the representations of the queryset rows
+
+        Args:
+            queryset(QuerySet): filtered queryset
+
+        Returns:
+            generator of representations
+        """
+        serializer = self.get_serializer()  # fields are bound once for every row
+
+        for instance in queryset.iterator(chunk_size=EXPORT_CONFIG["CHUNK_SIZE"]):
+            yield serializer.to_representation(instance)
+
+    def export(self, queryset):
+        """
+        Streams the queryset rows with the negotiated export renderer
+
+        Args:
+            queryset(QuerySet): filtered queryset
+
+        Returns:
+            streaming response
+        """
+        for permission in self.export_permission_classes:
+            if not permission().has_permission(self.request, self):
+                self.permission_denied(self.request, message=getattr(permission, "message", None))
+
+        renderer = self.request.accepted_renderer
+
+        response = StreamingHttpResponse(
+            renderer.render_rows(self.get_export_rows(queryset), EXPORT_CONFIG["RENDER_CHUNK_SIZE"]),
+            content_type=f"{renderer.media_type}; charset=utf-8",
+        )
+        response["Content-Disposition"] = f'attachment; filename="{self.basename}.{renderer.format}"'
+
+        return response
@@ -0,0 +1,205 @@
+import asyncio
+from datetime import date
+from time import perf_counter
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import AsyncRequestFactory
+
+from rest_framework.test import APIRequestFactory
+
+from apps.api_root.async_views import get_route_view
+from apps.api_root.response_cache import bump_version
+from apps.categories.async_views import AsyncCategoriesListView
+from apps.categories.routers import router as categories_router
+from apps.products.routers import router as products_router
+from apps.products.views.async_views import (
+    AsyncProductsListView,
+    AsyncProductDetailView,
+    AsyncRelatedProductsView,
+)
+from apps.promos.async_views import AsyncPromosListView
+from apps.promos.routers import router as promos_router
+from core.settings.base import RESPONSE_CACHE_CONFIG
+from db.models import Category, Comment, Product, Promo
+
+
+class Command(BaseCommand):
+    """
+    Compares catalogue reads served by a sync worker and by one event loop
+    """
+
+    help = (
+        "Seeds the catalogue, times concurrent reads of the async views in one event "
+        "loop against the same reads served one by one by the viewsets, like a sync "
+        "worker does, and rolls every change back"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=200, help="Seeded products")
+        parser.add_argument("--concurrency", type=int, default=50, help="Concurrent requests by case")
+        parser.add_argument("--cached", action="store_true", help="Serve responses from the response cache")
+
+    def seed(self, rows: int) -> Product:
+        """
+        Seeds categories, products and promos
+
+        Args:
+            rows(int): seeded products
+
+        Returns:
+            product whose detail and related products are read
+        """
+        parents = Category.objects.bulk_create(
+            [Category(title=f"Benchmark category {index}") for index in range(max(rows // 50, 1))]
+        )
+        Category.objects.bulk_create(
+            [Category(title=f"Benchmark subcategory {index}", parent=parent) for index, parent in enumerate(parents)]
+        )
+        products = Product.objects.bulk_create(
+            [
+                Product(
+                    title=f"Benchmark product {index}",
+                    description="Benchmark description",
+                    price=index % 1000 + 1,
+                    images=["benchmark.com/1"],
+                    stock=100,
+                    category=parents[index % len(parents)],
+                    sold=index % 500,
+                )
+                for index in range(rows)
+            ]
+        )
+        Promo.objects.bulk_create(
+            [
+                Promo(
+                    title=f"Benchmark promo {index}",
+                    subtitle="Benchmark",
+                    expiration=date(2030, 1, 1),
+                    images=["benchmark.com/1"],
+                    href="https://benchmark.com",
+                )
+                for index in range(10)
+            ]
+        )
+
+        return products[0]
+
+    def get_cases(self, product: Product) -> list:
+        """
+        Gets the timed reads
+
+        Returns:
+            list of name, path, query params, route kwargs, async view and viewset view
+        """
+        products_list = get_route_view(products_router, "product-list")
+        product_detail = get_route_view(products_router, "product-detail")
+        related_products = get_route_view(products_router, "product-get-related-products")
+        categories_list = get_route_view(categories_router, "category-list")
+        promos_list = get_route_view(promos_router, "promo-list")
+
+        pk = str(product.id)
+
+        return [
+            (
+                "Products list",
+                "/api/products/",
+                {"limit": 20},
+                {},
+                AsyncProductsListView.as_view(fallback=products_list),
+                products_list,
+            ),
+            (
+                "Product detail",
+                f"/api/products/{pk}/",
+                {},
+                {"pk": pk},
+                AsyncProductDetailView.as_view(fallback=product_detail),
+                product_detail,
+            ),
+            (
+                "Related products",
+                f"/api/products/{pk}/related-products/",
+                {},
+                {"pk": pk},
+                AsyncRelatedProductsView.as_view(fallback=related_products),
+                related_products,
+            ),
+            (
+                "Categories list",
+                "/api/categories/",
+                {},
+                {},
+                AsyncCategoriesListView.as_view(fallback=categories_list),
+                categories_list,
+            ),
+            (
+                "Promos list",
+                "/api/promos/",
+                {},
+                {},
+                AsyncPromosListView.as_view(fallback=promos_list),
+                promos_list,
+            ),
+        ]
+
+    def time_sync(self, view, path: str, params: dict, kwargs: dict, concurrency: int) -> float:
+        """
+        Times the requests served one by one
+
+        Returns:
+            elapsed seconds
+        """
+        factory = APIRequestFactory()
+
+        start = perf_counter()
+
+        for _ in range(concurrency):
+            response = view(factory.get(path, params), **kwargs)
+
+            if hasattr(response, "render"):  # cached responses are already rendered
+                response.render()
+
+        return perf_counter() - start
+
+    async def time_async(self, view, path: str, params: dict, kwargs: dict, concurrency: int) -> float:
+        """
+        Times the requests served concurrently in one event loop
+
+        Returns:
+            elapsed seconds
+        """
+        factory = AsyncRequestFactory()
+
+        start = perf_counter()
+
+        await asyncio.gather(*(view(factory.get(path, params), **kwargs) for _ in range(concurrency)))
+
+        return perf_counter() - start
+
+    def handle(self, *args, **options):
+        concurrency = options["concurrency"]
+
+        with transaction.atomic(), patch.dict(RESPONSE_CACHE_CONFIG, {"ENABLED": options["cached"]}):
+            product = self.seed(options["rows"])
+
+            for name, path, params, kwargs, async_view, sync_view in self.get_cases(product):
+                sync_view(APIRequestFactory().get(path, params), **kwargs)  # warms caches and the category tree
+
+                sync_elapsed = self.time_sync(sync_view, path, params, kwargs, concurrency)
+                async_elapsed = async_to_sync(self.time_async)(async_view, path, params, kwargs, concurrency)
+
+                self.stdout.write(
+                    f"{name}: WSGI {concurrency / sync_elapsed:.0f} req/s, "
+                    f"ASGI {concurrency / async_elapsed:.0f} req/s"
+                )
+
+            transaction.set_rollback(True)
+
+        for model in (Product, Category, Comment, Promo):
+            bump_version(model)  # responses cached from seeded rows
+
+        self.stdout.write(self.style.SUCCESS("Seeded rows were rolled back."))
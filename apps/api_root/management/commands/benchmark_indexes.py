@@ -0,0 +1,217 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from db.models import (
+    Cart,
+    CartItem,
+    Category,
+    Comment,
+    FavouriteItem,
+    Order,
+    OrderProduct,
+    Product,
+    ShippingInfo,
+)
+
+
+class Command(BaseCommand):
+    """
+    Compares hot lookup plans with and without their composite indexes
+    """
+
+    help = (
+        "Seeds rows, explains the hot manager and filterset lookups with and without "
+        "index scans and rolls every change back. It only runs with DEBUG or an explicit --database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000, help="Seeded products")
+        parser.add_argument("--database", default=None, help="Database seeded and explained")
+
+    def seed(self, rows: int, using: str) -> dict:
+        """
+        Seeds users with shipping info, carts, favourites, comments and orders
+
+        Args:
+            rows(int): seeded products
+            using(str): database alias
+
+        Returns:
+            dict with the instances used by the lookups
+        """
+        users = get_user_model().objects.using(using).bulk_create(
+            [get_user_model()(email=f"benchmark{index}@benchmark.com") for index in range(max(rows // 10, 1))]
+        )
+        categories = Category.objects.using(using).bulk_create(
+            [Category(title=f"Benchmark category {index}") for index in range(max(rows // 100, 1))]
+        )
+        products = Product.objects.using(using).bulk_create(
+            [
+                Product(
+                    title=f"Benchmark product {index}",
+                    description="Benchmark description",
+                    price=index % 1000 + 1,
+                    images=["benchmark.com/1"],
+                    stock=100,
+                    category=categories[index % len(categories)],
+                    sold=index % 500,
+                )
+                for index in range(rows)
+            ]
+        )
+
+        shipping_info = ShippingInfo.objects.using(using).bulk_create(
+            [
+                ShippingInfo(
+                    user=user, address="Benchmark 123", receiver="Benchmark", receiver_dni=1, is_selected=index == 2
+                )
+                for user in users
+                for index in range(3)
+            ]
+        )
+        carts = Cart.objects.using(using).bulk_create([Cart(user=user) for user in users])
+
+        def get_products(index: int, quantity: int):
+            return [products[(index * quantity + offset) % len(products)] for offset in range(quantity)]
+
+        CartItem.objects.using(using).bulk_create(
+            [
+                CartItem(cart=cart, product=product, count=1)
+                for index, cart in enumerate(carts)
+                for product in get_products(index, 5)
+            ]
+        )
+        FavouriteItem.objects.using(using).bulk_create(
+            [
+                FavouriteItem(user=user, product=product)
+                for index, user in enumerate(users)
+                for product in get_products(index, 5)
+            ]
+        )
+        Comment.objects.using(using).bulk_create(
+            [
+                Comment(
+                    user=users[index % len(users)],
+                    product=product,
+                    subject="Benchmark",
+                    content="Benchmark",
+                    rate=index % 5 + 1,
+                )
+                for index, product in enumerate(products * 2)
+            ]
+        )
+        orders = Order.objects.using(using).bulk_create(
+            [Order(buyer=user, shipping_info=shipping_info[index * 3]) for index, user in enumerate(users)]
+        )
+        OrderProduct.objects.using(using).bulk_create(
+            [
+                OrderProduct(order=order, product=product)
+                for index, order in enumerate(orders)
+                for product in get_products(index, 3)
+            ]
+        )
+
+        return {
+            "user": users[-1],
+            "cart": carts[-1],
+            "category": categories[-1],
+            "product": products[-1],
+            "order": orders[-1],
+        }
+
+    def get_cases(self, sample: dict, using: str) -> list:
+        """
+        Gets the explained lookups and the indexes that serve them
+
+        Args:
+            sample(dict): seeded instances
+            using(str): database alias
+
+        Returns:
+            list of name, queryset and index names
+        """
+        return [
+            (
+                "Selected shipping info",
+                ShippingInfo.objects.using(using).filter(user=sample["user"], is_selected=True),
+                ["db_shippinginfo_user_selected"],
+            ),
+            (
+                "Cart item of product",
+                CartItem.objects.using(using).filter(cart=sample["cart"], product=sample["product"]),
+                ["db_cartitem_cart_product"],
+            ),
+            (
+                "Favourite item of user",
+                FavouriteItem.objects.using(using).filter(user=sample["user"], product=sample["product"]),
+                ["db_favouriteitem_user_product"],
+            ),
+            (
+                "Order product of order",
+                OrderProduct.objects.using(using).filter(order=sample["order"], product=sample["product"]),
+                ["db_orderproduct_order_product"],
+            ),
+            (
+                "Product comments by rate",
+                Comment.objects.using(using).filter(product=sample["product"], rate__gte=4),
+                ["db_comment_product_rate"],
+            ),
+            (
+                "Category products by sold",
+                Product.objects.using(using).filter(category=sample["category"], price__lte=500).order_by("-sold")[:20],
+                ["db_product_category_sold"],
+            ),
+        ]
+
+    def write_plan(self, title: str, plan: str):
+        """
+        Writes an indented plan
+        """
+        self.stdout.write(f"  {title}:")
+
+        for line in plan.splitlines():
+            self.stdout.write(f"    {line}")
+
+    def explain_without_index_scans(self, queryset, using: str) -> str:
+        """
+        Explains the queryset with index scans disabled in a savepoint,
+        rolling it back restores the planner settings
+        """
+        with transaction.atomic(using=using):
+            with connections[using].cursor() as cursor:
+                cursor.execute("SET LOCAL enable_indexscan = off")
+                cursor.execute("SET LOCAL enable_indexonlyscan = off")
+                cursor.execute("SET LOCAL enable_bitmapscan = off")
+
+            plan = queryset.explain(analyze=True)
+
+            transaction.set_rollback(True, using=using)
+
+        return plan
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options["database"]:
+            raise CommandError(
+                "The benchmark seeds rows in the database tables, "
+                "run it with DEBUG or an explicit --database."
+            )
+
+        using = options["database"] or DEFAULT_DB_ALIAS
+
+        with transaction.atomic(using=using):
+            sample = self.seed(options["rows"], using)
+
+            with connections[using].cursor() as cursor:
+                cursor.execute("ANALYZE")
+
+            for name, queryset, indexes in self.get_cases(sample, using):
+                self.stdout.write(self.style.MIGRATE_HEADING(f"{name} ({', '.join(indexes)})"))
+
+                self.write_plan("With indexes", queryset.explain(analyze=True))
+                self.write_plan("Without indexes", self.explain_without_index_scans(queryset, using))
+
+            transaction.set_rollback(True, using=using)
+
+        self.stdout.write(self.style.SUCCESS("Seeded rows were rolled back."))
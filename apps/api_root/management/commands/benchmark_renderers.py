@@ -0,0 +1,134 @@
+from io import BytesIO
+from time import perf_counter
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apps.api_root.parsers import FastJSONParser
+from apps.api_root.renderers import FastJSONRenderer, orjson
+from apps.comments.serializers import CommentSerializer
+from apps.orders.serializers import OrderSerializer
+from apps.products.serializers import ProductSerializer
+from db.models import Category, Comment, Order, OrderProduct, Product, ShippingInfo
+
+
+class Command(BaseCommand):
+    """
+    Compares DRF json renderer and parser with the project ones
+    """
+
+    help = (
+        "Seeds products, orders and comments, times rendering and parsing their "
+        "payloads with the DRF and project json classes and rolls every change back"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=500, help="Serialized instances by payload")
+        parser.add_argument("--rounds", type=int, default=20, help="Timed renders by case")
+
+    def seed(self, rows: int):
+        """
+        Seeds products with comments and orders
+
+        Args:
+            rows(int): seeded instances by model
+        """
+        user = get_user_model().objects.create_user(email="benchmark@benchmark.com")
+        category = Category.objects.create(title="Benchmark category")
+        shipping_info = ShippingInfo.objects.create(
+            user=user, address="Benchmark 123", receiver="Benchmark", receiver_dni=1
+        )
+
+        products = Product.objects.bulk_create(
+            [
+                Product(
+                    title=f"Benchmark product {index}",
+                    description="Benchmark description",
+                    price=index % 1000 + 1,
+                    images=["benchmark.com/1", "benchmark.com/2"],
+                    stock=100,
+                    category=category,
+                    sold=index % 500,
+                )
+                for index in range(rows)
+            ]
+        )
+        Comment.objects.bulk_create(
+            [
+                Comment(user=user, product=product, subject="Benchmark", content="Benchmark", rate=index % 5 + 1)
+                for index, product in enumerate(products)
+            ]
+        )
+        orders = Order.objects.bulk_create([Order(buyer=user, shipping_info=shipping_info) for _ in range(rows)])
+        OrderProduct.objects.bulk_create(
+            [
+                OrderProduct(order=order, product=products[(index + offset) % rows], count=offset + 1)
+                for index, order in enumerate(orders)
+                for offset in range(3)
+            ]
+        )
+
+    def get_payloads(self) -> list:
+        """
+        Gets the serialized payloads by name
+        """
+        orders = Order.objects.select_related("buyer", "shipping_info")
+
+        return [
+            ("Products", ProductSerializer(Product.objects.select_related("category"), many=True).data),
+            ("Orders", OrderSerializer(orders, many=True).data),
+            ("Comments", CommentSerializer(Comment.objects.all(), many=True).data),
+        ]
+
+    def time(self, function, rounds: int) -> float:
+        """
+        Times entered function
+
+        Returns:
+            average milliseconds by call
+        """
+        start = perf_counter()
+
+        for _ in range(rounds):
+            function()
+
+        return (perf_counter() - start) / rounds * 1000
+
+    def write_case(self, name: str, default: float, fast: float):
+        """
+        Writes the timings of a case
+        """
+        self.stdout.write(f"  {name}: DRF {default:.2f} ms, project {fast:.2f} ms ({default / fast:.1f}x)")
+
+    def handle(self, *args, **options):
+        rounds = options["rounds"]
+
+        with transaction.atomic():
+            self.seed(options["rows"])
+            payloads = self.get_payloads()
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"Backend: {'orjson' if orjson else 'json'}")
+
+        for name, data in payloads:
+            content = JSONRenderer().render(data)
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{name} ({len(content)} bytes)"))
+
+            self.write_case(
+                "Render",
+                self.time(lambda: JSONRenderer().render(data), rounds),
+                self.time(lambda: FastJSONRenderer().render(data), rounds),
+            )
+            self.write_case(
+                "Parse",
+                self.time(lambda: JSONParser().parse(BytesIO(content)), rounds),
+                self.time(lambda: FastJSONParser().parse(BytesIO(content)), rounds),
+            )
+
+        self.stdout.write(self.style.SUCCESS("Seeded rows were rolled back."))
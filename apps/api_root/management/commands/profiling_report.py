@@ -0,0 +1,46 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from apps.api_root import profiling
+
+
+class Command(BaseCommand):
+    """
+    Dumps the profiled routes summary
+    """
+
+    help = "Dumps the rolling per route summary recorded by the profiling middleware"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--json", action="store_true", help="Dumps the summary as json")
+        parser.add_argument("--reset", action="store_true", help="Deletes the samples after dumping them")
+
+    def write_route(self, route: dict):
+        """
+        Writes the summary of a route
+        """
+        self.stdout.write(
+            f"{route['route']}: {route['requests']} requests, "
+            f"{route['avg_duration_ms']}ms avg, {route['p95_duration_ms']}ms p95, "
+            f"{route['avg_queries']} queries avg ({route['max_queries']} max), "
+            f"{route['avg_db_time_ms']}ms db, {route['avg_serializer_time_ms']}ms serializer, "
+            f"{route['avg_response_size']} bytes"
+        )
+
+        for duplicate in route["duplicate_queries"]:
+            self.stdout.write(f"    {duplicate['count']}x {duplicate['fingerprint']}")
+
+    def handle(self, *args, **options):
+        summary = profiling.get_summary()
+
+        if options["json"]:
+            self.stdout.write(json.dumps(summary, indent=2))
+        elif not summary:
+            self.stdout.write("No profiled routes.")
+        else:
+            [self.write_route(route) for route in summary]
+
+        if options["reset"]:
+            profiling.reset()
+            self.stdout.write(self.style.SUCCESS("Profiling samples deleted."))
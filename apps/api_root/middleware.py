@@ -0,0 +1,96 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+from core.settings.base import PROFILING_CONFIG
+
+from apps.api_root.profiling import RequestProfile, current_profile, instrument_serializers, record_sample
+
+
+class ProfilingMiddleware:
+    """
+    Records query count, database time, duplicate queries, serializer time
+    and response size by route, it is only loaded when profiling is enabled
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not PROFILING_CONFIG.get("ENABLED", False):
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+        instrument_serializers()
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        profile = RequestProfile()
+        token = current_profile.set(profile)
+        start = time.perf_counter()
+
+        try:
+            with connection.execute_wrapper(profile):
+                response = self.get_response(request)
+        finally:
+            current_profile.reset(token)
+
+        self.record(request, response, profile, time.perf_counter() - start)
+
+        return response
+
+    async def __acall__(self, request):
+        """
+        Profiles async requests, the execute wrapper is added to the
+        connection of the thread that runs their queries
+        """
+        profile = RequestProfile()
+        token = current_profile.set(profile)
+        start = time.perf_counter()
+
+        wrapper = await sync_to_async(self.add_execute_wrapper)(profile)
+
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(wrapper.__exit__)(None, None, None)
+            current_profile.reset(token)
+
+        await sync_to_async(self.record, thread_sensitive=False)(
+            request, response, profile, time.perf_counter() - start
+        )
+
+        return response
+
+    @staticmethod
+    def add_execute_wrapper(profile: RequestProfile):
+        """
+        Adds the profile to the connection of the current thread
+
+        Returns:
+            entered execute wrapper
+        """
+        wrapper = connection.execute_wrapper(profile)
+        wrapper.__enter__()
+
+        return wrapper
+
+    @staticmethod
+    def record(request, response, profile: RequestProfile, duration: float):
+        """
+        Records the request sample of its route
+        """
+        if request.resolver_match:
+            route = f"{request.method} {request.resolver_match.view_name}"
+            response_size = None if response.streaming else len(response.content)
+
+            record_sample(route, profile.get_sample(duration, response_size))
@@ -0,0 +1,182 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.db.models import Q
+from django.db.models.fields import AutoFieldMixin
+
+from rest_framework.exceptions import ValidationError
+
+from core.settings.base import PAGINATION_CONFIG
+
+PAGINATION_FILTERS = ("cursor", "offset", "limit")
+
+
+def get_estimated_count(model) -> int:
+    """
+    Gets the planner row estimate of the model table
+
+    Args:
+        model(Model): model whose table is estimated
+
+    Returns:
+        estimated rows or -1 if the table was never analyzed
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+
+    return int(row[0]) if row else -1
+
+
+def get_total_count(queryset) -> int:
+    """
+    Counts the queryset rows in the database
+
+    Unfiltered querysets over big tables use the planner estimate
+    instead of a full COUNT(*) scan
+
+    Args:
+        queryset(QuerySet): filtered queryset
+
+    Returns:
+        total results
+    """
+    threshold = PAGINATION_CONFIG.get("ESTIMATED_COUNT_THRESHOLD", None)
+
+    if threshold is not None and connection.vendor == "postgresql" and not queryset.query.where:
+        estimated_count = get_estimated_count(queryset.model)
+
+        if estimated_count > threshold:
+            return estimated_count
+
+    return queryset.count()
+
+
+def get_ordering(queryset):
+    """
+    Gets the queryset ordering with a pk tiebreaker
+
+    Unordered querysets are only paged by pk when it follows the insertion
+    order, models with uuid pks need an explicit order
+
+    Args:
+        queryset(QuerySet): ordered or unordered queryset
+
+    Returns:
+        list of order fields or None if ordering can't be used as keyset
+    """
+    ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+
+    if not ordering and not isinstance(queryset.model._meta.pk, AutoFieldMixin):
+        return None
+
+    if not all(isinstance(field, str) and field != "?" for field in ordering):
+        return None
+
+    if not {"pk", "-pk", "id", "-id"} & set(ordering):
+        ordering.append("pk")
+
+    return ordering
+
+
+def encode_cursor(ordering: list, values: list) -> str:
+    """
+    Encodes an opaque cursor with the last row keyset
+
+    Args:
+        ordering(list<str>): active order fields
+        values(list): order field values of the last row
+
+    Returns:
+        encoded cursor
+    """
+    payload = json.dumps({"o": ordering, "v": values}, cls=DjangoJSONEncoder)
+
+    return urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> dict:
+    """
+    Decodes entered opaque cursor
+
+    Args:
+        cursor(str): encoded cursor
+
+    Returns:
+        dict with cursor ordering and values
+    """
+    try:
+        payload = json.loads(urlsafe_b64decode(cursor.encode()))
+    except (BinasciiError, UnicodeError, ValueError):
+        raise ValidationError({"cursor": "Invalid cursor."})
+
+    if not isinstance(payload, dict) or not isinstance(payload.get("v", None), list):
+        raise ValidationError({"cursor": "Invalid cursor."})
+
+    return payload
+
+
+def filter_after_cursor(queryset, ordering: list, cursor: str):
+    """
+    Filters the rows placed after the entered cursor
+
+    Args:
+        queryset(QuerySet): queryset ordered by 'ordering'
+        ordering(list<str>): active order fields
+        cursor(str): encoded cursor
+
+    Returns:
+        filtered queryset
+    """
+    payload = decode_cursor(cursor)
+
+    if ordering is None or payload.get("o", None) != ordering or len(payload["v"]) != len(ordering):
+        raise ValidationError({"cursor": "Cursor does not match the current order."})
+
+    keyset = Q()
+    previous = {}
+
+    for field, value in zip(ordering, payload["v"]):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+
+        keyset |= Q(**previous, **{f"{name}__{lookup}": value})
+        previous[name] = value
+
+    return queryset.filter(keyset)
+
+
+def get_next_cursor(page, ordering: list, limit: int):
+    """
+    Gets the cursor of the next page
+
+    Args:
+        page(QuerySet): evaluated page
+        ordering(list<str>): active order fields
+        limit(int): page size
+
+    Returns:
+        encoded cursor or None if there aren't more pages
+    """
+    if ordering is None or not limit or len(page) < limit:
+        return None
+
+    last_item = page[len(page) - 1]
+
+    values = []
+
+    for field in ordering:
+        value = last_item
+
+        for attr in field.lstrip("-").split("__"):
+            value = getattr(value, attr)
+
+        values.append(value)
+
+    return encode_cursor(ordering, values)
@@ -0,0 +1,271 @@
+import re
+import time
+from hashlib import sha1
+from collections import Counter
+from math import ceil
+from contextvars import ContextVar
+
+from django.core.cache import cache
+
+from rest_framework.serializers import BaseSerializer
+
+from core.settings.base import PROFILING_CONFIG
+
+ROUTES_COUNT_CACHE_KEY = "profiling:routes"
+
+ROUTES_CACHE_KEY = "profiling:routes:{index}"
+
+ROUTE_COUNT_CACHE_KEY = "profiling:route:{digest}"
+
+ROUTE_CACHE_KEY = "profiling:route:{digest}:{slot}"
+
+FINGERPRINT_PATTERNS = (
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"%s"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(...)"),
+    (re.compile(r"\s+"), " "),
+)
+
+current_profile = ContextVar("current_profile", default=None)
+
+
+def get_fingerprint(sql: str) -> str:
+    """
+    Gets the sql statement without its literal values
+
+    Args:
+        sql(str): executed sql
+
+    Returns:
+        normalized sql
+    """
+    for pattern, replacement in FINGERPRINT_PATTERNS:
+        sql = pattern.sub(replacement, sql)
+
+    return sql.strip()
+
+
+class RequestProfile:
+    """
+    Measures of a single request, it is used as a database execute wrapper
+    """
+
+    def __init__(self):
+        self.queries = []
+        self.serializer_time = 0.0
+        self.serializing = False
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((get_fingerprint(sql), time.perf_counter() - start))
+
+    def get_duplicates(self) -> dict:
+        """
+        Gets the fingerprints executed more than once
+        """
+        fingerprints = Counter(fingerprint for fingerprint, _ in self.queries)
+
+        return {fingerprint: count for fingerprint, count in fingerprints.items() if count > 1}
+
+    def get_sample(self, duration: float, response_size) -> dict:
+        """
+        Gets the request sample stored in the route summary
+
+        Args:
+            duration(float): request seconds
+            response_size(int): rendered response bytes, None for streaming responses
+
+        Returns:
+            sample dict
+        """
+        return {
+            "duration": duration,
+            "queries": len(self.queries),
+            "db_time": sum(query_time for _, query_time in self.queries),
+            "serializer_time": self.serializer_time,
+            "response_size": response_size,
+            "duplicates": self.get_duplicates(),
+        }
+
+
+def instrument_serializers():
+    """
+    Wraps serializers data to add the outermost serialization time to the current profile
+    """
+    data = BaseSerializer.data.fget
+
+    if getattr(data, "profiled", False):
+        return
+
+    def profiled_data(serializer):
+        profile = current_profile.get()
+
+        if profile is None or profile.serializing:
+            return data(serializer)
+
+        profile.serializing = True
+        start = time.perf_counter()
+
+        try:
+            return data(serializer)
+        finally:
+            profile.serializer_time += time.perf_counter() - start
+            profile.serializing = False
+
+    profiled_data.profiled = True
+
+    BaseSerializer.data = property(profiled_data)
+
+
+def get_route_digest(route: str) -> str:
+    """
+    Gets the route as a valid cache key part, routes contain spaces
+    """
+    return sha1(route.encode()).hexdigest()
+
+
+def increment(key: str, timeout) -> int:
+    """
+    Increments a cache counter, the cache increments it atomically so
+    concurrent requests never get the same value
+
+    Returns:
+        incremented value
+    """
+    cache.add(key, 0, timeout)
+
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # expired or evicted after being added, the counter starts again
+        cache.set(key, 1, timeout)
+        return 1
+
+
+def record_sample(route: str, sample: dict):
+    """
+    Adds the sample to the rolling window of the route
+
+    Every sample is stored in its own slot of a ring buffer picked with an
+    atomic counter, so concurrent requests don't overwrite each other samples
+
+    Args:
+        route(str): request method and view name
+        sample(dict): request sample
+    """
+    timeout = PROFILING_CONFIG.get("TIMEOUT", None)
+    digest = get_route_digest(route)
+
+    count = increment(ROUTE_COUNT_CACHE_KEY.format(digest=digest), timeout)
+    slot = (count - 1) % PROFILING_CONFIG.get("WINDOW", 100)
+
+    cache.set(ROUTE_CACHE_KEY.format(digest=digest, slot=slot), sample, timeout)
+
+    if count == 1:  # first sample of the route
+        index = increment(ROUTES_COUNT_CACHE_KEY, timeout)
+        cache.set(ROUTES_CACHE_KEY.format(index=index), route, timeout)
+
+
+def get_routes() -> list:
+    """
+    Gets the profiled routes
+    """
+    keys = [ROUTES_CACHE_KEY.format(index=index) for index in range(1, cache.get(ROUTES_COUNT_CACHE_KEY, 0) + 1)]
+
+    return list(dict.fromkeys(cache.get_many(keys).values()))
+
+
+def get_sample_keys(route: str) -> list:
+    """
+    Gets the cache keys of the route samples
+    """
+    digest = get_route_digest(route)
+    slots = min(cache.get(ROUTE_COUNT_CACHE_KEY.format(digest=digest), 0), PROFILING_CONFIG.get("WINDOW", 100))
+
+    return [ROUTE_CACHE_KEY.format(digest=digest, slot=slot) for slot in range(slots)]
+
+
+def get_samples(route: str) -> list:
+    """
+    Gets the samples of the route rolling window
+    """
+    return list(cache.get_many(get_sample_keys(route)).values())
+
+
+def get_average(values: list) -> float:
+    """
+    Gets the average of entered values ignoring None
+    """
+    values = [value for value in values if value is not None]
+
+    return sum(values) / len(values) if values else 0
+
+
+def get_route_summary(route: str, samples: list) -> dict:
+    """
+    Summarizes the route samples
+
+    Args:
+        route(str): request method and view name
+        samples(list<dict>): route samples
+
+    Returns:
+        route summary dict
+    """
+    durations = sorted(sample["duration"] for sample in samples)
+
+    duplicates = Counter()
+
+    for sample in samples:
+        duplicates.update(sample["duplicates"])
+
+    return {
+        "route": route,
+        "requests": len(samples),
+        "avg_duration_ms": round(get_average(durations) * 1000, 2),
+        "p95_duration_ms": round(durations[ceil(len(durations) * 0.95) - 1] * 1000, 2),
+        "avg_queries": round(get_average([sample["queries"] for sample in samples]), 2),
+        "max_queries": max(sample["queries"] for sample in samples),
+        "avg_db_time_ms": round(get_average([sample["db_time"] for sample in samples]) * 1000, 2),
+        "avg_serializer_time_ms": round(get_average([sample["serializer_time"] for sample in samples]) * 1000, 2),
+        "avg_response_size": round(get_average([sample["response_size"] for sample in samples])),
+        "duplicate_queries": [
+            {"fingerprint": fingerprint, "count": count} for fingerprint, count in duplicates.most_common(5)
+        ],
+    }
+
+
+def get_summary() -> list:
+    """
+    Gets the summary of every profiled route
+
+    Returns:
+        route summaries ordered by average queries
+    """
+    summary = []
+
+    for route in get_routes():
+        samples = get_samples(route)
+
+        if samples:
+            summary.append(get_route_summary(route, samples))
+
+    return sorted(summary, key=lambda route_summary: route_summary["avg_queries"], reverse=True)
+
+
+def reset():
+    """
+    Deletes every profiled route sample
+    """
+    keys = [ROUTES_COUNT_CACHE_KEY]
+    keys += [ROUTES_CACHE_KEY.format(index=index) for index in range(1, cache.get(ROUTES_COUNT_CACHE_KEY, 0) + 1)]
+
+    for route in get_routes():
+        keys += get_sample_keys(route) + [ROUTE_COUNT_CACHE_KEY.format(digest=get_route_digest(route))]
+
+    cache.delete_many(keys)
@@ -0,0 +1,201 @@
+import csv
+from io import StringIO
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # stdlib json is used
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Json renderer backed by orjson when it is installed
+
+    UUIDs, dicts, lists and numbers are encoded natively, dates, times and
+    decimals keep the DRF representation through its encoder, indented output
+    and missing orjson fall back to the stdlib renderer
+    """
+
+    encoder = JSONEncoder()
+
+    options = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Renders data into json bytes
+
+        Args:
+            data: data to render
+            accepted_media_type(str): negotiated media type
+            renderer_context(dict): view context
+
+        Returns:
+            rendered json
+        """
+        if data is None:
+            return b""
+
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self.encoder.default, option=self.options)
+
+        # same escaping than DRF, they are valid json but not valid javascript
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+    def render_stream(self, items, envelope: dict = None, key: str = None, chunk_size: int = 100):
+        """
+        Renders a json list lazily, the whole list is never held in memory
+
+        Args:
+            items(iterable): representations to render, like a serialized queryset iterator
+            envelope(dict): optional object members, the member 'key' is replaced by the list
+            key(str): member with the list
+            chunk_size(int): items rendered by chunk
+
+        Returns:
+            generator of rendered chunks
+        """
+        envelope = envelope or {}
+        names = list(envelope)
+        position = names.index(key) if key in envelope else len(names)
+
+        def render_members(names):
+            return [self.render(name) + b":" + (self.render(envelope[name]) or b"null") for name in names]
+
+        if key:
+            head = render_members(names[:position]) + [self.render(key) + b":"]
+            yield b"{" + b",".join(head)
+
+        yield b"["
+
+        chunk = []
+        separator = b""
+
+        for item in items:
+            chunk.append(self.render(item) or b"null")
+
+            if len(chunk) >= chunk_size:
+                yield separator + b",".join(chunk)
+                chunk, separator = [], b","
+
+        if chunk:
+            yield separator + b",".join(chunk)
+
+        yield b"]"
+
+        if key:
+            yield b"".join(b"," + member for member in render_members(names[position + 1:])) + b"}"
+
+
+class NDJSONRenderer(FastJSONRenderer):
+    """
+    Newline delimited json renderer, one item by line
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Renders an item or a list of items, one by line
+        """
+        if data is None:
+            return b""
+
+        return b"".join(self.render_rows(data if isinstance(data, list) else [data]))
+
+    def render_rows(self, rows, chunk_size: int = 100):
+        """
+        Renders items lazily, one by line
+
+        Args:
+            rows(iterable): representations to render
+            chunk_size(int): items rendered by chunk
+
+        Returns:
+            generator of rendered chunks
+        """
+        chunk = []
+
+        for row in rows:
+            chunk.append(super().render(row) + b"\n")
+
+            if len(chunk) >= chunk_size:
+                yield b"".join(chunk)
+                chunk = []
+
+        if chunk:
+            yield b"".join(chunk)
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    Csv renderer, the header is taken from the first item keys
+
+    Nested values are written as json
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    json_renderer = FastJSONRenderer()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Renders an item or a list of items, one by row
+        """
+        if data is None:
+            return b""
+
+        return b"".join(self.render_rows(data if isinstance(data, list) else [data]))
+
+    def get_cell(self, value):
+        """
+        Gets the csv cell of a representation value
+        """
+        if value is None:
+            return ""
+
+        if isinstance(value, (dict, list)):
+            return self.json_renderer.render(value).decode()
+
+        return value
+
+    def render_rows(self, rows, chunk_size: int = 100):
+        """
+        Renders items lazily, one by row
+
+        Args:
+            rows(iterable): representations to render
+            chunk_size(int): items rendered by chunk
+
+        Returns:
+            generator of rendered chunks
+        """
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+
+        header = None
+        pending = 0
+
+        for row in rows:
+            if header is None:
+                header = list(row)
+                writer.writerow(header)
+
+            writer.writerow([self.get_cell(row.get(name, None)) for name in header])
+            pending += 1
+
+            if pending >= chunk_size:
+                yield buffer.getvalue().encode(self.charset)
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+
+        if buffer.tell():
+            yield buffer.getvalue().encode(self.charset)
@@ -0,0 +1,274 @@
+import time
+from functools import wraps
+from hashlib import sha1
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date, parse_etags
+
+from rest_framework.response import Response
+
+from apps.api_root.renderers import FastJSONRenderer
+
+from core.settings.base import RESPONSE_CACHE_CONFIG
+
+VERSION_CACHE_KEY = "response_cache:version:{label}"
+
+RESPONSE_CACHE_KEY = "response_cache:response:{digest}"
+
+
+def get_version_key(model) -> str:
+    """
+    Gets the version cache key of entered model
+    """
+    return VERSION_CACHE_KEY.format(label=model._meta.label_lower)
+
+
+def bump_version(model):
+    """
+    Changes the model version, discarding every cached response tagged with it
+
+    Inside a transaction the version changes again once it commits, so
+    responses cached by other requests from the old rows meanwhile aren't kept
+
+    Args:
+        model(Model): changed model
+    """
+    version_key = get_version_key(model)
+
+    cache.set(version_key, uuid4().hex, None)
+
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: cache.set(version_key, uuid4().hex, None))
+
+
+def get_cache_key(request, media_type: str = None) -> str:
+    """
+    Gets the response cache key from path, normalized query params and accepted media type
+
+    Args:
+        request(Request): current request, DRF or plain django one
+        media_type(str): media type of plain django requests
+
+    Returns:
+        cache key
+    """
+    query_params = getattr(request, "query_params", request.GET)
+    media_type = media_type or request.accepted_media_type
+
+    query = sorted((name, sorted(values)) for name, values in query_params.lists())
+
+    digest = sha1(f"{request.path}|{query}|{media_type}".encode()).hexdigest()
+
+    return RESPONSE_CACHE_KEY.format(digest=digest)
+
+
+def get_cached_data(key: str, models: tuple):
+    """
+    Gets the model versions and the cached response in one cache read
+
+    Args:
+        key(str): response cache key
+        models(tuple<Model>): models the response depends on
+
+    Returns:
+        versions list and cached response or None
+    """
+    version_keys = [get_version_key(model) for model in models]
+
+    data = cache.get_many([*version_keys, key])
+
+    for version_key in version_keys:
+        if version_key not in data:
+            cache.add(version_key, uuid4().hex, None)
+            data[version_key] = cache.get(version_key)
+
+    return [data[version_key] for version_key in version_keys], data.get(key, None)
+
+
+async def aget_cached_data(key: str, models: tuple):
+    """
+    Gets the model versions and the cached response with the async cache api
+    """
+    version_keys = [get_version_key(model) for model in models]
+
+    data = await cache.aget_many([*version_keys, key])
+
+    for version_key in version_keys:
+        if version_key not in data:
+            await cache.aadd(version_key, uuid4().hex, None)
+            data[version_key] = await cache.aget(version_key)
+
+    return [data[version_key] for version_key in version_keys], data.get(key, None)
+
+
+def get_etag(content: bytes) -> str:
+    """
+    Gets a strong etag of the rendered content
+    """
+    return '"%s"' % sha1(content).hexdigest()
+
+
+def is_not_modified(request, etag: str) -> bool:
+    """
+    Checks if the client has the current representation
+    """
+    etags = parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+
+    return etag in etags or "*" in etags
+
+
+def set_cache_headers(response, etag: str, modified: float):
+    """
+    Adds validators to entered response
+    """
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(modified)
+    patch_vary_headers(response, ["Accept"])
+
+    return response
+
+
+def get_stored_response(response, versions: list) -> dict:
+    """
+    Gets the cache entry of a rendered response
+    """
+    return {
+        "versions": versions,
+        "content": response.content,
+        "etag": get_etag(response.content),
+        "status": response.status_code,
+        "content_type": response["Content-Type"],
+        "modified": time.time(),
+    }
+
+
+def get_cached_response(request, versions: list, cached: dict):
+    """
+    Gets the not modified or cached response if there is one
+
+    Args:
+        request(Request): current request
+        versions(list<str>): current model versions
+        cached(dict): stored response or None
+
+    Returns:
+        response or None if the view must render it
+    """
+    if not cached or cached["versions"] != versions:
+        return None
+
+    return get_validated_response(request, cached)
+
+
+def get_validated_response(request, cached: dict):
+    """
+    Gets the not modified response if the client has the stored content,
+    or the stored response otherwise
+    """
+    if is_not_modified(request, cached["etag"]):
+        return set_cache_headers(HttpResponseNotModified(), cached["etag"], cached["modified"])
+
+    response = HttpResponse(cached["content"], status=cached["status"], content_type=cached["content_type"])
+
+    return set_cache_headers(response, cached["etag"], cached["modified"])
+
+
+def cache_response(*models):
+    """
+    Caches the rendered response of a viewset action until any of the entered models changes
+
+    Versions of the models are bumped by their signals, a stored response is
+    only served while it was rendered with the current versions. The versions
+    are only seen by every worker with a shared cache, so the response cache
+    is disabled by default with the per process one. Etags are the hash of
+    the rendered content
+
+    Args:
+        models(Model): models the response depends on
+
+    Returns:
+        decorated action
+    """
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(view, request, *args, **kwargs):
+            if not RESPONSE_CACHE_CONFIG.get("ENABLED", True) or request.method not in ("GET", "HEAD"):
+                return view_method(view, request, *args, **kwargs)
+
+            key = get_cache_key(request)
+            versions, cached = get_cached_data(key, models)
+
+            response = get_cached_response(request, versions, cached)
+
+            if response is not None:
+                return response
+
+            response = view_method(view, request, *args, **kwargs)
+
+            if not isinstance(response, Response) or not 200 <= response.status_code < 300:
+                return response
+
+            response = view.finalize_response(request, response, *args, **kwargs)
+            response.render()
+
+            cached = get_stored_response(response, versions)
+            cache.set(key, cached, RESPONSE_CACHE_CONFIG.get("TIMEOUT", None))
+
+            if is_not_modified(request, cached["etag"]):
+                return get_validated_response(request, cached)
+
+            return set_cache_headers(response, cached["etag"], cached["modified"])
+
+        return wrapper
+
+    return decorator
+
+
+def cache_async_response(*models):
+    """
+    Caches the json response of an async view handler like 'cache_response' does
+
+    Entries are shared with the DRF views serving the same json
+
+    Args:
+        models(Model): models the response depends on
+
+    Returns:
+        decorated handler
+    """
+
+    def decorator(handler):
+        @wraps(handler)
+        async def wrapper(view, request, *args, **kwargs):
+            if not RESPONSE_CACHE_CONFIG.get("ENABLED", True) or request.method not in ("GET", "HEAD"):
+                return await handler(view, request, *args, **kwargs)
+
+            key = get_cache_key(request, FastJSONRenderer.media_type)
+            versions, cached = await aget_cached_data(key, models)
+
+            response = get_cached_response(request, versions, cached)
+
+            if response is not None:
+                return response
+
+            response = await handler(view, request, *args, **kwargs)
+
+            if not 200 <= response.status_code < 300:
+                return response
+
+            cached = get_stored_response(response, versions)
+            await cache.aset(key, cached, RESPONSE_CACHE_CONFIG.get("TIMEOUT", None))
+
+            if is_not_modified(request, cached["etag"]):
+                return get_validated_response(request, cached)
+
+            return set_cache_headers(response, cached["etag"], cached["modified"])
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,56 @@
+import json
+from functools import cached_property
+
+from rest_framework.response import Response
+
+from apps.api_root.renderers import FastJSONRenderer
+
+
+class RenderedResponse(Response):
+    """
+    Response with already rendered json content, it skips the renderer
+
+    Data is only decoded when it is read, like in tests
+    """
+
+    def __init__(self, content: bytes, status=None, headers=None):
+        super().__init__(status=status, headers=headers)
+
+        del self.data  # decoded from content on access
+
+        self.rendered_json = content
+
+    @cached_property
+    def data(self):
+        return json.loads(self.rendered_json)
+
+    @property
+    def rendered_content(self):
+        self["Content-Type"] = FastJSONRenderer.media_type
+
+        return self.rendered_json
+
+
+def render_fragments(envelope: dict, key: str, fragments: list) -> bytes:
+    """
+    Renders a json object embedding a list of rendered fragments
+
+    Args:
+        envelope(dict): object members, the member 'key' is replaced by the fragments
+        key(str): member with the fragments list
+        fragments(list<bytes>): rendered items
+
+    Returns:
+        rendered json
+    """
+    renderer = FastJSONRenderer()
+
+    def render_value(name, value):
+        if name == key:
+            return b"[" + b",".join(fragments) + b"]"
+
+        return b"null" if value is None else renderer.render(value)  # renderer returns no content for None
+
+    members = [renderer.render(name) + b":" + render_value(name, value) for name, value in envelope.items()]
+
+    return b"{" + b",".join(members) + b"}"
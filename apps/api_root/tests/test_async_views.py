@@ -0,0 +1,210 @@
+import importlib
+import json
+from io import StringIO
+from datetime import date
+from unittest.mock import patch
+
+from asgiref.sync import sync_to_async
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import AsyncRequestFactory, TestCase
+
+from rest_framework.test import APIRequestFactory
+
+from apps.api_root.async_views import get_route_view
+from apps.categories.async_views import AsyncCategoriesListView
+from apps.categories.routers import router as categories_router
+from apps.products import urls as products_urls
+from apps.products.routers import router as products_router
+from apps.products.views.async_views import (
+    AsyncProductsListView,
+    AsyncProductDetailView,
+    AsyncRelatedProductsView,
+)
+from apps.promos.async_views import AsyncPromosListView
+from apps.promos.routers import router as promos_router
+from core.settings.base import ASYNC_CONFIG, RESPONSE_CACHE_CONFIG
+from db.models import Category, Product, Promo
+
+
+class AsyncReadViewsTests(TestCase):
+    """
+    Tests async catalogue read paths against the viewsets
+    """
+
+    def setUp(self):
+        cache.clear()
+
+        self.factory = AsyncRequestFactory()
+
+        self.category = Category.objects.create(title="TestCategory")
+        Category.objects.create(title="TestSubcategory", parent=self.category)
+
+        self.products = [
+            Product.objects.create(
+                title=f"Test title {index}",
+                description="Test description",
+                price=1111 + index,
+                images=["testimgurl.com/1"],
+                stock=11,
+                category=self.category,
+                sold=index,
+            )
+            for index in range(4)
+        ]
+
+        Promo.objects.create(
+            title="Test promo",
+            subtitle="Test subtitle",
+            expiration=date(2030, 1, 1),
+            images=["testimgurl.com/1"],
+            href="https://testpromo.com",
+        )
+
+        self.products_list = get_route_view(products_router, "product-list")
+        self.product_detail = get_route_view(products_router, "product-detail")
+        self.related_products = get_route_view(products_router, "product-get-related-products")
+
+    async def assert_same_response(self, async_view, sync_view, path, params=None, **kwargs):
+        """
+        Asserts that the async view responds like the viewset
+        """
+        with patch.dict(RESPONSE_CACHE_CONFIG, {"ENABLED": False}):  # both views render their response
+            response = await async_view(self.factory.get(path, params or {}), **kwargs)
+
+            sync_response = await sync_to_async(sync_view)(APIRequestFactory().get(path, params or {}), **kwargs)
+            sync_response.render()
+
+        self.assertEqual(response.status_code, sync_response.status_code)
+
+        if response.content or sync_response.content:
+            self.assertEqual(json.loads(response.content), json.loads(sync_response.content))
+
+        return response
+
+    async def test_products_list_successful(self):
+        """
+        Tests if async products list equals the viewset one, with and without fragments
+        """
+        view = AsyncProductsListView.as_view(fallback=self.products_list)
+
+        await self.assert_same_response(view, self.products_list, "/api/products/")
+        await self.assert_same_response(view, self.products_list, "/api/products/", {"limit": 2, "price_order": "DESC"})
+
+        with patch.dict(RESPONSE_CACHE_CONFIG, {"FRAGMENTS_ENABLED": False}):
+            await self.assert_same_response(view, self.products_list, "/api/products/", {"min_price": 1112})
+
+    async def test_products_list_not_found_successful(self):
+        """
+        Tests if async products list has no content without results
+        """
+        view = AsyncProductsListView.as_view(fallback=self.products_list)
+
+        response = await self.assert_same_response(view, self.products_list, "/api/products/", {"min_price": 9999})
+
+        self.assertEqual(response.status_code, 204)
+
+    async def test_product_detail_successful(self):
+        """
+        Tests if async product detail equals the viewset one
+        """
+        view = AsyncProductDetailView.as_view(fallback=self.product_detail)
+
+        await self.assert_same_response(view, self.product_detail, "/api/products/", pk=str(self.products[0].id))
+
+    async def test_related_products_successful(self):
+        """
+        Tests if async related products equal the viewset ones
+        """
+        view = AsyncRelatedProductsView.as_view(fallback=self.related_products)
+        pk = str(self.products[0].id)
+
+        await self.assert_same_response(view, self.related_products, "/api/products/", pk=pk)
+        await self.assert_same_response(view, self.related_products, "/api/products/", {"limit": 1}, pk=pk)
+
+    async def test_categories_and_promos_list_successful(self):
+        """
+        Tests if async categories and promos lists equal the viewset ones
+        """
+        categories_list = get_route_view(categories_router, "category-list")
+        promos_list = get_route_view(promos_router, "promo-list")
+
+        await self.assert_same_response(
+            AsyncCategoriesListView.as_view(fallback=categories_list), categories_list, "/api/categories/"
+        )
+        await self.assert_same_response(
+            AsyncPromosListView.as_view(fallback=promos_list), promos_list, "/api/promos/"
+        )
+
+    async def test_async_list_shares_response_cache_successful(self):
+        """
+        Tests if async and viewset json responses share the response cache
+        """
+        view = AsyncProductsListView.as_view(fallback=self.products_list)
+
+        with patch.dict(RESPONSE_CACHE_CONFIG, {"ENABLED": True}):
+            sync_response = await sync_to_async(self.products_list)(APIRequestFactory().get("/api/products/"))
+            sync_response.render()
+
+            response = await view(self.factory.get("/api/products/", **{"if-none-match": sync_response["ETag"]}))
+
+        self.assertEqual(response.status_code, 304)
+
+    async def test_delegated_requests_successful(self):
+        """
+        Tests if invalid filters, other formats and writes are served by the viewset
+        """
+        view = AsyncProductsListView.as_view(fallback=self.products_list)
+
+        invalid = await view(self.factory.get("/api/products/", {"min_price": "price"}))
+        invalid.render()
+
+        self.assertEqual(invalid.status_code, 400)
+
+        browsable = await view(self.factory.get("/api/products/", accept="text/html"))
+
+        self.assertEqual(browsable.accepted_renderer.format, "api")
+
+        write = await view(self.factory.post("/api/products/", {}))
+
+        self.assertEqual(write.status_code, 401)
+
+        missing = await AsyncProductDetailView.as_view(fallback=self.product_detail)(
+            self.factory.get("/api/products/"), pk="0"
+        )
+
+        self.assertEqual(missing.status_code, 404)
+
+    def test_async_routes_enabled_successful(self):
+        """
+        Tests if async routes are only added when enabled
+        """
+        self.addCleanup(importlib.reload, products_urls)
+
+        with patch.dict(ASYNC_CONFIG, {"ENABLED": True}):
+            importlib.reload(products_urls)
+
+        self.assertEqual(products_urls.urlpatterns[0].callback.view_class, AsyncProductsListView)
+
+        importlib.reload(products_urls)
+
+        self.assertFalse(hasattr(products_urls.urlpatterns[0].callback, "view_class"))
+
+
+class BenchmarkAsyncViewsCommandTests(TestCase):
+    """
+    Tests benchmark async views command
+    """
+
+    def test_benchmark_async_views_command_successful(self):
+        """
+        Tests if command times every read and rolls back seeded rows
+        """
+        out = StringIO()
+        call_command("benchmark_async_views", rows=10, concurrency=2, stdout=out)
+
+        output = out.getvalue()
+
+        self.assertEqual(output.count("req/s, ASGI"), 5)
+        self.assertFalse(Product.objects.exists())
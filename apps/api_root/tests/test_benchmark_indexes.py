@@ -0,0 +1,37 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from db.models import Product
+
+
+class BenchmarkIndexesCommandTests(TestCase):
+    """
+    Tests benchmark indexes command
+    """
+
+    def test_benchmark_indexes_command_successful(self):
+        """
+        Tests if command explains every lookup with and without index scans and rolls back seeded rows
+        """
+        out = StringIO()
+        call_command("benchmark_indexes", rows=100, database="default", stdout=out)
+
+        output = out.getvalue()
+
+        self.assertIn("Selected shipping info", output)
+        self.assertIn("Category products by sold", output)
+        self.assertEqual(output.count("Without indexes"), 6)
+        self.assertIn("Seq Scan", output)
+
+        self.assertFalse(Product.objects.exists())
+
+    def test_benchmark_indexes_command_without_database_reject(self):
+        """
+        Tests if command refuses to seed the database without DEBUG or an explicit database
+        """
+        with self.assertRaises(CommandError):
+            call_command("benchmark_indexes", rows=100, stdout=StringIO())
+
+        self.assertFalse(Product.objects.exists())
@@ -0,0 +1,148 @@
+import csv
+import json
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.settings.base import EXPORT_CONFIG
+from db.models import Category, Comment, Order, Product, ShippingInfo
+
+ORDER_LIST_URL = reverse("api:order-list")  # order list url
+
+COMMENT_LIST_URL = reverse("api:comment-list")  # comment list url
+
+SHIPPING_INFO_LIST_URL = reverse("api:shipping_info-list")  # shipping info list url
+
+USER_LIST_URL = reverse("users:user_account-list")  # user account list url
+
+
+def get_lines(res) -> list:
+    """
+    Gets the lines of a streamed response
+    """
+    return b"".join(res.streaming_content).decode().splitlines()
+
+
+class StreamingExportTests(TestCase):
+    """
+    Tests ndjson and csv exports of admin lists
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.superuser = get_user_model().objects.create_superuser(email="testmain@test.com", password="12345test")
+        self.client.force_authenticate(self.superuser)
+
+        self.user = get_user_model().objects.create_user(email="testemail@test.com")
+
+        category = Category.objects.create(title="TestCategory")
+        self.product = Product.objects.create(
+            title="Test title",
+            description="Test description",
+            price=1111,
+            images=["testimgurl.com/1"],
+            stock=100,
+            category=category,
+            sold=11,
+        )
+
+        shipping_info = ShippingInfo.objects.create(
+            user=self.user, address="Test address", receiver="test receiver name", receiver_dni=12345678
+        )
+
+        self.orders = []
+
+        for buyer in (self.user, self.superuser, self.user):
+            order = Order.objects.create(buyer=buyer, shipping_info=shipping_info)
+            order.create_order_products([{"product": self.product.id, "count": 2}])
+            self.orders.append(order)
+
+        Comment.objects.create(user=self.user, product=self.product, subject="Test, subject", content="Test", rate=4)
+
+    def test_order_ndjson_export_successful(self):
+        """
+        Tests if orders are streamed one by line
+        """
+        res = self.client.get(ORDER_LIST_URL, {"format": "ndjson"})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.streaming)
+        self.assertEqual(res["Content-Type"], "application/x-ndjson; charset=utf-8")
+        self.assertIn('filename="order.ndjson"', res["Content-Disposition"])
+
+        rows = [json.loads(line) for line in get_lines(res)]
+
+        self.assertEqual({row["id"] for row in rows}, {str(order.id) for order in self.orders})
+        self.assertEqual(rows[0]["products"], [{"product": self.product.id, "count": 2}])
+
+    def test_order_export_filterset_successful(self):
+        """
+        Tests if exports are filtered by the list filterset
+        """
+        res = self.client.get(ORDER_LIST_URL, {"format": "ndjson", "user": self.user.id})
+
+        rows = [json.loads(line) for line in get_lines(res)]
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual({row["buyer"]["id"] for row in rows}, {self.user.id})
+
+    def test_comment_csv_export_successful(self):
+        """
+        Tests if comments are streamed as csv with a header
+        """
+        res = self.client.get(COMMENT_LIST_URL, {"format": "csv"})
+
+        self.assertEqual(res["Content-Type"], "text/csv; charset=utf-8")
+
+        rows = list(csv.DictReader(StringIO("\n".join(get_lines(res)))))
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["subject"], "Test, subject")
+        self.assertEqual(rows[0]["product"], str(self.product.id))
+
+    def test_user_and_shipping_info_exports_successful(self):
+        """
+        Tests if users and shipping info are exported
+        """
+        users = get_lines(self.client.get(USER_LIST_URL, {"format": "csv"}))
+        shipping_info = get_lines(self.client.get(SHIPPING_INFO_LIST_URL, {"format": "ndjson"}))
+
+        self.assertEqual(len(users), 3)  # header and two users
+        self.assertEqual(len(shipping_info), 1)
+
+    def test_export_reads_by_chunks_successful(self):
+        """
+        Tests if exported rows are read with a server side cursor by chunks
+        """
+        with patch.dict(EXPORT_CONFIG, {"CHUNK_SIZE": 2, "RENDER_CHUNK_SIZE": 1}):
+            res = self.client.get(ORDER_LIST_URL, {"format": "ndjson"})
+
+            chunks = list(res.streaming_content)
+
+        self.assertEqual(len(chunks), 3)
+
+    def test_export_not_admin_fails(self):
+        """
+        Tests if users that aren't admins can't export public lists
+        """
+        self.client.force_authenticate(self.user)
+
+        res = self.client.get(COMMENT_LIST_URL, {"format": "ndjson"})
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(res.streaming)
+
+    def test_export_format_only_on_lists_fails(self):
+        """
+        Tests if export formats aren't negotiated on other actions
+        """
+        res = self.client.get(reverse("api:order-detail", kwargs={"pk": self.orders[0].id}), {"format": "csv"})
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
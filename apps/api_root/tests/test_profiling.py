@@ -0,0 +1,244 @@
+import threading
+import warnings
+from io import StringIO
+from unittest.mock import patch
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+
+from django.contrib.auth import get_user_model
+from django.core.cache import CacheKeyWarning
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory, TestCase
+from django.urls import resolve, reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.api_root import profiling
+from apps.api_root.middleware import ProfilingMiddleware
+from core.settings.base import PROFILING_CONFIG
+from db.models import Category, Product
+
+PROFILING_URL = reverse("api:profiling")  # profiling API url
+
+PRODUCTS_URL = reverse("api:product-list")  # products API url
+
+TOKEN_URL = reverse("users:user_token_obtain")  # user token API url
+
+
+class ProfilingTests(TestCase):
+    """
+    Tests profiling middleware and summary
+    """
+
+    def setUp(self):
+        profiling.reset()
+
+        patcher = patch.dict(PROFILING_CONFIG, {"ENABLED": True, "WINDOW": 3})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(profiling.reset)
+
+        self.client = APIClient()  # loads the middleware with profiling enabled
+
+        category = Category.objects.create(title="TestCategory")
+
+        mock_product = {
+            "title": "Test title",
+            "description": "Test description",
+            "price": 1111,
+            "images": [
+                "testimgurl.com/1",
+                "testimgurl.com/2",  # Mock product data
+                "testimgurl.com/3",
+            ],
+            "stock": 11,
+            "category": category,
+            "sold": 11,
+        }
+        Product.objects.create(**mock_product)
+
+        admin_user_data = {"email": "testadmin@test.com", "password": "Test123"}
+        get_user_model().objects.create_superuser(**admin_user_data)
+
+        res_token = self.client.post(TOKEN_URL, admin_user_data)  # get user token
+        self.admin_token = res_token.data["token"]
+
+        normal_user_data = {"email": "testuser@test.com", "password": "Test123"}
+        get_user_model().objects.create_user(**normal_user_data)
+
+        res_token = self.client.post(TOKEN_URL, normal_user_data)  # get user token
+        self.user_token = res_token.data["token"]
+
+        profiling.reset()
+
+    def get_route_summary(self, route):
+        """
+        Gets the summary of entered route
+        """
+        return next(summary for summary in profiling.get_summary() if summary["route"] == route)
+
+    def test_get_fingerprint_successful(self):
+        """
+        Tests if fingerprint removes literal values
+        """
+        fingerprint = profiling.get_fingerprint(
+            "SELECT * FROM product  WHERE id IN (1, 2, 3) AND title = 'it''s' LIMIT 21"
+        )
+
+        self.assertEqual(fingerprint, "SELECT * FROM product WHERE id IN (...) AND title = ? LIMIT ?")
+
+    def test_request_profile_duplicates_successful(self):
+        """
+        Tests if request profile detects repeated fingerprints
+        """
+        profile = profiling.RequestProfile()
+
+        def execute(*args):
+            return None
+
+        profile(execute, "SELECT * FROM category WHERE id = 1", None, False, {})
+        profile(execute, "SELECT * FROM category WHERE id = 2", None, False, {})
+        profile(execute, "SELECT * FROM product", None, False, {})
+
+        sample = profile.get_sample(0.1, 10)
+
+        self.assertEqual(sample["queries"], 3)
+        self.assertEqual(sample["duplicates"], {"SELECT * FROM category WHERE id = ?": 2})
+
+    def test_middleware_records_route_sample_successful(self):
+        """
+        Tests if middleware records queries, serializer time and response size by route
+        """
+        res = self.client.get(PRODUCTS_URL)
+
+        summary = self.get_route_summary("GET api:product-list")
+
+        self.assertEqual(summary["requests"], 1)
+        self.assertTrue(summary["avg_queries"])
+        self.assertTrue(summary["avg_serializer_time_ms"] >= 0)
+        self.assertEqual(summary["avg_response_size"], len(res.content))
+
+    def test_middleware_keeps_rolling_window_successful(self):
+        """
+        Tests if middleware only keeps the last samples of every route
+        """
+        for _ in range(5):
+            self.client.get(PRODUCTS_URL)
+
+        summary = self.get_route_summary("GET api:product-list")
+
+        self.assertEqual(summary["requests"], PROFILING_CONFIG["WINDOW"])
+
+    def test_concurrent_samples_recorded_successful(self):
+        """
+        Tests if samples recorded by concurrent requests are all kept
+        """
+        sample = profiling.RequestProfile().get_sample(0.1, 10)
+
+        def work():
+            for _ in range(10):
+                profiling.record_sample("GET test", sample)
+
+        workers = [threading.Thread(target=work) for _ in range(8)]
+
+        with patch.dict(PROFILING_CONFIG, {"WINDOW": 100}):
+            for worker in workers:
+                worker.start()
+
+            for worker in workers:
+                worker.join()
+
+            self.assertEqual(self.get_route_summary("GET test")["requests"], 80)
+
+        self.assertEqual(profiling.get_routes(), ["GET test"])
+
+    def test_route_cache_keys_valid_successful(self):
+        """
+        Tests if route samples are stored with keys valid in every cache backend
+        """
+        sample = profiling.RequestProfile().get_sample(0.1, 10)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", CacheKeyWarning)
+
+            profiling.record_sample("GET api:product-list", sample)
+
+        self.assertEqual(self.get_route_summary("GET api:product-list")["requests"], 1)
+
+    def test_expired_counter_restarted_successful(self):
+        """
+        Tests if samples are recorded when the route counter expires after being added
+        """
+        sample = profiling.RequestProfile().get_sample(0.1, 10)
+
+        with patch.object(profiling.cache, "incr", side_effect=ValueError("Key not found")):
+            profiling.record_sample("GET test", sample)
+
+        self.assertEqual(self.get_route_summary("GET test")["requests"], 1)
+
+    async def test_middleware_records_async_route_sample_successful(self):
+        """
+        Tests if middleware profiles async requests
+        """
+        async def get_response(request):
+            request.resolver_match = resolve(PRODUCTS_URL)
+            await Product.objects.acount()
+
+            return HttpResponse(b"content")
+
+        middleware = ProfilingMiddleware(get_response)
+
+        self.assertTrue(iscoroutinefunction(middleware))
+
+        response = await middleware(AsyncRequestFactory().get(PRODUCTS_URL))
+
+        summary = await sync_to_async(self.get_route_summary)("GET api:product-list")
+
+        self.assertEqual(response.content, b"content")
+        self.assertEqual(summary["requests"], 1)
+        self.assertEqual(summary["max_queries"], 1)
+        self.assertEqual(summary["avg_response_size"], len(b"content"))
+
+    def test_profiling_view_superuser_successful(self):
+        """
+        Tests if superuser can see the profiling summary
+        """
+        self.client.get(PRODUCTS_URL)
+
+        res = self.client.get(PROFILING_URL, HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn("GET api:product-list", [summary["route"] for summary in res.data["data"]])
+
+    def test_profiling_view_delete_superuser_successful(self):
+        """
+        Tests if superuser can delete the profiling samples
+        """
+        self.client.get(PRODUCTS_URL)
+
+        res = self.client.delete(PROFILING_URL, HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertNotIn("GET api:product-list", [summary["route"] for summary in profiling.get_summary()])
+
+    def test_profiling_view_normal_user_reject(self):
+        """
+        Tests if normal user can't see the profiling summary
+        """
+        res = self.client.get(PROFILING_URL, HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_profiling_report_command_successful(self):
+        """
+        Tests if command dumps the route summary
+        """
+        self.client.get(PRODUCTS_URL)
+
+        out = StringIO()
+        call_command("profiling_report", "--reset", stdout=out)
+
+        self.assertIn("GET api:product-list: 1 requests", out.getvalue())
+        self.assertEqual(profiling.get_summary(), [])
@@ -0,0 +1,121 @@
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from io import BytesIO, StringIO
+from uuid import uuid4
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.api_root.parsers import FastJSONParser
+from apps.api_root.renderers import FastJSONRenderer
+from db.models import Product
+
+
+class FastJSONRendererTests(TestCase):
+    """
+    Tests the project json renderer and parser
+    """
+
+    def setUp(self):
+        self.renderer = FastJSONRenderer()
+
+        self.data = {
+            "id": uuid4(),
+            "created_at": date(2022, 10, 1),
+            "updated_at": datetime(2022, 10, 1, 12, 30, 15, 123456),
+            "time": time(12, 30),
+            "price": Decimal("1111.50"),
+            "counts": {1: 2, 3: 4},
+            "title": "Test title   ñ",
+            "products": [{"id": 1, "images": ["testimgurl.com/1"]}, None],
+        }
+
+    def test_render_equals_drf_renderer_successful(self):
+        """
+        Tests if rendered json equals the DRF one
+        """
+        self.assertEqual(self.renderer.render(self.data), JSONRenderer().render(self.data))
+        self.assertEqual(self.renderer.render(None), b"")
+
+    def test_render_indented_successful(self):
+        """
+        Tests if indented json is rendered like DRF does
+        """
+        context = {"indent": 4}
+
+        self.assertEqual(
+            self.renderer.render(self.data, renderer_context=context),
+            JSONRenderer().render(self.data, renderer_context=context),
+        )
+
+    def test_render_stream_successful(self):
+        """
+        Tests if streamed json is valid and keeps the envelope members
+        """
+        items = ({"id": index, "price": Decimal(index)} for index in range(25))
+        envelope = {"results": 25, "data": None, "next_cursor": None}
+
+        chunks = list(self.renderer.render_stream(items, envelope, "data", chunk_size=10))
+
+        self.assertEqual(len(chunks), 7)  # head, open, 3 chunks, close and tail
+        self.assertEqual(
+            json.loads(b"".join(chunks)),
+            {"results": 25, "data": [{"id": index, "price": float(index)} for index in range(25)], "next_cursor": None},
+        )
+        self.assertEqual(json.loads(b"".join(self.renderer.render_stream(iter([])))), [])
+
+    def test_parse_successful(self):
+        """
+        Tests if parsed json equals the DRF parsed one
+        """
+        content = JSONRenderer().render(self.data)
+
+        self.assertEqual(FastJSONParser().parse(BytesIO(content)), json.loads(content))
+
+    def test_parse_invalid_json_fails(self):
+        """
+        Tests if invalid json raises a parse error
+        """
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(BytesIO(b'{"title": '))
+
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(BytesIO(b'{"rate": NaN}'))
+
+    def test_api_invalid_json_fails(self):
+        """
+        Tests if api rejects invalid json bodies
+        """
+        client = APIClient()
+
+        res = client.post(reverse("users:user_token_obtain"), b'{"email": ', content_type="application/json")
+
+        self.assertEqual(res.status_code, 400)
+        self.assertIn("JSON parse error", res.data["detail"])
+
+
+class BenchmarkRenderersCommandTests(TestCase):
+    """
+    Tests benchmark renderers command
+    """
+
+    def test_benchmark_renderers_command_successful(self):
+        """
+        Tests if command times every payload and rolls back seeded rows
+        """
+        out = StringIO()
+        call_command("benchmark_renderers", rows=10, rounds=2, stdout=out)
+
+        output = out.getvalue()
+
+        for name in ("Products", "Orders", "Comments"):
+            self.assertIn(name, output)
+
+        self.assertEqual(output.count("Render:"), 3)
+        self.assertFalse(Product.objects.exists())
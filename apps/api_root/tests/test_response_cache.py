@@ -0,0 +1,211 @@
+import datetime
+from hashlib import sha1
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.orders.utils.services.stock_reservation_service import StockReservationService
+from core.settings.base import RESPONSE_CACHE_CONFIG
+from db.models import Category, Product, Promo
+
+PRODUCTS_LIST_URL = reverse("api:product-list")  # products list api url
+
+CATEGORY_LIST_URL = reverse("api:category-list")  # category list api url
+
+PROMO_URL = reverse("api:promo-list")  # promo list api url
+
+
+class ResponseCacheTests(TestCase):
+    """
+    Tests catalogue response cache
+    """
+
+    def setUp(self):
+        cache.clear()
+
+        patcher = patch.dict(RESPONSE_CACHE_CONFIG, {"ENABLED": True})  # disabled without a shared cache
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.client = APIClient()
+
+        self.category = Category.objects.create(title="TestCategory")
+
+        self.mock_product = {
+            "title": "Test title",
+            "description": "Test description",
+            "price": 1111,
+            "images": [
+                "testimgurl.com/1",
+                "testimgurl.com/2",  # Mock product data
+                "testimgurl.com/3",
+            ],
+            "stock": 11,
+            "category": self.category,
+            "sold": 11,
+        }
+        self.product = Product.objects.create(**self.mock_product)
+
+    def test_cached_list_served_without_queries_successful(self):
+        """
+        Tests if a repeated list request is served from cache without queries
+        """
+        first_res = self.client.get(PRODUCTS_LIST_URL)
+
+        with self.assertNumQueries(0):
+            second_res = self.client.get(PRODUCTS_LIST_URL)
+
+        self.assertEqual(second_res.status_code, status.HTTP_200_OK)
+        self.assertEqual(second_res.content, first_res.content)
+        self.assertEqual(second_res["ETag"], first_res["ETag"])
+        self.assertTrue(second_res["Last-Modified"])
+
+    def test_if_none_match_not_modified_successful(self):
+        """
+        Tests if a request with the current etag returns not modified without queries
+        """
+        res = self.client.get(PRODUCTS_LIST_URL)
+
+        with self.assertNumQueries(0):
+            not_modified_res = self.client.get(PRODUCTS_LIST_URL, HTTP_IF_NONE_MATCH=res["ETag"])
+
+        self.assertEqual(not_modified_res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified_res["ETag"], res["ETag"])
+        self.assertFalse(not_modified_res.content)
+
+    def test_product_change_invalidates_response_successful(self):
+        """
+        Tests if saving a product discards cached responses and changes the etag
+        """
+        res = self.client.get(PRODUCTS_LIST_URL)
+
+        self.product.title = "Test changed title"
+        self.product.save()
+
+        changed_res = self.client.get(PRODUCTS_LIST_URL, HTTP_IF_NONE_MATCH=res["ETag"])
+
+        self.assertEqual(changed_res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed_res["ETag"], res["ETag"])
+        self.assertContains(changed_res, "Test changed title")
+
+    def test_category_change_invalidates_product_response_successful(self):
+        """
+        Tests if saving a category discards cached product responses
+        """
+        detail_url = reverse("api:product-detail", kwargs={"pk": self.product.id})
+        self.client.get(detail_url)
+
+        self.category.title = "ChangedCategory"
+        self.category.save()
+
+        res = self.client.get(detail_url)
+
+        self.assertEqual(res.data["category"], "ChangedCategory")
+
+    def test_comment_invalidates_product_response_successful(self):
+        """
+        Tests if a new comment discards cached product rates
+        """
+        self.client.get(PRODUCTS_LIST_URL)
+
+        user = get_user_model().objects.create_user(email="testuser@test.com")
+        self.product.create_comment(user=user, subject="Test", content="Test", rate=1)
+
+        res = self.client.get(PRODUCTS_LIST_URL)
+
+        self.assertEqual(res.data["data"][0]["rate"], 1)
+
+    def test_stock_discount_invalidates_product_response_successful(self):
+        """
+        Tests if discounting stock without signals discards cached products
+        """
+        self.client.get(PRODUCTS_LIST_URL)
+
+        StockReservationService().discount_stock({self.product.id: 10})
+
+        res = self.client.get(PRODUCTS_LIST_URL)
+
+        self.assertEqual(res.data["data"][0]["stock"], 1)
+
+    def test_response_cached_before_commit_discarded_successful(self):
+        """
+        Tests if responses cached while a change wasn't committed are discarded on commit
+        """
+        with self.captureOnCommitCallbacks() as callbacks:
+            StockReservationService().discount_stock({self.product.id: 10})
+
+            self.client.get(PRODUCTS_LIST_URL)  # like a concurrent request
+
+        self.assertEqual(len(callbacks), 1)
+
+        callbacks[0]()
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(PRODUCTS_LIST_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(queries.captured_queries)
+
+    def test_etag_from_rendered_content_successful(self):
+        """
+        Tests if the etag only changes with the rendered content
+        """
+        res = self.client.get(PRODUCTS_LIST_URL)
+
+        self.category.save()  # discards the stored response without changing it
+
+        not_modified_res = self.client.get(PRODUCTS_LIST_URL, HTTP_IF_NONE_MATCH=res["ETag"])
+
+        self.assertEqual(not_modified_res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified_res["ETag"], f'"{sha1(res.content).hexdigest()}"')
+
+    def test_query_params_normalized_successful(self):
+        """
+        Tests if query params order doesn't change the cached response
+        """
+        res = self.client.get(PRODUCTS_LIST_URL + "?limit=1&min_price=1")
+
+        with self.assertNumQueries(0):
+            same_res = self.client.get(PRODUCTS_LIST_URL + "?min_price=1&limit=1")
+
+        other_res = self.client.get(PRODUCTS_LIST_URL + "?limit=2&min_price=1")
+
+        self.assertEqual(same_res["ETag"], res["ETag"])
+        self.assertNotEqual(other_res["ETag"], res["ETag"])
+
+    def test_category_and_promo_lists_not_modified_successful(self):
+        """
+        Tests if category and promo lists answer not modified
+        """
+        Promo.objects.create(
+            title="Test Promo Title",
+            subtitle="Test Promo Subtitle",
+            expiration=datetime.date(1997, 10, 19),
+            images=["https://www.testurl.com/image/1"],
+            href="https://www.testurl.com/test-promo",
+        )
+
+        for url in (CATEGORY_LIST_URL, PROMO_URL):
+            res = self.client.get(url)
+
+            not_modified_res = self.client.get(url, HTTP_IF_NONE_MATCH=res["ETag"])
+
+            self.assertEqual(not_modified_res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_disabled_response_cache_successful(self):
+        """
+        Tests if views are computed on every request when the cache is disabled
+        """
+        with patch.dict(RESPONSE_CACHE_CONFIG, {"ENABLED": False}):
+            self.client.get(PRODUCTS_LIST_URL)
+            res = self.client.get(PRODUCTS_LIST_URL)
+
+        self.assertFalse(res.has_header("ETag"))
@@ -0,0 +1,48 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def get_query_count(client, url: str, **kwargs):
+    """
+    Gets the quantity of queries made by a GET request
+
+    Args:
+        client(APIClient): client that makes the request
+        url(str): requested url
+
+    Returns:
+        query count and response
+    """
+    with CaptureQueriesContext(connection) as context:
+        res = client.get(url, **kwargs)
+
+    return len(context.captured_queries), res
+
+
+def assert_constant_query_count(test_case, url: str, create_items, sizes: tuple = (1, 10), **kwargs):
+    """
+    Asserts that the endpoint query count does not grow with page size
+
+    Args:
+        test_case(TestCase): running test case with 'client'
+        url(str): requested url
+        create_items(callable): receives a quantity and creates that many items
+        sizes(tuple<int>): quantities created before each request
+
+    Returns:
+        last response
+    """
+    query_counts = []
+    res = None
+
+    for size in sizes:
+        create_items(size)
+
+        query_count, res = get_query_count(test_case.client, url, **kwargs)
+        query_counts.append(query_count)
+
+    test_case.assertEqual(
+        len(set(query_counts)), 1, f"Query count grows with page size: {query_counts}"
+    )
+
+    return res
@@ -1,3 +1,5 @@
+from django.urls import path
+
 from apps.products.urls import urlpatterns as products_urls
 from apps.comments.urls import urlpatterns as comment_urls
 from apps.orders.urls import urlpatterns as order_urls
@@ -9,6 +11,12 @@ from apps.favourites.urls import urlpatterns as fav_urls
 from apps.promos.urls import urlpatterns as promo_urls
 from apps.customer_messages.urls import urlpatterns as messages_urls
 
+from apps.api_root.views import ProfilingApiView
+
 app_name = "api"
 
 urlpatterns = products_urls + comment_urls + order_urls + category_urls + cart_urls + pay_urls + ship_urls + fav_urls + promo_urls + messages_urls
+
+urlpatterns += [
+    path("profiling/", ProfilingApiView.as_view(), name="profiling"),
+]
@@ -1,8 +1,18 @@
 import json
 
+from django.utils.translation import gettext_lazy as _
+
 from rest_framework.viewsets import ModelViewSet
 
-from django_filters.rest_framework import FilterSet
+from django_filters.rest_framework import FilterSet, CharFilter
+
+from .pagination import (
+    PAGINATION_FILTERS,
+    get_total_count,
+    get_ordering,
+    filter_after_cursor,
+    get_next_cursor,
+)
 
 
 class FilterMixins:
@@ -44,36 +54,114 @@ class FilterResultsFilterset(FilterSet):
     Custom filter methods to get results for filterset
     """
 
+    _results = 0
+    _ordering = None
+    _limit = None
+
+    cursor = CharFilter(method="query_cursor", label=_("Cursor"))
+
     def get_total_results(self):
         """
         Gets the quantity of total results in request
         """
         return self._results
 
+    def query_cursor(self, queryset, name, value):
+        """
+        Gets the items placed after the entered cursor
+        """
+        return filter_after_cursor(queryset, self._ordering, value)
+
     def filter_queryset(self, queryset):
         """
         Returns the filtered queryset with total results
+
+        Pagination filters run after the rest so the results are
+        counted with a single COUNT(*) before slicing
         """
-        for name, value in self.form.cleaned_data.items():
-            if name == "offset":
-                self._results = len(queryset)
+        cleaned_data = self.form.cleaned_data
+
+        for name, value in cleaned_data.items():
+            if name not in PAGINATION_FILTERS:
+                queryset = self.filters[name].filter(queryset, value)
 
-            queryset = self.filters[name].filter(queryset, value)
+        if "offset" in self.filters:
+            self._results = get_total_count(queryset)
+
+        if any(cleaned_data.get(name, None) for name in PAGINATION_FILTERS):
+            self._ordering = get_ordering(queryset)
+
+            if self._ordering:
+                queryset = queryset.order_by(*self._ordering)
+
+            if cleaned_data.get("limit", None):
+                self._limit = int(cleaned_data["limit"])
+
+        for name in PAGINATION_FILTERS:
+            if name in self.filters:
+                queryset = self.filters[name].filter(queryset, cleaned_data.get(name, None))
 
         data = {
             "queryset": queryset,
             "results": self.get_total_results(),
+            "ordering": self._ordering,
+            "limit": self._limit,
         }
 
         return data
 
 
+def plan_queryset(queryset, serializer_class):
+    """
+    Loads the relations and columns declared in serializer Meta
+
+    Args:
+        queryset(QuerySet): queryset to plan
+        serializer_class(Serializer): serializer whose Meta declares
+            'select_related_fields', 'prefetch_related_fields' and 'only_fields'
+
+    Returns:
+        planned queryset
+    """
+    meta = getattr(serializer_class, "Meta", None)
+
+    select_related_fields = getattr(meta, "select_related_fields", None)
+    prefetch_related_fields = getattr(meta, "prefetch_related_fields", None)
+    only_fields = getattr(meta, "only_fields", None)
+
+    if select_related_fields:
+        queryset = queryset.select_related(*select_related_fields)
+
+    if prefetch_related_fields:
+        queryset = queryset.prefetch_related(*prefetch_related_fields)
+
+    if only_fields:
+        queryset = queryset.only(*only_fields)
+
+    return queryset
+
+
 class FilterMethodsViewset(ModelViewSet):
     """
     Custom filter methods for Viewsets that have Filterset with 'FilterResults'
     """
 
     results = 0
+    ordering = None
+    limit = None
+
+    planned_actions = ("list", "retrieve")
+
+    def get_queryset(self):
+        """
+        Gets the queryset planned by the serializer on read actions
+        """
+        queryset = super().get_queryset()
+
+        if self.action in self.planned_actions:
+            queryset = plan_queryset(queryset, self.get_serializer_class())
+
+        return queryset
 
     def filter_queryset(self, queryset):
         """
@@ -85,12 +173,20 @@ class FilterMethodsViewset(ModelViewSet):
             queryset = backend_data["queryset"]
 
             self.results = backend_data["results"]
+            self.ordering = backend_data.get("ordering", None)
+            self.limit = backend_data.get("limit", None)
         return queryset
 
     def get_query_results(self):
         """Gets query results"""
         return self.results
 
+    def get_next_cursor(self, page):
+        """
+        Gets the cursor of the page after the entered one
+        """
+        return get_next_cursor(page, self.ordering, self.limit)
+
 
 def parse_json(json_data: str) -> dict:
     """
@@ -0,0 +1,30 @@
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework import status
+
+from apps.api_root import profiling
+
+
+class ProfilingApiView(APIView):
+    """
+    Profiling summary Apiview
+    """
+
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        """
+        Gets the rolling summary of every profiled route
+        """
+        summary = profiling.get_summary()
+
+        return Response({"results": len(summary), "data": summary}, status=status.HTTP_200_OK)
+
+    def delete(self, request, *args, **kwargs):
+        """
+        Deletes the profiled samples
+        """
+        profiling.reset()
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -35,7 +35,9 @@ class CartSerializer(serializers.ModelSerializer):
 
             return item_serializer.data
 
-        item_serializer = CartItemSerializer(instance.get_products(), many=True)
+        summary = instance.get_summary()
+
+        item_serializer = CartItemSerializer(summary["items"], many=True)
 
         data = {
             "id": instance.id,
@@ -43,8 +45,8 @@ class CartSerializer(serializers.ModelSerializer):
                 "id": instance.user.id,
                 "email": instance.user.email,
             },
-            "total_items": instance.total_items,
-            "total_price": instance.get_total_price(),
+            "total_items": summary["total_items"],
+            "total_price": summary["total_price"],
             "last_modification": instance.last_modification,
             "items": item_serializer.data,
         }
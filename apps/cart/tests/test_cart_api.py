@@ -5,6 +5,7 @@ from django.test import TestCase
 from rest_framework.test import APIClient
 from rest_framework import status
 
+from apps.api_root.tests.utils import assert_constant_query_count
 from apps.cart.meta import get_app_model, get_secondary_model
 
 from db.models import Category, Product
@@ -153,6 +154,30 @@ class PrivateUserCartApiTests(TestCase):
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
 
+    def test_cart_view_constant_queries_normal_user_successful(self):
+        """
+        Tests if cart api view queries don't grow with cart items
+        """
+
+        def create_items(quantity):
+            start = get_secondary_model().objects.filter(cart=self.cart).count()
+
+            for index in range(start, start + quantity):
+                product = Product.objects.create(**{**self.mock_product, "title": f"Product {index}"})
+                get_secondary_model().objects.create(product=product, cart=self.cart, count=1)
+
+        res = assert_constant_query_count(
+            self, MY_CART_URL, create_items, HTTP_AUTHORIZATION=f"Bearer {self.user_token}"
+        )
+
+        items = get_secondary_model().objects.filter(cart=self.cart)
+        total_price = sum(item.product.price * item.count for item in items)
+
+        self.assertEqual(len(res.data["data"]["items"]), 12)
+        self.assertEqual(res.data["data"]["total_price"], total_price)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
     def test_auto_create_cart_view_normal_user_successful(self):
         """
         Tests if normal user without current cart can see cart api
@@ -0,0 +1,92 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from apps.cart.utils.services.cart_stock_service import CartStockService
+
+from db.models import Cart, CartItem, Category, Product
+
+
+class CartStockServiceTests(TestCase):
+    """
+    Cart stock service tests
+    """
+
+    def setUp(self):
+        self.service = CartStockService()
+
+        user = get_user_model().objects.create(email="testuser@test.com")
+        self.cart = Cart.objects.create(user=user)
+
+        category = Category.objects.create(title="TestCategory")
+
+        self.mock_product = {
+            "title": "Test title",
+            "description": "Test description",
+            "price": 1111,
+            "images": [
+                "testimgurl/1.com",
+                "testimgurl/2.com",
+                "testimgurl/3.com",
+            ],
+            "stock": 11,
+            "category": category,
+            "sold": 11,
+        }
+
+    def create_items(self, quantity: int, count: int = 5):
+        """
+        Creates cart items with a product each
+        """
+        items = []
+
+        for index in range(quantity):
+            product = Product.objects.create(**{**self.mock_product, "title": f"Test title {index}"})
+            items.append(CartItem.objects.create(cart=self.cart, product=product, count=count))
+
+        return items
+
+    def test_service_reconcile_clamps_items_to_stock_successful(self):
+        """
+        Tests if service clamps every item count to its product stock in one query
+        """
+        items = self.create_items(30)
+
+        Product.objects.filter(pk__in=[item.product_id for item in items[:10]]).update(stock=2)
+
+        with self.assertNumQueries(1):
+            adjusted_items = self.service.reconcile(self.cart.id)
+
+        self.assertEqual(
+            sorted(adjusted_items, key=lambda item: item["id"]),
+            [{"id": item.id, "product": item.product_id, "count": 2} for item in items[:10]],
+        )
+
+        counts = dict(CartItem.objects.filter(cart=self.cart).values_list("id", "count"))
+
+        self.assertTrue(all(counts[item.id] == 2 for item in items[:10]))
+        self.assertTrue(all(counts[item.id] == 5 for item in items[10:]))
+
+    def test_service_reconcile_without_changes_successful(self):
+        """
+        Tests if service returns an empty list when every item has enough stock
+        """
+        self.create_items(3)
+
+        self.assertEqual(self.service.reconcile(self.cart.id), [])
+
+    def test_service_reconcile_only_updates_entered_cart_successful(self):
+        """
+        Tests if service doesn't update items of other carts
+        """
+        item = self.create_items(1)[0]
+
+        other_user = get_user_model().objects.create(email="otheruser@test.com")
+        other_cart = Cart.objects.create(user=other_user)
+
+        Product.objects.filter(pk=item.product_id).update(stock=1)
+
+        self.assertEqual(self.service.reconcile(other_cart.id), [])
+
+        item.refresh_from_db()
+
+        self.assertEqual(item.count, 5)
@@ -0,0 +1,41 @@
+from django.apps import apps
+from django.db import connection
+
+
+class CartStockService:
+    """
+    Cart stock reconciliation service
+    """
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not CartStockService.__instance:
+            CartStockService.__instance = object.__new__(cls)
+        return CartStockService.__instance
+
+    def reconcile(self, cart_id: int):
+        """
+        Clamps the count of every cart item to its product stock in one statement
+
+        Args:
+            cart_id(int): id of the reconciled cart
+
+        Returns:
+            adjusted items list with item id, product id and new count
+        """
+        cart_item_table = connection.ops.quote_name(apps.get_model("db", "CartItem")._meta.db_table)
+        product_table = connection.ops.quote_name(apps.get_model("db", "Product")._meta.db_table)
+
+        query = (
+            f"UPDATE {cart_item_table} AS item "
+            "SET count = product.stock "
+            f"FROM {product_table} AS product "
+            "WHERE item.product_id = product.id AND item.cart_id = %s AND item.count > product.stock "
+            "RETURNING item.id, item.product_id, item.count"
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(query, [cart_id])
+            rows = cursor.fetchall()
+
+        return [{"id": item_id, "product": product_id, "count": count} for item_id, product_id, count in rows]
@@ -1,5 +1,3 @@
-from django.contrib.auth import get_user_model
-
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -20,13 +18,10 @@ class CartApiView(APIView):
         """
         Gets current cart instance and creates one if user don't have cart
         """
-        user = get_user_model().objects.filter(id=request.user.id).first()
-
-        cart = self.model.objects.filter(user=user).first()
+        cart = self.queryset.select_related("user").filter(user_id=request.user.id).first()
 
         if not cart:
-            cart = self.model.objects.create(user=user)
-            cart.save()
+            cart = self.model.objects.create(user=request.user)
 
         return cart
 
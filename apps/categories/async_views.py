@@ -0,0 +1,40 @@
+from asgiref.sync import sync_to_async
+
+from apps.api_root.async_views import AsyncReadView
+from apps.api_root.pagination import get_next_cursor
+from apps.api_root.response_cache import cache_async_response
+from .serializers import CategorySerializer
+from .filters import CategoryFilterset
+
+
+class AsyncCategoriesListView(AsyncReadView):
+    """
+    Categories list async read path
+    """
+
+    serializer_class = CategorySerializer
+    filterset_class = CategoryFilterset
+
+    @cache_async_response(CategorySerializer.Meta.model)
+    async def get(self, request, *args, **kwargs):
+        """
+        Gets only parent categories
+        """
+        queryset = self.serializer_class.Meta.model.objects.filter(parent=None)
+
+        filter_data = await self.filter_queryset(request, queryset)
+
+        categories = [category async for category in filter_data["queryset"]]
+
+        if not categories:
+            return self.render({"message": "Not found categories."}, status=204)
+
+        serializer = self.serializer_class(categories, context={"action": "list"}, many=True)
+
+        export_data = {
+            "results": filter_data["results"],
+            "data": await sync_to_async(lambda: serializer.data)(),  # a changed tree is rebuilt from the database
+            "next_cursor": get_next_cursor(categories, filter_data["ordering"], filter_data["limit"]),
+        }
+
+        return self.render(export_data)
@@ -1,39 +1,48 @@
 from rest_framework import serializers
 
 from .meta import get_app_model
+from .utils.services.category_tree_service import CategoryTreeService
 
 
 class CategorySerializer(serializers.ModelSerializer):
     """
     Category model serializer
     """
+    tree_service = CategoryTreeService()
 
     class Meta:
         model = get_app_model()
         fields = ["id", "parent", "title"]
 
+    def get_tree(self):
+        """
+        Gets the category tree once per serialization, shared by every item
+        """
+        if "category_tree" not in self.context:
+            self.context["category_tree"] = self.tree_service.get_tree()
+
+        return self.context["category_tree"]
+
     def to_representation(self, instance):
         """
         Returns parent categories with its subcategories
         """
         action = self.context.get("action", None)
 
-        if action == "list" or not instance.parent:
+        if action == "list" or not instance.parent_id:
             category_data = {
                 "id": instance.id,
                 "title": instance.title,
                 "subcategories": [],
             }
-            sub_categories = self.Meta.model.objects.exclude(parent=None)
 
-            for sub_category in sub_categories:
-                if sub_category.parent == instance:
-                    sub_category_data = {
-                        "id": sub_category.id,
-                        "title": sub_category.title,
-                    }
+            for sub_category in self.tree_service.get_subcategories(instance.id, self.get_tree()):
+                sub_category_data = {
+                    "id": sub_category.id,
+                    "title": sub_category.title,
+                }
 
-                    category_data["subcategories"].append(sub_category_data)
+                category_data["subcategories"].append(sub_category_data)
 
             return category_data
 
@@ -41,6 +50,6 @@ class CategorySerializer(serializers.ModelSerializer):
             category_data = {
                 "id": instance.id,
                 "title": instance.title,
-                "parent": instance.parent.title,
+                "parent": self.tree_service.get_category(instance.parent_id, self.get_tree()).title,
             }
             return category_data
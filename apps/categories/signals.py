@@ -0,0 +1,29 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .meta import get_app_model
+from .utils.services.category_tree_service import CategoryTreeService
+from apps.api_root.response_cache import bump_version
+
+
+@receiver([post_save, post_delete], sender=get_app_model())
+def invalidate_category_tree(sender, **kwargs):
+    """
+    Discards the cached category tree when a category changes
+
+    The tree is discarded again once the change commits, so a tree rebuilt
+    by other requests from the old rows meanwhile isn't kept
+    """
+    tree_service = CategoryTreeService()
+
+    tree_service.invalidate()
+    transaction.on_commit(tree_service.invalidate)
+
+
+@receiver([post_save, post_delete], sender=get_app_model())
+def bump_category_version(sender, **kwargs):
+    """
+    Discards the cached responses with categories
+    """
+    bump_version(sender)
@@ -0,0 +1,172 @@
+import time
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from apps.categories.meta import get_app_model
+from apps.categories.utils.services.category_tree_service import CategoryTreeService
+from core.settings.base import CATEGORY_TREE_CONFIG
+
+CATEGORY_LIST_URL = reverse("api:category-list")  # category list api url
+
+
+class CategoryTreeServiceTests(TestCase):
+    """
+    Tests category tree service
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.model = get_app_model()
+
+        self.service = CategoryTreeService()
+
+        self.parent_category = self.model.objects.create(title="ParentCategory")
+
+        self.child_category = self.model.objects.create(
+            title="ChildCategory", parent=self.parent_category
+        )
+
+    def test_service_get_subcategories_successful(self):
+        """
+        Tests if service gets the subcategories of a category
+        """
+        subcategories = self.service.get_subcategories(self.parent_category.id)
+
+        self.assertEqual(subcategories, [self.child_category])
+        self.assertEqual(self.service.get_subcategories(self.child_category.id), [])
+
+    def test_service_get_category_successful(self):
+        """
+        Tests if service gets a category by id
+        """
+        self.assertEqual(self.service.get_category(self.child_category.id), self.child_category)
+        self.assertIsNone(self.service.get_category(self.child_category.id + 100))
+
+    def test_service_get_tree_cached_successful(self):
+        """
+        Tests if service doesn't query the database with a cached tree
+        """
+        self.service.get_tree()
+
+        with self.assertNumQueries(0):
+            self.service.get_subcategories(self.parent_category.id)
+
+    @patch.dict(CATEGORY_TREE_CONFIG, {"TIMEOUT": 0.1})
+    def test_service_tree_expires_without_shared_cache_successful(self):
+        """
+        Tests if service rebuilds the tree when the version expires, like
+        processes that don't see the invalidations of other processes
+        """
+        self.service.invalidate()
+        self.service.get_tree()
+
+        self.model.objects.filter(pk=self.child_category.pk).update(title="ChangedCategory")  # no signals
+
+        time.sleep(0.2)
+
+        self.assertEqual(self.service.get_category(self.child_category.id).title, "ChangedCategory")
+
+    def test_service_invalidated_on_save_successful(self):
+        """
+        Tests if service tree is refreshed when a category is saved
+        """
+        self.service.get_tree()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            new_child_category = self.model.objects.create(
+                title="NewChildCategory", parent=self.parent_category
+            )
+
+        subcategories = self.service.get_subcategories(self.parent_category.id)
+
+        self.assertEqual(subcategories, [self.child_category, new_child_category])
+
+    def test_service_invalidated_on_delete_successful(self):
+        """
+        Tests if service tree is refreshed when a category is deleted
+        """
+        self.service.get_tree()
+
+        child_category_id = self.child_category.id
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.child_category.delete()
+
+        self.assertEqual(self.service.get_subcategories(self.parent_category.id), [])
+        self.assertIsNone(self.service.get_category(child_category_id))
+
+    def test_service_invalidated_again_on_commit(self):
+        """
+        Tests if a tree read while the category change wasn't committed is discarded on commit
+        """
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.model.objects.create(title="NewChildCategory", parent=self.parent_category)
+
+            self.service.get_tree()  # like a concurrent request rebuilding the tree
+            version = self.service.get_version()
+
+        for callback in callbacks:
+            callback()
+
+        self.assertNotEqual(self.service.get_version(), version)
+
+    def test_category_list_reads_tree_version_once(self):
+        """
+        Tests if category list reads the tree version once for every parent
+        """
+        for index in range(5):
+            self.model.objects.create(title=f"ParentCategory {index}")
+
+        self.service.get_tree()
+
+        with patch.object(CategoryTreeService, "get_version", wraps=self.service.get_version) as get_version:
+            res = self.client.get(CATEGORY_LIST_URL)
+
+        self.assertEqual(res.data["results"], 6)
+        self.assertEqual(get_version.call_count, 1)
+
+    def test_category_list_query_count_successful(self):
+        """
+        Tests if category list doesn't query subcategories per parent
+        """
+        for index in range(5):
+            parent_category = self.model.objects.create(title=f"ParentCategory {index}")
+            self.model.objects.create(title=f"ChildCategory {index}", parent=parent_category)
+
+        self.service.get_tree()
+
+        with self.assertNumQueries(2):  # results count and parent categories
+            res = self.client.get(CATEGORY_LIST_URL)
+
+        self.assertEqual(res.data["results"], 6)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_category_detail_from_tree_successful(self):
+        """
+        Tests if category detail is served from the tree
+        """
+        self.service.get_tree()
+
+        category_url = reverse("api:category-detail", kwargs={"pk": self.child_category.id})
+
+        with self.assertNumQueries(0):
+            res = self.client.get(category_url)
+
+        self.assertEqual(res.data["parent"], self.parent_category.title)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_category_detail_not_found_reject(self):
+        """
+        Tests if category detail of a non existent category is rejected
+        """
+        category_url = reverse("api:category-detail", kwargs={"pk": self.child_category.id + 100})
+
+        res = self.client.get(category_url)
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
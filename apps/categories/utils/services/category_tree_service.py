@@ -0,0 +1,138 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+
+from apps.categories.meta import get_app_model
+from core.settings.base import CATEGORY_TREE_CONFIG
+
+
+class CategoryTreeService:
+    """
+    Category tree service
+
+    Loads every category in one query and keeps an adjacency index cached
+    in process and in the cache backend until a category changes
+
+    Invalidations only reach every process through a shared cache, with a
+    per process cache the version expires after 'TIMEOUT' seconds instead
+    """
+    __instance = None
+
+    cache_key = "categories:tree"
+    version_key = "categories:tree:version"
+
+    __tree = None
+    __version = None
+
+    def __new__(cls, *args, **kwargs):
+        if not CategoryTreeService.__instance:
+            CategoryTreeService.__instance = object.__new__(cls)
+        return CategoryTreeService.__instance
+
+    def get_version(self):
+        """
+        Gets the current tree version shared by every process
+
+        Returns:
+            tree version
+        """
+        version = cache.get(self.version_key)
+
+        if not version:
+            cache.add(self.version_key, uuid4().hex, CATEGORY_TREE_CONFIG["TIMEOUT"])
+            version = cache.get(self.version_key)
+
+        return version
+
+    def build_tree(self):
+        """
+        Builds the adjacency index from the whole category table
+
+        Returns:
+            dict with categories by id, children ids by parent id and ids by upper title
+        """
+        categories = {}
+        children = {}
+        titles = {}
+
+        for category in get_app_model().objects.order_by("pk"):
+            categories[category.id] = category
+            children.setdefault(category.parent_id, []).append(category.id)
+            titles.setdefault(category.title.upper(), []).append(category.id)
+
+        return {"categories": categories, "children": children, "titles": titles}
+
+    def get_tree(self):
+        """
+        Gets the cached tree or builds it if the version changed
+
+        Returns:
+            category tree
+        """
+        version = self.get_version()
+
+        if self.__tree is not None and self.__version == version:
+            return self.__tree
+
+        cached = cache.get(self.cache_key)
+
+        if cached and cached["version"] == version:
+            tree = cached["tree"]
+        else:
+            tree = self.build_tree()
+            cache.set(self.cache_key, {"version": version, "tree": tree}, CATEGORY_TREE_CONFIG["TIMEOUT"])
+
+        self.__tree = tree
+        self.__version = version
+
+        return tree
+
+    def invalidate(self):
+        """
+        Discards the tree in every process
+        """
+        cache.set(self.version_key, uuid4().hex, CATEGORY_TREE_CONFIG["TIMEOUT"])
+        cache.delete(self.cache_key)
+
+        self.__tree = None
+        self.__version = None
+
+    def get_category(self, category_id: int, tree: dict = None):
+        """
+        Gets a category from the tree
+
+        Args:
+            category_id(int): category id
+            tree(dict): tree already read in the current operation
+
+        Returns:
+            category or None if it doesn't exist
+        """
+        return (tree or self.get_tree())["categories"].get(category_id, None)
+
+    def get_subcategories(self, category_id: int, tree: dict = None):
+        """
+        Gets direct subcategories of entered category
+
+        Args:
+            category_id(int): parent category id
+            tree(dict): tree already read in the current operation
+
+        Returns:
+            subcategories list
+        """
+        tree = tree or self.get_tree()
+
+        return [tree["categories"][child_id] for child_id in tree["children"].get(category_id, [])]
+
+    def get_category_ids(self, title: str):
+        """
+        Gets the ids of the categories with entered title, case insensitive
+
+        Args:
+            title(str): category title
+
+        Returns:
+            category ids list
+        """
+        return self.get_tree()["titles"].get(title.upper(), [])
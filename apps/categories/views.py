@@ -1,11 +1,15 @@
+from django.http import Http404
+
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
 from rest_framework import status
 
 from apps.api_root.utils import FilterMethodsViewset
+from apps.api_root.response_cache import cache_response
 from .serializers import CategorySerializer
 from .filters import CategoryFilterset
+from .utils.services.category_tree_service import CategoryTreeService
 
 
 class CategoryViewset(FilterMethodsViewset):
@@ -18,6 +22,8 @@ class CategoryViewset(FilterMethodsViewset):
     serializer_class = CategorySerializer
     filterset_class = CategoryFilterset
 
+    tree_service = CategoryTreeService()
+
     def get_permissions(self):
         """
         Gets custom permission for the view
@@ -28,6 +34,7 @@ class CategoryViewset(FilterMethodsViewset):
             permission_classes = [IsAuthenticated, IsAdminUser]
         return [permission() for permission in permission_classes]
 
+    @cache_response(CategorySerializer.Meta.model)
     def list(self, request, *args, **kwargs):
         """
         Gets only parent categories
@@ -42,6 +49,7 @@ class CategoryViewset(FilterMethodsViewset):
             export_data = {
                 "results": self.get_query_results(),
                 "data": serializer.data,
+                "next_cursor": self.get_next_cursor(categories),
             }
 
             return Response(export_data, status=status.HTTP_200_OK)
@@ -49,3 +57,19 @@ class CategoryViewset(FilterMethodsViewset):
         return Response(
             {"message": "Not found categories."}, status=status.HTTP_204_NO_CONTENT
         )
+
+    def retrieve(self, request, pk=None, *args, **kwargs):
+        """
+        Gets category detail from category tree
+        """
+        try:
+            category = self.tree_service.get_category(int(pk))
+        except ValueError:
+            category = None
+
+        if not category:
+            raise Http404
+
+        serializer = self.serializer_class(category)
+
+        return Response(serializer.data, status=status.HTTP_200_OK)
@@ -1,13 +1,14 @@
 from rest_framework import serializers
 
 from .meta import get_app_model
-from db.models import Order
+from apps.orders.utils.services.purchase_service import PurchaseService
 
 
 class CommentSerializer(serializers.ModelSerializer):
     """
     Comment serializer
     """
+    purchase_service = PurchaseService()
 
     class Meta:
         model = get_app_model()
@@ -54,20 +55,8 @@ class CommentSerializer(serializers.ModelSerializer):
         if action and action == "create":
             product = attrs["product"]
             current_user = attrs["user"]
-            user_orders = Order.objects.filter(buyer=current_user)
-
-            bought_product = False
-
-            for order in user_orders:
-                try:
-                    order_products = order.get_order_products()
-                    for order_product in order_products:
-                        if order_product.product.id == product.id:
-                            bought_product = True
-                except:
-                    bought_product = False
-                    
-            if bought_product:
+
+            if self.purchase_service.has_bought(current_user.id, product.id):
                 return attrs
             raise serializers.ValidationError("User must have bought the product")
 
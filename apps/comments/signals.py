@@ -0,0 +1,50 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .meta import get_app_model
+from apps.api_root.response_cache import bump_version
+
+
+@receiver(pre_save, sender=get_app_model())
+def store_previous_rate(sender, instance, **kwargs):
+    """
+    Stores the saved rate and product of an updated comment
+    """
+    instance._previous_rate = None
+
+    if not instance._state.adding:
+        instance._previous_rate = sender.objects.filter(pk=instance.pk).values("rate", "product_id").first()
+
+
+@receiver(post_save, sender=get_app_model())
+def update_product_rate_on_save(sender, instance, created, **kwargs):
+    """
+    Adds the comment rate to product rate aggregates
+    """
+    previous_rate = getattr(instance, "_previous_rate", None)
+
+    if created or not previous_rate:
+        sender.objects.update_rate_of(instance.product_id, instance.rate, 1)
+
+    elif previous_rate["product_id"] != instance.product_id:
+        sender.objects.update_rate_of(previous_rate["product_id"], -previous_rate["rate"], -1)
+        sender.objects.update_rate_of(instance.product_id, instance.rate, 1)
+
+    elif previous_rate["rate"] != instance.rate:
+        sender.objects.update_rate_of(instance.product_id, instance.rate - previous_rate["rate"], 0)
+
+
+@receiver(post_delete, sender=get_app_model())
+def update_product_rate_on_delete(sender, instance, **kwargs):
+    """
+    Subtracts the comment rate from product rate aggregates
+    """
+    sender.objects.update_rate_of(instance.product_id, -instance.rate, -1)
+
+
+@receiver([post_save, post_delete], sender=get_app_model())
+def bump_comment_version(sender, **kwargs):
+    """
+    Discards the cached responses with product rates
+    """
+    bump_version(sender)
@@ -3,12 +3,13 @@ from rest_framework.response import Response
 from rest_framework import status
 
 from apps.api_root.permissions import IsOwnDataOrSuperuser
+from apps.api_root.exports import StreamingExportMixin
 from apps.api_root.utils import FilterMethodsViewset
 from .serializers import CommentSerializer
 from .filters import CommentFilterset
 
 
-class CommentViewset(FilterMethodsViewset):
+class CommentViewset(StreamingExportMixin, FilterMethodsViewset):
     """
     Comment API Viewset
     """
@@ -36,12 +37,16 @@ class CommentViewset(FilterMethodsViewset):
         """
         comments = self.filter_queryset(self.get_queryset())
 
+        if self.is_export():
+            return self.export(comments)
+
         if comments:
             serializer = self.serializer_class(comments, many=True)
 
             export_data = {
                 "results": self.get_query_results(),
                 "data": serializer.data,
+                "next_cursor": self.get_next_cursor(comments),
             }
 
             return Response(export_data, status=status.HTTP_200_OK)
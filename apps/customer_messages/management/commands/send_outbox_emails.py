@@ -0,0 +1,63 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.customer_messages.utils.services.outbox_service import OutboxService
+from core.settings.base import OUTBOX_CONFIG
+
+
+class Command(BaseCommand):
+    """
+    Sends the emails queued in the outbox
+    """
+
+    help = "Drains the email outbox in batches over a reused connection, retrying failed emails with backoff"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Drains the ready emails and exits")
+        parser.add_argument("--batch-size", type=int, default=OUTBOX_CONFIG["BATCH_SIZE"],
+                            help="Emails sent by connection")
+        parser.add_argument("--interval", type=float, default=OUTBOX_CONFIG["POLL_INTERVAL"],
+                            help="Seconds to wait when the outbox is empty")
+
+    def drain(self, batch_size: int) -> dict:
+        """
+        Sends batches until there aren't more ready emails
+
+        Returns:
+            dict with sent, retried and failed counts
+        """
+        totals = {"sent": 0, "retried": 0, "failed": 0}
+
+        while True:
+            results = OutboxService.send_pending(batch_size=batch_size)
+
+            for key, value in results.items():
+                totals[key] += value
+
+            if results["sent"] + results["retried"] + results["failed"] < batch_size:
+                return totals
+
+    def write_results(self, results: dict):
+        """
+        Writes the drain results
+        """
+        self.stdout.write(
+            f"Sent {results['sent']} emails, {results['retried']} to retry, {results['failed']} failed."
+        )
+
+    def handle(self, *args, **options):
+        if options["once"]:
+            self.write_results(self.drain(options["batch_size"]))
+            return
+
+        try:
+            while True:
+                results = self.drain(options["batch_size"])
+
+                if any(results.values()):
+                    self.write_results(results)
+                else:
+                    time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            self.stdout.write("Outbox worker stopped.")
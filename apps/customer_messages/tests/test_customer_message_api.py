@@ -53,7 +53,7 @@ class MessageAPIViewsetTests(TestCase):
 
         res = self.client.post(email_sender_url, payload)
 
-        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
 
         self.assertEqual(res.data["message"], "Message sent successful.")
 
@@ -72,7 +72,7 @@ class MessageAPIViewsetTests(TestCase):
 
         res = self.client.post(email_sender_url, payload)
 
-        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
 
         self.assertEqual(res.data["message"], "Message sent successful.")
 
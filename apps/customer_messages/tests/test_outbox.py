@@ -0,0 +1,246 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.customer_messages.utils.services.outbox_service import OutboxService
+from apps.users.meta import get_app_model
+from core.settings.base import OUTBOX_CONFIG
+from db.models import OutboundEmail
+
+RESET_PASSWORD_URL = reverse("users:reset_password")  # get user reset password API url
+
+
+class CountingEmailBackend(EmailBackend):
+    """
+    Locmem backend that counts opened connections
+    """
+    opened = 0
+
+    def open(self):
+        CountingEmailBackend.opened += 1
+        return True
+
+
+class FailingEmailBackend(EmailBackend):
+    """
+    Locmem backend that fails every send
+    """
+
+    def send_messages(self, messages):
+        raise ConnectionError("SMTP server unavailable")
+
+
+def create_outbound_email(number: int = 0, **kwargs):
+    """
+    Creates a pending outbound email
+    """
+    return OutboundEmail.objects.enqueue(
+        kwargs.get("subject", f"Subject {number}"),
+        "Message",
+        "from@test.com",
+        kwargs.get("recipient_list", [f"to{number}@test.com"]),
+    )
+
+
+class OutboxAPITests(TestCase):
+    """
+    Tests endpoints queue their emails in the outbox
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_message_api_queues_email_successful(self):
+        """
+        Tests if message api stores the email in the outbox without sending it
+        """
+        payload = {
+            "subject": "Test Subject",
+            "message": "Test Message",
+            "full_name_from": "Test Name",
+            "email_from": "testemail@test.com"
+        }
+
+        res = self.client.post(reverse("api:message", kwargs={"sender": "email"}), payload)
+
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(len(mail.outbox), 0)
+
+        email = OutboundEmail.objects.get()
+
+        self.assertEqual(email.status, OutboundEmail.PENDING)
+        self.assertEqual(email.subject, "Test Subject from testemail@test.com")
+
+    def test_message_api_queues_max_length_subject_successful(self):
+        """
+        Tests if message api queues max length subjects with the sender appended
+        """
+        email_from = f"{'a' * 64}@{'b' * 63}.{'c' * 63}.{'d' * 57}.com"
+
+        payload = {
+            "subject": "s" * 255,
+            "message": "Test Message",
+            "full_name_from": "Test Name",
+            "email_from": email_from,
+        }
+
+        res = self.client.post(reverse("api:message", kwargs={"sender": "email"}), payload)
+
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(OutboundEmail.objects.get().subject, f"{'s' * 255} from {email_from}")
+
+    def test_reset_password_api_queues_email_successful(self):
+        """
+        Tests if reset password api stores the reset url email in the outbox
+        """
+        get_app_model().objects.create_user(email="test@test.com", password="Test123")
+
+        res = self.client.post(RESET_PASSWORD_URL, {"email": "test@test.com"})
+
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(len(mail.outbox), 0)
+
+        email = OutboundEmail.objects.get()
+
+        self.assertEqual(email.recipient_list, ["test@test.com"])
+        self.assertIn("password reset link", email.message)
+
+
+class OutboxServiceTests(TestCase):
+    """
+    Tests outbox worker sends
+    """
+
+    def test_send_pending_reuses_connection_successful(self):
+        """
+        Tests if a batch is sent over a single connection
+        """
+        for number in range(3):
+            create_outbound_email(number)
+
+        CountingEmailBackend.opened = 0
+
+        results = OutboxService.send_pending(connection=CountingEmailBackend())
+
+        self.assertEqual(results, {"sent": 3, "retried": 0, "failed": 0})
+        self.assertEqual(CountingEmailBackend.opened, 1)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(OutboundEmail.objects.filter(status=OutboundEmail.SENT).count(), 3)
+
+    def test_send_pending_batch_size_successful(self):
+        """
+        Tests if only 'batch_size' emails are sent, oldest first
+        """
+        for number in range(3):
+            create_outbound_email(number)
+
+        results = OutboxService.send_pending(batch_size=2)
+
+        self.assertEqual(results["sent"], 2)
+        self.assertEqual([email.subject for email in mail.outbox], ["Subject 0", "Subject 1"])
+        self.assertEqual(OutboundEmail.objects.filter(status=OutboundEmail.PENDING).count(), 1)
+
+    def test_send_pending_skips_sent_and_delayed_emails(self):
+        """
+        Tests if sent emails and emails waiting a retry aren't sent
+        """
+        sent = create_outbound_email(0)
+        OutboxService.send_pending()
+
+        delayed = create_outbound_email(1)
+        delayed.available_at = timezone.now() + timedelta(minutes=5)
+        delayed.save()
+
+        results = OutboxService.send_pending()
+
+        self.assertEqual(results, {"sent": 0, "retried": 0, "failed": 0})
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, sent.subject)
+
+    def test_send_pending_failure_retries_with_backoff(self):
+        """
+        Tests if failed emails are delayed with a growing backoff
+        """
+        email = create_outbound_email()
+
+        results = OutboxService.send_pending(connection=FailingEmailBackend())
+
+        self.assertEqual(results, {"sent": 0, "retried": 1, "failed": 0})
+
+        email.refresh_from_db()
+        first_delay = email.available_at - timezone.now()
+
+        self.assertEqual(email.status, OutboundEmail.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertIn("SMTP server unavailable", email.last_error)
+        self.assertGreater(first_delay, timedelta(seconds=OUTBOX_CONFIG["BACKOFF"] - 5))
+
+        email.available_at = timezone.now()
+        email.save()
+
+        OutboxService.send_pending(connection=FailingEmailBackend())
+
+        email.refresh_from_db()
+
+        self.assertEqual(email.attempts, 2)
+        self.assertGreater(email.available_at - timezone.now(), first_delay)
+
+    def test_send_pending_max_attempts_fails(self):
+        """
+        Tests if emails stop being retried after the max attempts
+        """
+        email = create_outbound_email()
+        email.attempts = OUTBOX_CONFIG["MAX_ATTEMPTS"] - 1
+        email.save()
+
+        results = OutboxService.send_pending(connection=FailingEmailBackend())
+
+        self.assertEqual(results, {"sent": 0, "retried": 0, "failed": 1})
+
+        email.refresh_from_db()
+
+        self.assertEqual(email.status, OutboundEmail.FAILED)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_send_pending_partial_failure(self):
+        """
+        Tests if a failed email doesn't stop the rest of the batch
+        """
+        create_outbound_email(0)
+        create_outbound_email(1)
+
+        send_messages = EmailBackend.send_messages
+
+        def fail_first(backend, messages):
+            if messages[0].subject == "Subject 0":
+                raise ConnectionError("Recipient refused")
+            return send_messages(backend, messages)
+
+        with patch.object(EmailBackend, "send_messages", fail_first):
+            results = OutboxService.send_pending()
+
+        self.assertEqual(results, {"sent": 1, "retried": 1, "failed": 0})
+        self.assertEqual([email.subject for email in mail.outbox], ["Subject 1"])
+
+    def test_send_outbox_emails_command_successful(self):
+        """
+        Tests if the worker command drains every ready email
+        """
+        for number in range(5):
+            create_outbound_email(number)
+
+        out = StringIO()
+        call_command("send_outbox_emails", "--once", "--batch-size", "2", stdout=out)
+
+        self.assertIn("Sent 5 emails, 0 to retry, 0 failed.", out.getvalue())
+        self.assertEqual(len(mail.outbox), 5)
@@ -1,14 +1,14 @@
-from django.core.mail import send_mail
+from .outbox_service import OutboxService
 
 
 class EmailService:
     @staticmethod
     def send_email_to(*args, **kwargs):
         """
-        Sends email to recipient email
+        Queues email to recipient email, it's sent by the outbox worker
 
         Returns:
-            True if email was sent
+            True if email was queued
         """
         subject = kwargs.get("subject", None)
         message = kwargs.get("message", None)
@@ -19,6 +19,6 @@ class EmailService:
             raise ValueError(
                 "send_email method must contain subject, message, full_name_from, email_from and recipient_email.")
 
-        send_mail(subject, message, email_from, [recipient_email])
+        OutboxService.enqueue(subject, message, email_from, [recipient_email])
 
         return True
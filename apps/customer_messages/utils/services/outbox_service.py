@@ -0,0 +1,110 @@
+from datetime import timedelta
+
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from core.settings.base import OUTBOX_CONFIG
+from db.models import OutboundEmail
+
+
+class OutboxService:
+    @staticmethod
+    def enqueue(subject: str, message: str, email_from: str, recipient_list: list):
+        """
+        Queues an email in the outbox instead of sending it in the request
+
+        Returns:
+            Queued outbound email
+        """
+        return OutboundEmail.objects.enqueue(subject, message, email_from, list(recipient_list))
+
+    @staticmethod
+    def get_retry_delay(attempts: int) -> timedelta:
+        """
+        Gets the time to wait before retrying an email that failed 'attempts' times
+        """
+        seconds = OUTBOX_CONFIG["BACKOFF"] * 2 ** (attempts - 1)
+
+        return timedelta(seconds=min(seconds, OUTBOX_CONFIG["MAX_BACKOFF"]))
+
+    @classmethod
+    def set_failed_attempt(cls, email: OutboundEmail, error: Exception, now):
+        """
+        Records a failed attempt, the email is retried with backoff until it
+        reaches the max attempts
+        """
+        email.attempts += 1
+        email.last_error = f"{type(error).__name__}: {error}"
+
+        if email.attempts >= OUTBOX_CONFIG["MAX_ATTEMPTS"]:
+            email.status = OutboundEmail.FAILED
+        else:
+            email.available_at = now + cls.get_retry_delay(email.attempts)
+
+    @classmethod
+    def send_pending(cls, batch_size: int = None, connection=None) -> dict:
+        """
+        Sends a batch of pending emails over a single email backend connection
+
+        Rows are locked while they're sent and skipped by other workers, so
+        several workers can drain the outbox at once
+
+        Args:
+            batch_size(int): max emails sent
+            connection: email backend connection, the default one if it isn't entered
+
+        Returns:
+            dict with sent, retried and failed counts
+        """
+        batch_size = batch_size or OUTBOX_CONFIG["BATCH_SIZE"]
+        results = {"sent": 0, "retried": 0, "failed": 0}
+
+        now = timezone.now()
+
+        with transaction.atomic():
+            emails = list(OutboundEmail.objects.get_pending(now).select_for_update(skip_locked=True)[:batch_size])
+
+            if not emails:
+                return results
+
+            connection = connection or get_connection()
+
+            try:
+                connection.open()
+            except Exception as error:
+                for email in emails:
+                    cls.set_failed_attempt(email, error, now)
+            else:
+                try:
+                    for email in emails:
+                        message = EmailMessage(
+                            email.subject, email.message, email.email_from, email.recipient_list,
+                            connection=connection,
+                        )
+
+                        try:
+                            if not connection.send_messages([message]):
+                                raise RuntimeError("Email backend did not send the message.")
+                        except Exception as error:
+                            cls.set_failed_attempt(email, error, now)
+                        else:
+                            email.status = OutboundEmail.SENT
+                            email.attempts += 1
+                            email.sent_at = timezone.now()
+                finally:
+                    connection.close()
+
+            OutboundEmail.objects.bulk_update(
+                emails, ["status", "attempts", "last_error", "available_at", "sent_at"]
+            )
+
+        for email in emails:
+            if email.status == OutboundEmail.SENT:
+                results["sent"] += 1
+            elif email.status == OutboundEmail.FAILED:
+                results["failed"] += 1
+            else:
+                results["retried"] += 1
+
+        return results
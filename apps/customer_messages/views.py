@@ -21,7 +21,7 @@ class MessageAPIView(APIView):
 
     def post(self, request, sender, *args, **kwargs):
         """
-        Sends message in selected sender
+        Queues message in selected sender
         """
         sender_method = sender.lower()
 
@@ -33,6 +33,6 @@ class MessageAPIView(APIView):
         serializer = self.serializer_class(data=request.data)
         if serializer.is_valid():
             serializer.save(sender=MessageSender(selected_sender))
-            return Response({"message": "Message sent successful."}, status.HTTP_201_CREATED)
+            return Response({"message": "Message sent successful."}, status.HTTP_202_ACCEPTED)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -46,6 +46,7 @@ class FavouriteItemViewset(FilterMethodsViewset):
             res_data = {
                 "results": self.results,
                 "data": serializer.data,
+                "next_cursor": self.get_next_cursor(fav_list),
             }
 
             return Response(res_data, status=status.HTTP_200_OK)
@@ -84,7 +85,8 @@ class FavouriteItemViewset(FilterMethodsViewset):
 
                 response_data = {
                     "results": self.results,
-                    "data": serializer.data
+                    "data": serializer.data,
+                    "next_cursor": self.get_next_cursor(user_fav_list)
                 }
 
                 return Response(response_data, status=status.HTTP_200_OK)
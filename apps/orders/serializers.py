@@ -1,8 +1,12 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Prefetch
+
 from rest_framework import serializers
 
 from .meta import get_app_model, get_secondary_model
 
 from apps.api_root.utils import parse_json
+from db.models import ShippingInfo
 
 
 class OrderSerializer(serializers.ModelSerializer):
@@ -21,6 +25,21 @@ class OrderSerializer(serializers.ModelSerializer):
             "products"
         ]
 
+        # Queryset needed by representation, relations are prefetched so
+        # orders are read without joins
+        prefetch_related_fields = [
+            Prefetch("buyer", queryset=get_user_model().objects.only("id", "email")),
+            Prefetch(
+                "shipping_info",
+                queryset=ShippingInfo.objects.only("id", "address", "receiver", "receiver_dni"),
+            ),
+            Prefetch(
+                "orderproduct_set",
+                queryset=get_secondary_model().objects.select_related("product").order_by("pk"),
+            ),
+        ]
+        only_fields = ["id", "buyer", "shipping_info", "created_at"]
+
     def validate(self, attrs):
         user = self.context.get("user", None)
         action = self.context.get("action", None)
@@ -62,8 +81,7 @@ class OrderSerializer(serializers.ModelSerializer):
         buyer = validated_data.get("buyer", None)
         shipping_info = validated_data.get("shipping_info")
 
-        order = self.Meta.model.objects.create(buyer=buyer, shipping_info=shipping_info)
-        order.create_order_products(products)
+        order = self.Meta.model.objects.create(buyer=buyer, shipping_info=shipping_info, products=products)
 
         return order
 
@@ -111,7 +129,7 @@ class OrderSerializer(serializers.ModelSerializer):
             formatted instance
         """
 
-        order_products = instance.get_order_products()
+        order_products = instance.orderproduct_set.all()  # prefetched on planned actions
         order_products_serializer = OrderProductSerializer(order_products, many=True)
 
         format_data = {
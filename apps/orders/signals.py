@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .meta import get_app_model
+from .utils.services.purchase_service import PurchaseService
+
+
+@receiver(post_delete, sender=get_app_model())
+def invalidate_purchased_products(sender, instance, **kwargs):
+    """
+    Discards the cached purchased products of a deleted order buyer
+    """
+    PurchaseService().invalidate(instance.buyer_id)
@@ -2,6 +2,8 @@ from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -1142,3 +1144,62 @@ class PrivateSuperusersOrdersAPITests(TestCase):
 
         with self.assertRaises(ObjectDoesNotExist):
             get_secondary_model().objects.get(id=self.order_products[0].id)
+
+    def create_orders(self, buyer, quantity: int):
+        """
+        Creates orders with two order products for entered buyer
+        """
+        title = f"Test title {Product.objects.count()}"  # titles are unique
+        second_product = Product.objects.create(**{**self.mock_product, "title": title})
+
+        for _ in range(quantity):
+            order = self.model.objects.create(buyer=buyer, shipping_info=self.shipping_info)
+            order.create_order_products(
+                [{"product": self.product.id, "count": 1}, {"product": second_product.id, "count": 1}]
+            )
+
+    def count_queries(self, url) -> int:
+        """
+        Counts the queries of a superuser get request
+        """
+        with CaptureQueriesContext(connection) as context:
+            res = self.client.get(url, HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        return len(context.captured_queries)
+
+    def test_order_list_constant_queries_superuser_successful(self):
+        """
+        Tests if order list queries don't depend on listed orders
+        """
+        queries = self.count_queries(ORDER_LIST_URL)
+
+        self.create_orders(self.user, 5)
+
+        self.assertEqual(self.count_queries(ORDER_LIST_URL), queries)
+
+    def test_mine_order_list_constant_queries_superuser_successful(self):
+        """
+        Tests if mine order list queries don't depend on listed orders
+        """
+        self.create_orders(self.main_user, 1)
+
+        queries = self.count_queries(MINE_URL)
+
+        self.create_orders(self.main_user, 5)
+
+        self.assertEqual(self.count_queries(MINE_URL), queries)
+
+    def test_order_list_empty_order_superuser_successful(self):
+        """
+        Tests if orders without order products are listed
+        """
+        order = self.model.objects.create(**self.mock_order)
+
+        res = self.client.get(ORDER_LIST_URL, HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+
+        listed_order = next(item for item in res.data["data"] if item["id"] == order.id)
+
+        self.assertEqual(listed_order["products"], [])
+        self.assertEqual(listed_order["buyer"]["email"], self.user.email)
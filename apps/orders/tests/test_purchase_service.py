@@ -0,0 +1,96 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+
+from apps.orders.utils.services.purchase_service import PurchaseService
+
+from db.models import Product, Category, Order, ShippingInfo
+
+
+class PurchaseServiceTests(TestCase):
+    """
+    Purchase service tests
+    """
+
+    def setUp(self):
+        self.service = PurchaseService()
+
+        self.user = get_user_model().objects.create_user(email="testuser@test.com")
+        self.service.invalidate(self.user.id)
+
+        self.shipping_info = ShippingInfo.objects.create(
+            user=self.user, address="Test address", receiver="Test receiver", receiver_dni=12345678
+        )
+
+        category = Category.objects.create(title="TestCategory")
+
+        self.mock_product = {
+            "title": "Test title",
+            "description": "Test description",
+            "price": 1111,
+            "images": [
+                "testimgurl/1.com",
+                "testimgurl/2.com",
+                "testimgurl/3.com",
+            ],
+            "stock": 11,
+            "category": category,
+            "sold": 11,
+        }
+        self.product = Product.objects.create(**self.mock_product)
+
+    def test_service_has_bought_without_cache_successful(self):
+        """
+        Tests if service checks purchases with a single query without cache and caches them
+        """
+        Order.objects.create(buyer=self.user, shipping_info=self.shipping_info,
+                             products=[{"product": self.product.id, "count": 1}])
+        other_product = Product.objects.create(**{**self.mock_product, "title": "Test title 2"})
+
+        with self.assertNumQueries(1):
+            self.assertTrue(self.service.has_bought(self.user.id, self.product.id))
+
+        self.assertFalse(self.service.has_bought(self.user.id, other_product.id))
+
+        with self.assertNumQueries(0):
+            self.assertTrue(self.service.has_bought(self.user.id, self.product.id))
+
+    def test_service_has_bought_with_stale_cache_successful(self):
+        """
+        Tests if service finds purchases missing from the cached set, like
+        orders created by other processes
+        """
+        Order.objects.create(buyer=self.user, shipping_info=self.shipping_info,
+                             products=[{"product": self.product.id, "count": 1}])
+
+        cache.set(self.service.get_cache_key(self.user.id), set())  # cached by a process that missed the order
+
+        with self.assertNumQueries(1):
+            self.assertTrue(self.service.has_bought(self.user.id, self.product.id))
+
+    def test_service_has_bought_refreshed_on_order_creation_successful(self):
+        """
+        Tests if service caches purchased products when an order is created
+        """
+        self.service.refresh(self.user.id)
+
+        self.assertFalse(self.service.has_bought(self.user.id, self.product.id))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Order.objects.create(buyer=self.user, shipping_info=self.shipping_info,
+                                 products=[{"product": self.product.id, "count": 1}])
+
+        with self.assertNumQueries(0):
+            self.assertTrue(self.service.has_bought(self.user.id, self.product.id))
+
+    def test_service_invalidated_on_order_deletion_successful(self):
+        """
+        Tests if service discards purchased products when an order is deleted
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            order = Order.objects.create(buyer=self.user, shipping_info=self.shipping_info,
+                                         products=[{"product": self.product.id, "count": 1}])
+
+        order.delete()
+
+        self.assertFalse(self.service.has_bought(self.user.id, self.product.id))
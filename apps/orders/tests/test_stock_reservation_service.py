@@ -0,0 +1,67 @@
+from django.test import TestCase
+
+from apps.orders.utils.services.stock_reservation_service import StockReservationService
+
+from db.models import Product, Category
+
+
+class StockReservationServiceTests(TestCase):
+    """
+    Stock reservation service tests
+    """
+
+    def setUp(self):
+        self.service = StockReservationService()
+
+        category = Category.objects.create(title="TestCategory")
+
+        self.mock_product = {
+            "title": "Test title",
+            "description": "Test description",
+            "price": 1111,
+            "images": [
+                "testimgurl/1.com",
+                "testimgurl/2.com",
+                "testimgurl/3.com",
+            ],
+            "stock": 11,
+            "category": category,
+            "sold": 11,
+        }
+        self.product = Product.objects.create(**self.mock_product)
+
+    def test_service_discount_stock_successful(self):
+        """
+        Tests if service discounts stock and adds sold units
+        """
+        with self.assertNumQueries(1):
+            failed_lines = self.service.discount_stock({self.product.id: 11})
+
+        self.assertEqual(failed_lines, [])
+
+        self.product.refresh_from_db()
+
+        self.assertEqual(self.product.stock, 0)
+        self.assertEqual(self.product.sold, 22)
+
+    def test_service_discount_stock_insufficient_stock_reject(self):
+        """
+        Tests if service reports lines without enough stock
+        """
+        failed_lines = self.service.discount_stock({self.product.id: 12})
+
+        self.assertEqual(failed_lines, [{"product": self.product.id, "count": 12}])
+
+        self.product.refresh_from_db()
+
+        self.assertEqual(self.product.stock, 11)
+        self.assertEqual(self.product.sold, 11)
+
+    def test_service_discount_stock_no_products_successful(self):
+        """
+        Tests if service doesn't query without products
+        """
+        with self.assertNumQueries(0):
+            failed_lines = self.service.discount_stock({})
+
+        self.assertEqual(failed_lines, [])
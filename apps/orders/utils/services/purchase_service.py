@@ -0,0 +1,76 @@
+from django.apps import apps
+from django.core.cache import cache
+
+
+class PurchaseService:
+    """
+    Purchase verification service
+
+    Keeps the purchased product ids of each buyer in the cache backend,
+    filled on the first check. Orders created by other processes may not be
+    in a cached set yet, so products missing from it are checked with an
+    EXISTS query
+    """
+    __instance = None
+
+    cache_timeout = 60 * 60 * 24
+
+    def __new__(cls, *args, **kwargs):
+        if not PurchaseService.__instance:
+            PurchaseService.__instance = object.__new__(cls)
+        return PurchaseService.__instance
+
+    @staticmethod
+    def get_cache_key(user_id: int):
+        return f"orders:purchased:{user_id}"
+
+    @staticmethod
+    def get_order_product_model():
+        return apps.get_model("db", "OrderProduct")
+
+    def has_bought(self, user_id: int, product_id: int):
+        """
+        Checks if entered user has bought entered product
+
+        Args:
+            user_id(int): buyer id
+            product_id(int): product id
+
+        Returns:
+            True if user has an order with the product or False otherwise
+        """
+        purchased_products = cache.get(self.get_cache_key(user_id))
+
+        if purchased_products is None:
+            return product_id in self.refresh(user_id)
+
+        if product_id in purchased_products:
+            return True
+
+        return self.get_order_product_model().objects.filter(order__buyer_id=user_id, product_id=product_id).exists()
+
+    def refresh(self, user_id: int):
+        """
+        Caches the purchased product ids of entered user
+
+        Args:
+            user_id(int): buyer id
+
+        Returns:
+            purchased product ids
+        """
+        purchased_products = set(
+            self.get_order_product_model().objects.filter(order__buyer_id=user_id)
+            .values_list("product_id", flat=True)
+            .distinct()
+        )
+
+        cache.set(self.get_cache_key(user_id), purchased_products, self.cache_timeout)
+
+        return purchased_products
+
+    def invalidate(self, user_id: int):
+        """
+        Discards the cached purchased product ids of entered user
+        """
+        cache.delete(self.get_cache_key(user_id))
@@ -0,0 +1,58 @@
+from django.apps import apps
+from django.db import connection
+
+from apps.api_root.response_cache import bump_version
+
+
+class StockReservationService:
+    """
+    Stock reservation service
+    """
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not StockReservationService.__instance:
+            StockReservationService.__instance = object.__new__(cls)
+        return StockReservationService.__instance
+
+    def discount_stock(self, product_counts: dict):
+        """
+        Discounts stock and adds sold units of every entered product in one statement
+
+        Products without enough stock are not updated
+
+        Args:
+            product_counts(dict<int, int>): count to discount by product id
+
+        Returns:
+            failed lines list with product id and count
+        """
+        if not product_counts:
+            return []
+
+        product_model = apps.get_model("db", "Product")
+        product_table = connection.ops.quote_name(product_model._meta.db_table)
+
+        values = ", ".join(["(%s::bigint, %s::integer)"] * len(product_counts))
+        params = [param for line in product_counts.items() for param in line]
+
+        query = (
+            f"UPDATE {product_table} AS product "
+            "SET stock = product.stock - line.count, sold = product.sold + line.count, version = product.version + 1 "
+            f"FROM (VALUES {values}) AS line (id, count) "
+            "WHERE product.id = line.id AND product.stock >= line.count "
+            "RETURNING product.id"
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(query, params)
+            updated_products = {row[0] for row in cursor.fetchall()}
+
+        if updated_products:
+            bump_version(product_model)  # stock isn't updated through signals
+
+        return [
+            {"product": product_id, "count": count}
+            for product_id, count in product_counts.items()
+            if product_id not in updated_products
+        ]
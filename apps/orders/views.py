@@ -3,12 +3,13 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework import status
 
+from apps.api_root.exports import StreamingExportMixin
 from apps.api_root.utils import FilterMethodsViewset
 from .serializers import OrderSerializer
 from .filters import OrderFilterset
 
 
-class OrderViewset(FilterMethodsViewset):
+class OrderViewset(StreamingExportMixin, FilterMethodsViewset):
     """
     Order API Viewset
     """
@@ -18,6 +19,8 @@ class OrderViewset(FilterMethodsViewset):
     serializer_class = OrderSerializer
     filterset_class = OrderFilterset
 
+    planned_actions = ("list", "retrieve", "get_mine_orders")
+
     def get_permissions(self):
         """
         Gets custom permission for the view
@@ -34,12 +37,16 @@ class OrderViewset(FilterMethodsViewset):
         """
         orders = self.filter_queryset(self.get_queryset())
 
+        if self.is_export():
+            return self.export(orders)
+
         if orders:
             serializer = self.serializer_class(orders, many=True)
 
             export_data = {
                 "results": self.results,
                 "data": serializer.data,
+                "next_cursor": self.get_next_cursor(orders),
             }
 
             return Response(export_data, status=status.HTTP_200_OK)
@@ -82,6 +89,7 @@ class OrderViewset(FilterMethodsViewset):
                 export_data = {
                     "results": self.get_query_results(),
                     "data": serializer.data,
+                    "next_cursor": self.get_next_cursor(user_orders),
                 }
 
                 return Response(export_data, status=status.HTTP_200_OK)
@@ -0,0 +1,79 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from apps.payment_methods.utils.services.notification_service import PaymentNotificationService
+from core.settings.base import PAYMENT_NOTIFICATION_CONFIG
+
+
+class Command(BaseCommand):
+    """
+    Processes the stored payment notifications
+    """
+
+    help = "Creates the orders of stored payment notifications with a pool of workers"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Processes the ready notifications and exits")
+        parser.add_argument("--workers", type=int, default=PAYMENT_NOTIFICATION_CONFIG["WORKERS"],
+                            help="Notifications processed at once")
+        parser.add_argument("--batch-size", type=int, default=PAYMENT_NOTIFICATION_CONFIG["BATCH_SIZE"],
+                            help="Notifications processed by worker round")
+        parser.add_argument("--interval", type=float, default=PAYMENT_NOTIFICATION_CONFIG["POLL_INTERVAL"],
+                            help="Seconds to wait when there aren't ready notifications")
+
+    @staticmethod
+    def work(batch_size: int) -> dict:
+        """
+        Processes a batch in a worker thread with its own connection
+        """
+        try:
+            return PaymentNotificationService().process_pending(batch_size=batch_size)
+        finally:
+            connections.close_all()
+
+    def run_round(self, workers: int, batch_size: int) -> dict:
+        """
+        Processes a batch by worker
+
+        Returns:
+            dict with processed, ignored, retried and failed counts
+        """
+        if workers <= 1:
+            return PaymentNotificationService().process_pending(batch_size=batch_size)
+
+        totals = {"processed": 0, "ignored": 0, "retried": 0, "failed": 0}
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for results in executor.map(self.work, [batch_size] * workers):
+                for key, value in results.items():
+                    totals[key] += value
+
+        return totals
+
+    def write_results(self, results: dict):
+        """
+        Writes the round results
+        """
+        self.stdout.write(
+            f"Processed {results['processed']} notifications, {results['ignored']} ignored, "
+            f"{results['retried']} to retry, {results['failed']} failed."
+        )
+
+    def handle(self, *args, **options):
+        if options["once"]:
+            self.write_results(self.run_round(options["workers"], options["batch_size"]))
+            return
+
+        try:
+            while True:
+                results = self.run_round(options["workers"], options["batch_size"])
+
+                if any(results.values()):
+                    self.write_results(results)
+                else:
+                    time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            self.stdout.write("Payment notifications worker stopped.")
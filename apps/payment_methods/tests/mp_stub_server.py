@@ -0,0 +1,109 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from uuid import uuid4
+
+
+class MPStubHandler(BaseHTTPRequestHandler):
+    """
+    Answers the Mercado Pago endpoints used by the payment methods
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status: int, data: dict):
+        content = json.dumps(data).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def handle_request(self, get_response):
+        server = self.server
+        server.requests.append((self.command, self.path))
+
+        time.sleep(server.delay)
+
+        if server.failures:
+            status = server.failures.pop(0)
+            return self.send_json(status, {"message": "Stub failure", "status": status})
+
+        return self.send_json(*get_response())
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+
+        def get_response():
+            if self.path != "/checkout/preferences":
+                return 404, {"message": "Not found", "status": 404}
+
+            preference_id = uuid4().hex
+
+            preference = {
+                "id": preference_id,
+                "client_id": "stub",
+                "date_created": "2022-10-01T12:00:00.000-04:00",
+                "marketplace": "NONE",
+                "items": body.get("items", []),
+                "payer": body.get("payer", {}),
+                "date_of_expiration": body.get("date_of_expiration", None),
+                "init_point": f"https://stub.mercadopago.com/checkout?pref_id={preference_id}",
+            }
+
+            return 201, preference
+
+        self.handle_request(get_response)
+
+    def do_GET(self):
+        def get_response():
+            if not self.path.startswith("/v1/payments/"):
+                return 404, {"message": "Not found", "status": 404}
+
+            payment = self.server.payments.get(self.path.rsplit("/", 1)[-1], None)
+
+            if payment is None:
+                return 404, {"message": "Payment not found", "status": 404}
+
+            return 200, payment
+
+        self.handle_request(get_response)
+
+
+class MPStubServer(ThreadingHTTPServer):
+    """
+    Local Mercado Pago api for tests
+
+    Payments are read from 'payments' by id, 'failures' statuses are answered
+    before any other response and every request waits 'delay' seconds
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), MPStubHandler)
+
+        self.payments = {}
+        self.failures = []
+        self.delay = 0
+        self.requests = []
+
+        self.thread = threading.Thread(target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    def handle_error(self, request, client_address):
+        pass  # clients that timed out closed the connection before the answer
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
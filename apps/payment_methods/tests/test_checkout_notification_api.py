@@ -5,6 +5,8 @@ from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
 
+from apps.payment_methods.utils.services.notification_service import PaymentNotificationService
+
 from db.models import Category, Product, ShippingInfo, Order, Cart
 
 CHECKOUT_NOTIFICATION_URLS = {"mp": reverse("api:checkout_notify", kwargs={"method": "mP"})}
@@ -101,13 +103,11 @@ class PublicCheckoutNotificationApiTests(TestCase):
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)  # check status code
 
-        # check returned data
-        self.assertTrue(res.data)
-
-        self.assertEqual(res.data["user"]["email"], "test_user_80507629@testuser.com")
+        # process stored notification
+        PaymentNotificationService().process_pending()
 
         # check order creation
-        order = Order.objects.filter(buyer__email=res.data["user"]["email"]).last()
+        order = Order.objects.filter(buyer__email="test_user_80507629@testuser.com").last()
 
         order_product = order.get_order_products()[-1]
 
@@ -153,6 +153,8 @@ class PublicCheckoutNotificationApiTests(TestCase):
 
         self.assertFalse(res.data)
 
+        PaymentNotificationService().process_pending()
+
         # check not cleaned cart
         user_cart_items = self.user_cart.get_products()
         self.assertTrue(len(user_cart_items) > 0)
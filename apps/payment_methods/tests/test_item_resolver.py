@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.payment_methods.utils.services.item_resolver import MPItemResolver
+from apps.payment_methods.utils.services.mp_service import MPService
+from core.settings.base import MERCADO_PAGO_CONFIG
+
+from db.models import Category, Product, ShippingInfo
+
+
+def get_paid_item(product: Product, quantity: int = 1, **kwargs):
+    """
+    Gets a Mercado Pago paid item of entered product
+    """
+    return {"id": str(product.id), "title": product.title, "quantity": str(quantity), **kwargs}
+
+
+class MPItemResolverTests(TestCase):
+    """
+    Tests Mercado Pago paid items resolver
+    """
+
+    def setUp(self):
+        category = Category.objects.create(title="TestCategory")
+
+        self.products = [
+            Product.objects.create(
+                title=f"Test title {number}",
+                description="Test description",
+                price=10,
+                images=["testimgurl.com/1"],
+                stock=100,
+                category=category,
+                sold=0,
+            )
+            for number in range(20)
+        ]
+
+        self.user = get_user_model().objects.create_user(email="testemail@test.com")
+
+        ShippingInfo.objects.create(
+            user=self.user, address="Test address", receiver="test receiver name", receiver_dni=12345678
+        )
+
+        self.resolver = MPItemResolver()
+        self.resolver.clear()
+        self.addCleanup(self.resolver.clear)
+
+    def get_payment(self, items: list):
+        """
+        Gets an approved payment of entered items
+        """
+        return {"payer": {"email": self.user.email}, "additional_info": {"items": items}}
+
+    def test_resolve_by_id_successful(self):
+        """
+        Tests if items are resolved by product id in a single query
+        """
+        items = [get_paid_item(product, number + 1) for number, product in enumerate(self.products[:3])]
+
+        with self.assertNumQueries(1):
+            parsed_products = self.resolver.resolve(items)
+
+        self.assertEqual(parsed_products, [
+            {"product": product.id, "count": number + 1} for number, product in enumerate(self.products[:3])
+        ])
+
+    def test_resolve_legacy_title_successful(self):
+        """
+        Tests if items without id are resolved by title and cached
+        """
+        items = [{"title": self.products[0].title, "quantity": "2"}, get_paid_item(self.products[1])]
+
+        with self.assertNumQueries(2):
+            parsed_products = self.resolver.resolve(items)
+
+        self.assertEqual(parsed_products[0], {"product": self.products[0].id, "count": 2})
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.resolver.resolve(items), parsed_products)
+
+    def test_resolve_title_cache_is_bounded(self):
+        """
+        Tests if cached titles are limited by dropping the least recently used
+        """
+        with patch.dict(MERCADO_PAGO_CONFIG, {"ITEM_TITLE_CACHE_SIZE": 2}):
+            for product in self.products[:3]:
+                self.resolver.resolve([{"title": product.title, "quantity": "1"}])
+
+        self.assertEqual(list(self.resolver.titles), [self.products[1].title, self.products[2].title])
+
+    def test_resolve_unknown_item_reject(self):
+        """
+        Tests if items matching no product raise an error
+        """
+        with self.assertRaises(Product.DoesNotExist):
+            self.resolver.resolve([{"id": "0", "title": "Unknown title", "quantity": "1"}])
+
+    def test_create_order_constant_queries(self):
+        """
+        Tests if orders are created in the same number of queries for any number of items
+        """
+        service = MPService()
+
+        with CaptureQueriesContext(connection) as small_order_queries:
+            service.create_order(self.get_payment([get_paid_item(self.products[0])]))
+
+        with CaptureQueriesContext(connection) as large_order_queries:
+            order = service.create_order(self.get_payment([get_paid_item(product, 2) for product in self.products]))
+
+        self.assertEqual(len(large_order_queries), len(small_order_queries))
+        self.assertEqual(len(order.get_order_products()), 20)
+        self.assertEqual(float(order.total_price - order.shipping_info.ship_price), 20 * 2 * 10)
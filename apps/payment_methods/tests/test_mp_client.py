@@ -0,0 +1,154 @@
+from unittest.mock import patch
+
+import mercadopago
+
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.payment_methods.utils.services.mp_client import MPGatewayError, MPHttpClient
+from apps.payment_methods.utils.services.mp_service import MPService
+from apps.payment_methods.utils.services.notification_service import PaymentNotificationService
+
+from db.models import PaymentNotification
+
+from .mp_stub_server import MPStubServer
+
+NOTIFICATION_URL = reverse("api:checkout_notify", kwargs={"method": "mp"})  # mp notification url
+
+
+class MPHttpClientTests(TestCase):
+    """
+    Tests Mercado Pago http client against the stub server
+    """
+
+    def setUp(self):
+        self.stub = MPStubServer().__enter__()
+        self.addCleanup(self.stub.__exit__)
+
+        self.client_options = {"base_url": self.stub.url, "timeout": (1, 0.2), "max_retries": 2, "backoff": 0}
+        self.http_client = MPHttpClient(**self.client_options)
+
+        sdk = mercadopago.SDK("TEST-TOKEN", http_client=self.http_client)
+
+        patcher = patch.object(MPService, "sdk", sdk)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.service = MPService()
+
+        self.stub.payments["1234"] = {"id": 1234, "status": "approved"}
+
+    def test_get_preference_successful(self):
+        """
+        Tests if preferences are created through the pooled session
+        """
+        session = self.http_client.session
+
+        for _ in range(2):
+            preference = self.service.get_preference({"items": [{"title": "Test title", "quantity": 1}]})
+
+        self.assertEqual(preference["status"], 201)
+        self.assertEqual(preference["response"]["items"][0]["title"], "Test title")
+
+        self.assertIs(self.http_client.session, session)
+        self.assertEqual(self.stub.requests, [("POST", "/checkout/preferences")] * 2)
+
+    def test_check_payment_successful(self):
+        """
+        Tests if payments are checked by id
+        """
+        is_approved, payment = self.service.check_payment(1234)
+
+        self.assertTrue(is_approved)
+        self.assertEqual(payment["id"], 1234)
+
+        with self.assertRaises(ValueError):
+            self.service.check_payment(4321)
+
+    def test_retry_statuses_successful(self):
+        """
+        Tests if retryable statuses are retried until the provider answers
+        """
+        self.stub.failures = [503, 429]
+
+        is_approved, payment = self.service.check_payment(1234)
+
+        self.assertTrue(is_approved)
+        self.assertEqual(len(self.stub.requests), 3)
+
+    def test_retries_are_bounded_reject(self):
+        """
+        Tests if the client gives up after its max retries
+        """
+        self.stub.failures = [503] * 5
+
+        with self.assertRaises(MPGatewayError):
+            self.service.check_payment(1234)
+
+        self.assertEqual(len(self.stub.requests), 3)
+
+    def test_read_timeout_reject(self):
+        """
+        Tests if slow reads are retried and slow writes are not
+        """
+        self.stub.delay = 0.5
+
+        with self.assertRaises(MPGatewayError):
+            self.service.check_payment(1234)
+
+        self.assertEqual(len(self.stub.requests), 3)
+
+        with self.assertRaises(MPGatewayError):
+            self.service.get_preference({"items": []})
+
+        self.assertEqual(len(self.stub.requests), 4)
+
+    def test_connection_error_reject(self):
+        """
+        Tests if unreachable providers raise a gateway error
+        """
+        http_client = MPHttpClient(**{**self.client_options, "base_url": "http://127.0.0.1:9"})
+
+        with self.assertRaises(MPGatewayError):
+            http_client.get(url="https://api.mercadopago.com/v1/payments/1234", headers={})
+
+    def test_retry_delay_jitter_successful(self):
+        """
+        Tests if retry delays are bounded by the exponential backoff
+        """
+        http_client = MPHttpClient(backoff=0.2)
+
+        for attempt in range(3):
+            delay = http_client.get_delay(attempt)
+
+            self.assertTrue(0 <= delay <= 0.2 * 2 ** attempt)
+
+    async def test_async_check_payment_successful(self):
+        """
+        Tests if payments are checked without blocking the event loop
+        """
+        is_approved, payment = await self.service.acheck_payment(1234)
+
+        self.assertTrue(is_approved)
+
+    def test_notification_gateway_error_retried(self):
+        """
+        Tests if notifications are acked and retried later while the provider is unavailable
+        """
+        self.stub.failures = [503] * 3
+
+        res = APIClient().post(NOTIFICATION_URL, {"data": {"id": "1234"}}, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        results = PaymentNotificationService().process_pending()
+
+        self.assertEqual(results["retried"], 1)
+
+        notification = PaymentNotification.objects.get(payment_id="1234")
+
+        self.assertEqual(notification.status, PaymentNotification.PENDING)
+        self.assertIn("MPGatewayError", notification.last_error)
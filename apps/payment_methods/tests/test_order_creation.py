@@ -5,6 +5,7 @@ from rest_framework import status
 from rest_framework.response import Response
 
 from apps.payment_methods.utils.services.mp_service import MPService
+from apps.payment_methods.utils.services.notification_service import PaymentNotificationService
 from apps.payment_methods.utils.order_creation import OrderCreation, MercadoPagoMethod
 from apps.payment_methods.utils.models.order_strategy import OrderStrategyInterface
 
@@ -117,11 +118,9 @@ class OrderMercadoPagoMethodTests(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        self.assertTrue(response.data)
+        PaymentNotificationService().process_pending()
 
-        self.assertEqual(response.data["user"]["email"], "test_user_80507629@testuser.com")
-
-        order = Order.objects.filter(buyer__email=response.data["user"]["email"]).last()
+        order = Order.objects.filter(buyer__email="test_user_80507629@testuser.com").last()
 
         order_product = order.get_order_products()[-1]
 
@@ -148,11 +147,9 @@ class OrderMercadoPagoMethodTests(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        self.assertTrue(response.data)
-
-        self.assertEqual(response.data["user"]["email"], "test_user_80507629@testuser.com")
+        PaymentNotificationService().process_pending()
 
-        order = Order.objects.filter(buyer__email=response.data["user"]["email"]).last()
+        order = Order.objects.filter(buyer__email="test_user_80507629@testuser.com").last()
 
         order_product = order.get_order_products()[-1]
 
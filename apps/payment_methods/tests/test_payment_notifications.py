@@ -0,0 +1,425 @@
+import threading
+import time
+from io import StringIO
+from unittest.mock import patch
+
+import mercadopago
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connections, transaction
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.payment_methods.utils.services.mp_client import MPHttpClient
+from apps.payment_methods.utils.services.mp_service import MPService
+from apps.payment_methods.utils.services.notification_service import PaymentNotificationService
+from core.settings.base import PAYMENT_NOTIFICATION_CONFIG
+
+from db.models import Cart, Category, Order, PaymentNotification, Product, ShippingInfo
+
+from .mp_stub_server import MPStubServer
+
+NOTIFICATION_URL = reverse("api:checkout_notify", kwargs={"method": "mp"})  # mp notification url
+
+
+class PaymentNotificationsSetUpMixin:
+    """
+    Creates a buyer with a cart, shipping info and a stub Mercado Pago api
+    """
+
+    def setUp(self):
+        self.stub = MPStubServer().__enter__()
+        self.addCleanup(self.stub.__exit__)
+
+        http_client = MPHttpClient(base_url=self.stub.url, timeout=(1, 2), max_retries=0, backoff=0)
+
+        patcher = patch.object(MPService, "sdk", mercadopago.SDK("TEST-TOKEN", http_client=http_client))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        category = Category.objects.create(title="TestCategory")
+
+        self.product = Product.objects.create(
+            title="Test title",
+            description="Test description",
+            price=11,
+            images=["testimgurl.com/1"],
+            stock=11,
+            category=category,
+            sold=0,
+        )
+
+        self.user = get_user_model().objects.create(email="buyer@test.com")
+
+        self.cart = Cart.objects.create(user=self.user)
+        self.cart.add_product(product=self.product, count=2)
+
+        ShippingInfo.objects.create(
+            user=self.user, address="Test address", receiver="test receiver name", receiver_dni=12345678
+        )
+
+        self.service = PaymentNotificationService()
+
+    def set_payment(self, pay_id: str, payment_status: str = "approved"):
+        """
+        Stores a payment of the cart in the stub api
+        """
+        self.stub.payments[pay_id] = {
+            "id": int(pay_id),
+            "status": payment_status,
+            "payer": {"email": self.user.email},
+            "additional_info": {
+                "items": [{"id": str(self.product.id), "title": self.product.title, "quantity": "2"}]
+            },
+        }
+
+    def notify(self, pay_id: str):
+        """
+        Posts a payment notification
+        """
+        payload = {"action": "payment.created", "type": "payment", "data": {"id": pay_id}}
+
+        return APIClient().post(NOTIFICATION_URL, payload, format="json")
+
+
+class PaymentNotificationsTests(PaymentNotificationsSetUpMixin, TestCase):
+    """
+    Tests payment notifications inbox
+    """
+
+    def test_notification_stored_without_provider_request(self):
+        """
+        Tests if notifications are acked without calling the provider
+        """
+        self.set_payment("1001")
+
+        res = self.notify("1001")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.stub.requests, [])
+
+        notification = PaymentNotification.objects.get()
+
+        self.assertEqual(notification.provider, "mp")
+        self.assertEqual(notification.payment_id, "1001")
+        self.assertEqual(notification.payload["data"]["id"], "1001")
+        self.assertEqual(notification.status, PaymentNotification.PENDING)
+        self.assertFalse(Order.objects.exists())
+
+    def test_notification_retries_stored_once(self):
+        """
+        Tests if repeated notifications of a payment share a row
+        """
+        for _ in range(3):
+            self.notify("1001")
+
+        self.assertEqual(PaymentNotification.objects.count(), 1)
+
+    def test_notification_without_payment_id_reject(self):
+        """
+        Tests if notifications without payment id are rejected
+        """
+        res = APIClient().post(NOTIFICATION_URL, {"type": "payment"}, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(PaymentNotification.objects.exists())
+
+    def test_merchant_order_notification_ignored(self):
+        """
+        Tests if merchant order notifications are acked but not stored
+        """
+        res = APIClient().post(NOTIFICATION_URL, {"topic": "merchant_order", "data": {"id": "1"}}, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertFalse(PaymentNotification.objects.exists())
+
+    def test_process_approved_payment_successful(self):
+        """
+        Tests if worker creates the order, empties the cart and discounts the stock
+        """
+        self.set_payment("1001")
+        self.notify("1001")
+
+        results = self.service.process_pending()
+
+        self.assertEqual(results, {"processed": 1, "ignored": 0, "retried": 0, "failed": 0})
+
+        notification = PaymentNotification.objects.get()
+        order = Order.objects.get()
+
+        self.assertEqual(notification.status, PaymentNotification.PROCESSED)
+        self.assertEqual(notification.order, order)
+        self.assertIsNotNone(notification.processed_at)
+
+        self.assertEqual(order.buyer, self.user)
+        self.assertEqual(order.get_order_products()[0].count, 2)
+        self.assertEqual(len(self.cart.get_products()), 0)
+
+        self.product.refresh_from_db()
+
+        self.assertEqual(self.product.stock, 9)
+
+    def test_process_repeated_notification_creates_order_once(self):
+        """
+        Tests if notifications of a processed payment don't create another order
+        """
+        self.set_payment("1001")
+        self.notify("1001")
+        self.service.process_pending()
+
+        requests = len(self.stub.requests)
+
+        self.notify("1001")
+        results = self.service.process_pending()
+
+        self.assertEqual(results["processed"], 1)
+        self.assertEqual(Order.objects.count(), 1)
+        self.assertEqual(len(self.stub.requests), requests)
+
+    def test_process_not_approved_payment_ignored(self):
+        """
+        Tests if not approved payments are ignored until a new notification approves them
+        """
+        self.set_payment("1001", "pending")
+        self.notify("1001")
+
+        results = self.service.process_pending()
+
+        self.assertEqual(results["ignored"], 1)
+        self.assertFalse(Order.objects.exists())
+
+        self.set_payment("1001")
+        self.notify("1001")
+
+        results = self.service.process_pending()
+
+        self.assertEqual(results["processed"], 1)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_process_unknown_payment_fails(self):
+        """
+        Tests if notifications of unknown payments fail without retries
+        """
+        self.notify("404")
+
+        results = self.service.process_pending()
+
+        self.assertEqual(results["failed"], 1)
+        self.assertEqual(PaymentNotification.objects.get().attempts, 1)
+
+    def test_process_gateway_error_retried_with_backoff(self):
+        """
+        Tests if notifications are delayed while the provider is unavailable
+        and fail after the max attempts
+        """
+        self.set_payment("1001")
+        self.notify("1001")
+
+        self.stub.failures = [503] * PAYMENT_NOTIFICATION_CONFIG["MAX_ATTEMPTS"]
+
+        results = self.service.process_pending()
+
+        self.assertEqual(results["retried"], 1)
+
+        notification = PaymentNotification.objects.get()
+
+        self.assertGreater(notification.available_at, timezone.now())
+        self.assertEqual(self.service.process_pending()["retried"], 0)  # waiting its backoff
+
+        for _ in range(PAYMENT_NOTIFICATION_CONFIG["MAX_ATTEMPTS"] - 1):
+            PaymentNotification.objects.update(available_at=timezone.now())
+            self.service.process_pending()
+
+        notification.refresh_from_db()
+
+        self.assertEqual(notification.status, PaymentNotification.FAILED)
+        self.assertFalse(Order.objects.exists())
+
+    def test_process_without_stock_fails(self):
+        """
+        Tests if paid orders without enough stock fail without retries and are rolled back
+        """
+        Product.objects.filter(pk=self.product.pk).update(stock=1)
+
+        self.set_payment("1001")
+        self.notify("1001")
+
+        results = self.service.process_pending()
+
+        self.assertEqual(results["failed"], 1)
+        self.assertFalse(Order.objects.exists())
+        self.assertEqual(len(self.cart.get_products()), 1)
+
+        notification = PaymentNotification.objects.get()
+
+        self.assertEqual(notification.status, PaymentNotification.FAILED)
+        self.assertIn(f"Not enough stock of products {self.product.id} (2).", notification.last_error)
+
+        self.product.refresh_from_db()
+
+        self.assertEqual(self.product.stock, 1)
+
+    def test_failed_notification_sent_again_retried(self):
+        """
+        Tests if a new notification of a failed payment gets every retry again
+        """
+        self.set_payment("1001")
+        self.notify("1001")
+
+        PaymentNotification.objects.update(
+            status=PaymentNotification.FAILED, attempts=PAYMENT_NOTIFICATION_CONFIG["MAX_ATTEMPTS"]
+        )
+
+        self.notify("1001")
+
+        self.stub.failures = [503]
+
+        results = self.service.process_pending()
+
+        self.assertEqual(results["retried"], 1)
+        self.assertEqual(PaymentNotification.objects.get().attempts, 1)
+
+    def test_process_failure_rolls_back_order(self):
+        """
+        Tests if orders aren't kept when processing fails after creating them
+        """
+        self.set_payment("1001")
+        self.notify("1001")
+
+        with patch.object(Order.objects, "discount_stock_of", side_effect=RuntimeError("Stock error")):
+            results = self.service.process_pending()
+
+        self.assertEqual(results["retried"], 1)
+        self.assertFalse(Order.objects.exists())
+        self.assertEqual(len(self.cart.get_products()), 1)
+
+    def test_expired_claim_reclaimed(self):
+        """
+        Tests if notifications of a dead worker are processed when their lease expires
+        """
+        self.set_payment("1001")
+        self.notify("1001")
+
+        notification = self.service.claim_next()
+
+        self.assertEqual(notification.status, PaymentNotification.PROCESSING)
+        self.assertIsNone(self.service.claim_next())
+
+        PaymentNotification.objects.update(available_at=timezone.now())
+
+        results = self.service.process_pending()
+
+        self.assertEqual(results["processed"], 1)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_notification_received_while_checking_queued_again(self):
+        """
+        Tests if a not approved payment is checked again when a notification
+        arrives while the worker is checking it
+        """
+        self.set_payment("1001", "pending")
+        self.notify("1001")
+
+        service = MPService()
+        check_payment = service.check_payment
+
+        def approve_while_checking(pay_id):
+            result = check_payment(pay_id)
+
+            self.set_payment("1001")
+            self.notify("1001")
+
+            return result
+
+        with patch.object(MPService, "check_payment", side_effect=approve_while_checking):
+            self.service.process_next()
+
+        self.assertEqual(PaymentNotification.objects.get().status, PaymentNotification.PENDING)
+
+        results = self.service.process_pending()
+
+        self.assertEqual(results["processed"], 1)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_process_payment_notifications_command_successful(self):
+        """
+        Tests if the worker command processes every ready notification
+        """
+        self.set_payment("1001")
+        self.notify("1001")
+
+        out = StringIO()
+        call_command("process_payment_notifications", "--once", "--workers", "1", stdout=out)
+
+        self.assertIn("Processed 1 notifications, 0 ignored, 0 to retry, 0 failed.", out.getvalue())
+        self.assertEqual(Order.objects.count(), 1)
+
+
+class PaymentNotificationsConcurrencyTests(PaymentNotificationsSetUpMixin, TransactionTestCase):
+    """
+    Tests payment notifications processed by concurrent workers
+    """
+
+    def test_concurrent_workers_create_order_once(self):
+        """
+        Tests if concurrent workers and notification retries create a single order
+        """
+        self.set_payment("1001")
+        self.notify("1001")
+
+        self.stub.delay = 0.2  # keeps the notification locked while retries arrive
+
+        def work():
+            try:
+                self.service.process_pending()
+            finally:
+                connections.close_all()
+
+        workers = [threading.Thread(target=work) for _ in range(4)]
+
+        for worker in workers:
+            worker.start()
+
+        self.notify("1001")
+
+        for worker in workers:
+            worker.join()
+
+        self.service.process_pending()
+
+        self.assertEqual(Order.objects.count(), 1)
+        self.assertEqual(PaymentNotification.objects.get().status, PaymentNotification.PROCESSED)
+
+    def test_notification_not_locked_while_checking_payment(self):
+        """
+        Tests if notifications aren't locked while the worker calls the provider
+        """
+        self.set_payment("1001")
+        self.notify("1001")
+
+        self.stub.delay = 0.5
+
+        def work():
+            try:
+                self.service.process_next()
+            finally:
+                connections.close_all()
+
+        worker = threading.Thread(target=work)
+        worker.start()
+
+        while not self.stub.requests:
+            time.sleep(0.01)
+
+        with transaction.atomic():
+            notification = PaymentNotification.objects.select_for_update(nowait=True).get()
+
+        worker.join()
+
+        self.assertEqual(notification.status, PaymentNotification.PROCESSING)
+        self.assertEqual(Order.objects.count(), 1)
@@ -0,0 +1,139 @@
+from unittest.mock import patch
+
+import mercadopago
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.payment_methods.utils.payment_methods import PaymentMethod, MercadoPagoMethod
+from apps.payment_methods.utils.services.mp_client import MPHttpClient
+from apps.payment_methods.utils.services.mp_service import MPService
+
+from db.models import Cart, Category, Product, ShippingInfo
+
+from .mp_stub_server import MPStubServer
+
+PREFERENCE_REQUEST = ("POST", "/checkout/preferences")
+
+
+class MercadoPagoPreferenceCacheTests(TestCase):
+    """
+    Tests Mercado Pago preferences reused by cart content
+    """
+
+    def setUp(self):
+        cache.clear()
+
+        self.stub = MPStubServer().__enter__()
+        self.addCleanup(self.stub.__exit__)
+
+        http_client = MPHttpClient(base_url=self.stub.url, timeout=(1, 2), max_retries=0, backoff=0)
+
+        patcher = patch.object(MPService, "sdk", mercadopago.SDK("TEST-TOKEN", http_client=http_client))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = get_user_model().objects.create_user(email="testuser@test.com")
+
+        self.ship_info = ShippingInfo.objects.create(
+            user=self.user, address="Test address", receiver="test receiver name", receiver_dni=12345678
+        )
+
+        self.category = Category.objects.create(title="TestCategory")
+
+        self.products = [
+            Product.objects.create(
+                title=f"Test title {number}",
+                description="Test description",
+                price=11,
+                images=["testimgurl.com/1"],
+                stock=11,
+                category=self.category,
+                sold=0,
+            )
+            for number in range(10)
+        ]
+
+        self.cart = Cart.objects.create(user=self.user)
+        self.cart.add_product(self.products[0], 2)
+
+    def get_preference(self):
+        """
+        Gets the mercado pago preference of the cart
+        """
+        return PaymentMethod(self.cart, MercadoPagoMethod).get_preference()
+
+    def test_preference_reused_successful(self):
+        """
+        Tests if repeated checkouts of the same cart reuse the created preference
+        """
+        preference = self.get_preference()
+
+        self.assertEqual(self.get_preference(), preference)
+        self.assertEqual(self.stub.requests, [PREFERENCE_REQUEST])
+
+        self.assertEqual(str(preference["items"][0]["id"]), str(self.products[0].id))
+        self.assertEqual(preference["total_price"], self.cart.get_total_price() + self.ship_info.ship_price)
+
+    def test_preference_renewed_on_cart_change(self):
+        """
+        Tests if a new preference is created when cart content changes
+        """
+        preference = self.get_preference()
+
+        self.cart.add_product(self.products[0], 1)
+
+        new_preference = self.get_preference()
+
+        self.assertNotEqual(new_preference["id"], preference["id"])
+        self.assertEqual(new_preference["items"][0]["quantity"], 3)
+        self.assertEqual(self.stub.requests, [PREFERENCE_REQUEST] * 2)
+
+    def test_preference_renewed_on_price_change(self):
+        """
+        Tests if a new preference is created when a cart product price changes
+        """
+        self.get_preference()
+
+        self.products[0].price = 20
+        self.products[0].save()
+
+        preference = self.get_preference()
+
+        self.assertEqual(preference["items"][0]["unit_price"], 20.0)
+        self.assertEqual(self.stub.requests, [PREFERENCE_REQUEST] * 2)
+
+    def test_preference_not_reused_by_other_cart(self):
+        """
+        Tests if preferences of a cart aren't reused by another cart with the same content
+        """
+        self.get_preference()
+
+        self.cart.remove_all_products()
+        self.cart.delete()
+
+        self.cart = Cart.objects.create(user=self.user)
+        self.cart.add_product(self.products[0], 2)
+
+        self.get_preference()
+
+        self.assertEqual(self.stub.requests, [PREFERENCE_REQUEST] * 2)
+
+    def test_preference_constant_queries(self):
+        """
+        Tests if preference items are built in the same number of queries for any number of items
+        """
+        with CaptureQueriesContext(connection) as small_cart_queries:
+            self.get_preference()
+
+        for product in self.products[1:]:
+            self.cart.add_product(product, 1)
+
+        with CaptureQueriesContext(connection) as large_cart_queries:
+            preference = self.get_preference()
+
+        self.assertEqual(len(preference["items"]), 10)
+        self.assertEqual(len(large_cart_queries), len(small_cart_queries))
@@ -4,7 +4,7 @@ from rest_framework import status
 from .models import order_strategy
 from .services.mp_service import MPService
 
-from db.models import Order, Cart
+from db.models import Order, Cart, PaymentNotification
 
 
 class OrderCreation:
@@ -40,58 +40,79 @@ class MercadoPagoMethod(order_strategy.OrderStrategyInterface):
     """
     Order creation strategy for OrderCreation
     """
+    provider = "mp"
 
     def __str__(self):
         return "Mercado Pago Order Creation Method"
 
-    def format_response_data(self, order: Order, **kwargs):
+    def get_response(self, data):
+        """
+        Stores the mp payment notification in the inbox and acks it
+
+        The order is created by the payment notifications worker
+        """
+        topic = data.get("topic", None)
+
+        if topic == "merchant_order":
+            return Response(status=status.HTTP_200_OK)
+
+        pay_id = (data.get("data", None) or {}).get("id", None)
+
+        if not pay_id:
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+
+        PaymentNotification.objects.receive(self.provider, pay_id, data)
+
+        return Response(status=status.HTTP_200_OK)
+
+    def get_approved_payment(self, pay_id):
         """
-        Formats response data with entered order
+        Gets the data of an approved mp payment
 
         Args:
-            order(Order): order with data
+            pay_id: mp payment id
 
         Returns:
-            formatted data
+            payment data or None if payment isn't approved
         """
-        response = {
-            "user": {
-                "id": order.buyer.id,
-                "email": order.buyer.email
-            }
-        }
+        is_approved, data = MPService().check_payment(pay_id)
 
-        return response
+        if not is_approved:
+            return None
 
-    def get_response(self, data):
-        """
-        Creates order response with mp payment
-        """
-        topic = data.get("topic", None)
+        return data
 
-        if topic == "merchant_order":
-            return Response(status=status.HTTP_200_OK)
+    def create_order(self, data: dict):
+        """
+        Creates the order of an approved mp payment, empties the buyer cart
+        and discounts the stock
 
-        pay_id = data.get("data", {"id": None})["id"]
+        Args:
+            data(dict): approved payment data
 
-        service = MPService()
+        Returns:
+            order created
 
-        try:
-            is_approved, data = service.check_payment(pay_id)
+        Raises:
+            ValueError: if some products don't have enough stock, the paid
+                order must be handled manually
+        """
+        order = MPService().create_order(data)
 
-            if is_approved:
-                order = service.create_order(data)
+        user_cart = Cart.objects.filter(user=order.buyer).first()
 
-                user_cart = Cart.objects.filter(user=order.buyer).first()
-                user_cart.remove_all_products()
+        if user_cart:
+            user_cart.remove_all_products()
 
-                Order.objects.discount_stock_of(order)
+        failed_lines = Order.objects.discount_stock_of(order)
 
-                res_data = self.format_response_data(order)
+        if failed_lines:
+            products = ", ".join(f"{line['product']} ({line['count']})" for line in failed_lines)
+            raise ValueError(f"Not enough stock of products {products}.")
 
-                return Response(res_data, status=status.HTTP_200_OK)
+        return order
 
-            return Response(status=status.HTTP_200_OK)
 
-        except ValueError:
-            return Response(status=status.HTTP_400_BAD_REQUEST)
+PAYMENT_PROCESSORS = {
+    MercadoPagoMethod.provider: MercadoPagoMethod
+}
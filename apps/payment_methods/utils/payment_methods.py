@@ -1,5 +1,10 @@
+import hashlib
+import json
 from datetime import datetime, timedelta
 
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
 from core.settings.base import MERCADO_PAGO_CONFIG, env
 
 from db.models import Cart, CartItem, ShippingInfo
@@ -76,14 +81,6 @@ class MercadoPagoMethod(payment_strategy.PaymentStrategyInterface):
         """
         Formats cart item for preference data
         """
-        product = item.product
-        product.refresh_from_db()
-
-        if product.stock < item.count:
-            item.update_item_count()
-
-            return ValueError
-
         format_data = {
             "id": item.product.id,
             "currency_id": "ARS",
@@ -103,15 +100,45 @@ class MercadoPagoMethod(payment_strategy.PaymentStrategyInterface):
         """
         return (datetime.now() + timedelta).strftime("%Y-%m-%dT%H:%M:%S-04:00")
 
+    def get_preference_cache_key(self, preference_data: dict):
+        """
+        Gets the cache key of a preference by the hash of its cart content
+
+        Any change of items, prices, shipping or payer data gives a new key
+        """
+        content = {key: preference_data[key] for key in ("items", "shipments", "payer")}
+
+        content_hash = hashlib.sha256(
+            json.dumps(content, sort_keys=True, cls=DjangoJSONEncoder).encode()
+        ).hexdigest()
+
+        return f"payment_methods:mp:preference:{self.__cart.pk}:{content_hash}"
+
+    @staticmethod
+    def get_preference_cache_timeout() -> float:
+        """
+        Gets the seconds a created preference is reused, it stops being
+        reused a while before it expires
+        """
+        expiration = MERCADO_PAGO_CONFIG.get("DATE_OF_EXPIRATION", timedelta(days=3))
+        margin = MERCADO_PAGO_CONFIG.get("PREFERENCE_CACHE_MARGIN", timedelta(hours=1))
+
+        return max((expiration - margin).total_seconds(), 0)
+
     def get_preference(self):
         """
         Gets Mercado Pago preference data
-        """
-        cart_items = [self.format_cart_item(item) for item in self.__cart.get_products()]
 
-        if ValueError in cart_items:
+        Items and cart total are read in one joined query and the created
+        preference is reused while the cart content doesn't change
+        """
+        if self.__cart.refresh_products():
             raise ValueError("Item has insufficient stock.")
 
+        summary = self.__cart.get_summary()
+
+        cart_items = [self.format_cart_item(item) for item in summary["items"]]
+
         user = self.__cart.user
         ship_info = ShippingInfo.objects.get_selected_shipping_info(user=user)
 
@@ -135,9 +162,18 @@ class MercadoPagoMethod(payment_strategy.PaymentStrategyInterface):
             "notification_url": MERCADO_PAGO_CONFIG.get("NOTIFICATION_URL", None),
         }
 
+        cache_key = self.get_preference_cache_key(preference_data)
+
+        preference = cache.get(cache_key)
+
+        if preference is not None:
+            return preference
+
         preference_response = self.service.get_preference(preference_data)
 
-        preference = preference_response["response"]
+        preference = self.format_preference(
+            {**preference_response["response"], "total_price": summary["total_price"] + ship_info.ship_price})
 
-        return self.format_preference(
-            {**preference, "total_price": self.__cart.get_total_price() + ship_info.ship_price})
+        cache.set(cache_key, preference, self.get_preference_cache_timeout())
+
+        return preference
@@ -0,0 +1,131 @@
+import threading
+from collections import OrderedDict
+
+from core.settings.base import MERCADO_PAGO_CONFIG
+
+from db.models import Product
+
+
+class MPItemResolver:
+    """
+    Resolves Mercado Pago paid items to products
+
+    Items are resolved by the product id sent in the preference with one
+    bulk query. Legacy items without a valid id are resolved by title,
+    using a small LRU of title -> id before querying the missing ones
+    """
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not MPItemResolver.__instance:
+            MPItemResolver.__instance = object.__new__(cls)
+            MPItemResolver.__instance.titles = OrderedDict()
+            MPItemResolver.__instance.lock = threading.Lock()  # notifications workers share it
+        return MPItemResolver.__instance
+
+    @property
+    def max_titles(self) -> int:
+        return MERCADO_PAGO_CONFIG.get("ITEM_TITLE_CACHE_SIZE", 256)
+
+    def get_cached_title(self, title: str):
+        """
+        Gets the cached product id of entered title
+
+        Returns:
+            product id or None if title isn't cached
+        """
+        with self.lock:
+            if title not in self.titles:
+                return None
+
+            self.titles.move_to_end(title)
+
+            return self.titles[title]
+
+    def set_cached_title(self, title: str, product_id):
+        """
+        Caches the product id of entered title, dropping the least recently used
+        """
+        with self.lock:
+            self.titles[title] = product_id
+            self.titles.move_to_end(title)
+
+            while len(self.titles) > self.max_titles:
+                self.titles.popitem(last=False)
+
+    def clear(self):
+        """
+        Clears cached titles
+        """
+        with self.lock:
+            self.titles.clear()
+
+    @staticmethod
+    def get_item_id(item: dict):
+        """
+        Gets the product id of an item or None if it hasn't a valid one
+        """
+        try:
+            return int(item.get("id", None))
+        except (TypeError, ValueError):
+            return None
+
+    def get_title_ids(self, titles: set) -> dict:
+        """
+        Gets the product ids of entered titles, querying only the uncached ones
+
+        Returns:
+            dict of title -> product id
+        """
+        title_ids = {}
+
+        for title in titles:
+            product_id = self.get_cached_title(title)
+
+            if product_id is not None:
+                title_ids[title] = product_id
+
+        missing_titles = titles - title_ids.keys()
+
+        if missing_titles:
+            # the lowest id by title, like the former filter(title=...).first()
+            rows = Product.objects.filter(title__in=missing_titles).order_by("-pk").values_list("title", "pk")
+
+            for title, product_id in rows:
+                title_ids[title] = product_id
+
+            for title in missing_titles & title_ids.keys():
+                self.set_cached_title(title, title_ids[title])
+
+        return title_ids
+
+    def resolve(self, items: list) -> list:
+        """
+        Resolves paid items to order products data
+
+        Args:
+            items(list<dict>): Mercado Pago paid items
+
+        Returns:
+            list of dicts with product id and count
+        """
+        item_ids = [self.get_item_id(item) for item in items]
+
+        products = Product.objects.only("pk").in_bulk([item_id for item_id in item_ids if item_id is not None])
+
+        legacy_titles = {
+            item.get("title", None) for item, item_id in zip(items, item_ids) if item_id not in products
+        }
+        title_ids = self.get_title_ids(legacy_titles - {None}) if legacy_titles else {}
+
+        parsed_products = []
+
+        for item, item_id in zip(items, item_ids):
+            product_id = item_id if item_id in products else title_ids.get(item.get("title", None), None)
+
+            if product_id is None:
+                raise Product.DoesNotExist(f"Paid item {item.get('id', None)} does not match a product.")
+
+            parsed_products.append({"product": product_id, "count": int(item["quantity"])})
+
+        return parsed_products
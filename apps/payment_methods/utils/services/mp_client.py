@@ -0,0 +1,116 @@
+import random
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from mercadopago.config import Config
+from mercadopago.http.http_client import HttpClient
+
+from core.settings.base import MERCADO_PAGO_CONFIG
+
+
+class MPGatewayError(Exception):
+    """
+    Raised when Mercado Pago can't be reached or keeps failing
+    """
+
+
+class MPHttpClient(HttpClient):
+    """
+    Mercado Pago SDK http client with a persistent pooled session
+
+    Requests use the configured timeouts instead of the SDK ones and failed
+    attempts are retried a bounded number of times with exponential backoff
+    and full jitter. Writes are only retried when they weren't sent or the
+    provider answered with a retryable status
+    """
+
+    retry_statuses = (429, 500, 502, 503, 504)
+
+    def __init__(
+            self,
+            base_url: str = None,
+            timeout: tuple = (3.05, 10),
+            max_retries: int = 2,
+            backoff: float = 0.2,
+            pool_size: int = 10,
+    ):
+        self.base_url = base_url  # replaces the SDK api url, like in the stub server
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @classmethod
+    def from_config(cls):
+        """
+        Gets a client configured by MERCADO_PAGO_CONFIG
+        """
+        return cls(
+            base_url=MERCADO_PAGO_CONFIG.get("API_BASE_URL", None),
+            timeout=MERCADO_PAGO_CONFIG.get("TIMEOUT", (3.05, 10)),
+            max_retries=MERCADO_PAGO_CONFIG.get("MAX_RETRIES", 2),
+            backoff=MERCADO_PAGO_CONFIG.get("BACKOFF", 0.2),
+            pool_size=MERCADO_PAGO_CONFIG.get("POOL_SIZE", 10),
+        )
+
+    def get_url(self, url: str) -> str:
+        """
+        Gets the requested url on the configured base url
+        """
+        api_base_url = Config().api_base_url
+
+        if self.base_url and url.startswith(api_base_url):
+            return self.base_url.rstrip("/") + url[len(api_base_url):]
+
+        return url
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        Gets the seconds to wait before retrying a failed attempt
+        """
+        return random.uniform(0, self.backoff * 2 ** attempt)
+
+    def request(self, method, url, maxretries=None, **kwargs):
+        """
+        Makes a call to the API
+
+        SDK timeout and max retries are replaced by the client ones
+
+        Returns:
+            dict with response status and json
+
+        Raises:
+            MPGatewayError: the provider couldn't be reached or kept failing
+        """
+        kwargs.pop("timeout", None)
+
+        url = self.get_url(url)
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+
+            try:
+                api_result = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                sent = isinstance(exc, requests.ReadTimeout)
+
+                if last_attempt or (sent and method != "GET"):
+                    raise MPGatewayError(f"Mercado Pago request failed: {exc}") from exc
+            else:
+                if api_result.status_code not in self.retry_statuses:
+                    try:
+                        return {"status": api_result.status_code, "response": api_result.json()}
+                    except ValueError as exc:
+                        raise MPGatewayError("Mercado Pago response is not json.") from exc
+
+                if last_attempt:
+                    raise MPGatewayError(f"Mercado Pago responded with status {api_result.status_code}.")
+
+            time.sleep(self.get_delay(attempt))
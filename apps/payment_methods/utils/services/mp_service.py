@@ -1,10 +1,13 @@
-from django.contrib.auth import get_user_model
+from asgiref.sync import sync_to_async
 
 import mercadopago
 
 from core.settings.base import MERCADO_PAGO_CONFIG
 
-from db.models import Order, ShippingInfo, Product
+from .item_resolver import MPItemResolver
+from .mp_client import MPHttpClient
+
+from db.models import Order, ShippingInfo
 
 
 class MPService:
@@ -12,7 +15,7 @@ class MPService:
     Mercado Pago Service
     """
     __instance = None
-    sdk = mercadopago.SDK(MERCADO_PAGO_CONFIG["ACCESS_TOKEN"])
+    sdk = mercadopago.SDK(MERCADO_PAGO_CONFIG["ACCESS_TOKEN"], http_client=MPHttpClient.from_config())
 
     def __new__(cls, *args, **kwargs):
         if not MPService.__instance:
@@ -34,6 +37,14 @@ class MPService:
 
         return preference
 
+    async def aget_preference(self, pref_config: dict):
+        """
+        Gets preference of buy without blocking the event loop
+
+        The pooled client runs in a worker thread
+        """
+        return await sync_to_async(self.get_preference, thread_sensitive=False)(pref_config)
+
     def check_payment(self, pay_id: int):
         """
         Checks if payment was done successfully
@@ -53,10 +64,21 @@ class MPService:
 
         return (payment["response"]["status"] == "approved", payment["response"])
 
+    async def acheck_payment(self, pay_id: int):
+        """
+        Checks if payment was done successfully without blocking the event loop
+
+        The pooled client runs in a worker thread
+        """
+        return await sync_to_async(self.check_payment, thread_sensitive=False)(pay_id)
+
     def create_order(self, data: dict):
         """
         Creates an order with entered data
 
+        Buyer, shipping info and paid products are resolved in a constant
+        number of queries
+
         Args:
             data(dict): data with order data
 
@@ -71,21 +93,19 @@ class MPService:
         if not payer_data or not products:
             raise ValueError("Invalid data.")
 
-        user = get_user_model().objects.filter(email=payer_data["email"]).first()
-
-        user_ship_info = ShippingInfo.objects.get_selected_shipping_info(user=user)
+        # buyer and selected shipping info in one query
+        user_ship_info = (
+            ShippingInfo.objects.select_related("user")
+            .filter(user__email=payer_data["email"], is_selected=True)
+            .first()
+        )
 
         if not user_ship_info:
             raise ShippingInfo.DoesNotExist
 
-        parsed_products = []
-        for product in products:
-            found_product = Product.objects.filter(title=product["title"]).first()
-            data = {
-                "product": found_product.id,
-                "count": int(product["quantity"])
-            }
-            parsed_products.append(data)
+        user = user_ship_info.user
+
+        parsed_products = MPItemResolver().resolve(products)
 
         order_data = {
             "buyer": user,
@@ -94,6 +114,5 @@ class MPService:
         }
 
         order = Order.objects.create(**order_data)
-        order.save()
 
         return order
@@ -0,0 +1,202 @@
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.settings.base import PAYMENT_NOTIFICATION_CONFIG
+
+from db.models import PaymentNotification
+
+
+class PaymentNotificationService:
+    """
+    Payment Notification Service, processes the webhooks inbox
+    """
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not PaymentNotificationService.__instance:
+            PaymentNotificationService.__instance = object.__new__(cls)
+        return PaymentNotificationService.__instance
+
+    @staticmethod
+    def get_processor(provider: str):
+        """
+        Gets the payment processor of entered provider
+        """
+        from ..order_creation import PAYMENT_PROCESSORS
+
+        if provider not in PAYMENT_PROCESSORS:
+            raise ValueError(f"Provider '{provider}' does not exist.")
+
+        return PAYMENT_PROCESSORS[provider]()
+
+    @staticmethod
+    def get_retry_delay(attempts: int) -> timedelta:
+        """
+        Gets the time to wait before retrying a notification that failed 'attempts' times
+        """
+        seconds = PAYMENT_NOTIFICATION_CONFIG["BACKOFF"] * 2 ** (attempts - 1)
+
+        return timedelta(seconds=min(seconds, PAYMENT_NOTIFICATION_CONFIG["MAX_BACKOFF"]))
+
+    def set_failed_attempt(self, notification: PaymentNotification, error: Exception, retry: bool = True):
+        """
+        Records a failed attempt, the notification is retried with backoff
+        until it reaches the max attempts
+        """
+        notification.attempts += 1
+        notification.last_error = f"{type(error).__name__}: {error}"
+
+        if not retry or notification.attempts >= PAYMENT_NOTIFICATION_CONFIG["MAX_ATTEMPTS"]:
+            notification.status = PaymentNotification.FAILED
+        else:
+            notification.status = PaymentNotification.PENDING
+            notification.available_at = timezone.now() + self.get_retry_delay(notification.attempts)
+
+    @staticmethod
+    def is_claimed(notification: PaymentNotification, lease: datetime) -> bool:
+        """
+        Checks if the notification is still claimed with entered lease,
+        a new notification of the payment or another worker renews it
+        """
+        return notification.status == PaymentNotification.PROCESSING and notification.available_at == lease
+
+    def claim_next(self):
+        """
+        Claims the oldest ready notification in a short transaction
+
+        The claim is a processing status with a lease instead of a row lock
+        held while the provider is called, so new notifications of the
+        payment aren't blocked. The notification of a dead worker is
+        reclaimed when its lease expires
+
+        Returns:
+            claimed notification or None if there aren't ready notifications
+        """
+        now = timezone.now()
+
+        with transaction.atomic():
+            notification = PaymentNotification.objects.get_pending(now).select_for_update(skip_locked=True).first()
+
+            if not notification:
+                return None
+
+            notification.status = PaymentNotification.PROCESSING
+            notification.available_at = now + timedelta(seconds=PAYMENT_NOTIFICATION_CONFIG["LEASE"])
+            notification.save(update_fields=["status", "available_at"])
+
+        return notification
+
+    def process(self, notification: PaymentNotification, payment: dict, lease: datetime):
+        """
+        Creates the order of a locked notification with its approved payment data
+
+        A notification whose order already exists is never processed again,
+        so retried webhooks and reclaimed notifications can't create
+        duplicated orders
+        """
+        if notification.order_id:
+            notification.status = PaymentNotification.PROCESSED
+            return
+
+        if payment:
+            notification.order = self.get_processor(notification.provider).create_order(payment)
+            notification.status = PaymentNotification.PROCESSED
+            notification.processed_at = timezone.now()
+        elif self.is_claimed(notification, lease):
+            notification.status = PaymentNotification.IGNORED
+            notification.processed_at = timezone.now()
+
+        # otherwise a new notification queued it again while the payment was checked
+
+        notification.attempts += 1
+        notification.last_error = ""
+
+    def set_failed_claim(self, pk: int, error: Exception, lease: datetime, retry: bool = True):
+        """
+        Records a failed attempt of a claimed notification, the status is kept
+        when a new notification or another worker renewed the claim
+        """
+        with transaction.atomic():
+            notification = PaymentNotification.objects.select_for_update().get(pk=pk)
+
+            if self.is_claimed(notification, lease):
+                self.set_failed_attempt(notification, error, retry)
+            else:
+                notification.attempts += 1
+                notification.last_error = f"{type(error).__name__}: {error}"
+
+            notification.save()
+
+        return notification
+
+    def process_next(self):
+        """
+        Claims and processes the oldest ready notification
+
+        The provider is called outside any transaction, then the order is
+        created in a second transaction that locks the notification and only
+        creates it while it has no order. Order changes are rolled back when
+        processing fails but the failed attempt is kept
+
+        Returns:
+            processed notification or None if there aren't ready notifications
+        """
+        notification = self.claim_next()
+
+        if not notification:
+            return None
+
+        pk, lease = notification.pk, notification.available_at
+
+        try:
+            payment = None
+
+            if not notification.order_id:
+                processor = self.get_processor(notification.provider)
+                payment = processor.get_approved_payment(notification.payment_id)
+
+            with transaction.atomic():
+                notification = PaymentNotification.objects.select_for_update().get(pk=pk)
+
+                self.process(notification, payment, lease)
+
+                notification.save()
+        except ValueError as error:
+            # the payment or its data is invalid, retrying won't fix it
+            notification = self.set_failed_claim(pk, error, lease, retry=False)
+        except Exception as error:
+            notification = self.set_failed_claim(pk, error, lease)
+
+        return notification
+
+    def process_pending(self, batch_size: int = None) -> dict:
+        """
+        Processes ready notifications one by one
+
+        Args:
+            batch_size(int): max notifications processed
+
+        Returns:
+            dict with processed, ignored, retried and failed counts
+        """
+        batch_size = batch_size or PAYMENT_NOTIFICATION_CONFIG["BATCH_SIZE"]
+        results = {"processed": 0, "ignored": 0, "retried": 0, "failed": 0}
+
+        for _ in range(batch_size):
+            notification = self.process_next()
+
+            if not notification:
+                break
+
+            if notification.status == PaymentNotification.PROCESSED:
+                results["processed"] += 1
+            elif notification.status == PaymentNotification.IGNORED:
+                results["ignored"] += 1
+            elif notification.status == PaymentNotification.FAILED:
+                results["failed"] += 1
+            else:
+                results["retried"] += 1
+
+        return results
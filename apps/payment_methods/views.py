@@ -9,6 +9,7 @@ from db.models import Cart
 
 from .utils.payment_methods import PaymentMethod, MercadoPagoMethod
 from .utils.order_creation import OrderCreation
+from .utils.services.mp_client import MPGatewayError
 
 PAYMENT_METHODS = {
     "mp": MercadoPagoMethod
@@ -50,6 +51,12 @@ class CheckoutAPIView(APIView):
             except ValueError:
                 return Response(status=status.HTTP_400_BAD_REQUEST)
 
+            except MPGatewayError:
+                return Response(
+                    {"message": "Payment provider is unavailable."},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                )
+
         return Response({"message": f"{'cart id' if not cart else 'method'} is invalid."},
                         status=status.HTTP_400_BAD_REQUEST)
 
@@ -63,7 +70,7 @@ class CheckoutNotificationAPIView(APIView):
 
     def post(self, request, method, *args, **kwargs):
         """
-        Create Order if product pay was success
+        Stores the payment notification, the order is created by the notifications worker
         """
         if method.lower() in ORDER_CREATORS:
             order_creator_method = ORDER_CREATORS[method.lower()]
@@ -1,10 +1,11 @@
 from django.utils.translation import gettext_lazy as _
-from django.db.models import Q
 
 import django_filters.rest_framework as filters
 
 from .serializers import ProductSerializer
+from .utils.services.search_service import ProductSearchService
 from apps.api_root.utils import FilterMixins, FilterResultsFilterset
+from apps.categories.utils.services.category_tree_service import CategoryTreeService
 
 
 class ProductsFilterSet(FilterResultsFilterset, FilterMixins):
@@ -14,15 +15,16 @@ class ProductsFilterSet(FilterResultsFilterset, FilterMixins):
 
     _results = 0
 
+    search_service = ProductSearchService()
+    tree_service = CategoryTreeService()
+
     # Filters
 
     title = filters.CharFilter(
         field_name="title", lookup_expr="icontains", label=_("Title")
     )
 
-    category = filters.CharFilter(
-        field_name="category__title", lookup_expr="iexact", label=_("Category")
-    )
+    category = filters.CharFilter(method="query_category", label=_("Category"))
 
     min_price = filters.NumberFilter(
         field_name="price", lookup_expr="gte", label=_("Min Price")
@@ -56,15 +58,17 @@ class ProductsFilterSet(FilterResultsFilterset, FilterMixins):
 
     search = filters.CharFilter(method="query_search", label=_("Search Product"))
 
+    def query_category(self, queryset, name, value):
+        """
+        Filters products by category title using the cached category ids
+        """
+        return queryset.filter(category_id__in=self.tree_service.get_category_ids(value))
+
     def query_search(self, queryset, name, value):
         """
-        Search in products by title and description
+        Search in products by title, category and description
         """
-        return queryset.filter(
-            Q(title__icontains=value)
-            | Q(description__icontains=value)
-            | Q(category__title__icontains=value)
-        ).order_by("-sold")
+        return self.search_service.search(queryset, value)
 
     class Meta:
         model = ProductSerializer.Meta.model
@@ -0,0 +1,104 @@
+from time import perf_counter
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from rest_framework.test import APIRequestFactory
+
+from apps.products.views.viewset_views import ProductsViewSet
+from core.settings.base import RESPONSE_CACHE_CONFIG
+from db.models import Category, Product
+
+
+class Command(BaseCommand):
+    """
+    Compares the products list serialized on every request and assembled from fragments
+    """
+
+    help = (
+        "Seeds products, times the products list without fragments, with cold and "
+        "warm fragments and rolls every change back"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=500, help="Seeded and listed products")
+        parser.add_argument("--rounds", type=int, default=10, help="Timed requests by case")
+
+    def seed(self, rows: int):
+        """
+        Seeds products in a few categories
+
+        Args:
+            rows(int): seeded products
+        """
+        categories = Category.objects.bulk_create(
+            [Category(title=f"Benchmark category {index}") for index in range(max(rows // 100, 1))]
+        )
+        Product.objects.bulk_create(
+            [
+                Product(
+                    title=f"Benchmark product {index}",
+                    description="Benchmark description",
+                    price=index % 1000 + 1,
+                    images=["benchmark.com/1", "benchmark.com/2"],
+                    stock=100,
+                    category=categories[index % len(categories)],
+                    sold=index % 500,
+                )
+                for index in range(rows)
+            ]
+        )
+
+    def time_list(self, rows: int, rounds: int, clear: bool) -> float:
+        """
+        Times the products list view
+
+        Args:
+            rows(int): listed products
+            rounds(int): timed requests
+            clear(bool): clear fragments before every request
+
+        Returns:
+            average milliseconds by request
+        """
+        view = ProductsViewSet.as_view({"get": "list"})
+        factory = APIRequestFactory()
+
+        elapsed = 0
+
+        for _ in range(rounds):
+            if clear:
+                cache.clear()
+
+            request = factory.get("/api/products/", {"limit": rows})
+
+            start = perf_counter()
+            view(request).render()
+            elapsed += perf_counter() - start
+
+        return elapsed / rounds * 1000
+
+    def handle(self, *args, **options):
+        rows, rounds = options["rows"], options["rounds"]
+
+        with transaction.atomic(), patch.dict(RESPONSE_CACHE_CONFIG, {"ENABLED": False}):
+            self.seed(rows)
+
+            with patch.dict(RESPONSE_CACHE_CONFIG, {"FRAGMENTS_ENABLED": False}):
+                cases = [("Serialized", self.time_list(rows, rounds, clear=False))]
+
+            cases.append(("Cold fragments", self.time_list(rows, rounds, clear=True)))
+
+            self.time_list(rows, 1, clear=False)  # warms every fragment
+            cases.append(("Warm fragments", self.time_list(rows, rounds, clear=False)))
+
+            transaction.set_rollback(True)
+
+        cache.clear()
+
+        for name, average in cases:
+            self.stdout.write(f"{name}: {average:.2f} ms")
+
+        self.stdout.write(self.style.SUCCESS("Seeded products were rolled back."))
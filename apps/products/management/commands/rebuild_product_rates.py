@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Avg, Count, F, FloatField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Round
+
+from apps.api_root.response_cache import bump_version
+from apps.products.meta import get_app_model
+from db.models import Comment
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds product rate aggregates from comments
+    """
+
+    help = "Rebuilds rate sum, rate count and rate of every product in a single update"
+
+    def handle(self, *args, **options):
+        product_comments = Comment.objects.filter(product=OuterRef("pk")).order_by().values("product")
+
+        def get_aggregate(aggregate):
+            return Subquery(product_comments.annotate(value=aggregate).values("value")[:1])
+
+        updated = get_app_model().objects.update(
+            rate_sum=Coalesce(get_aggregate(Sum("rate")), Value(0.0), output_field=FloatField()),
+            rate_count=Coalesce(get_aggregate(Count("pk")), Value(0)),
+            rate=Coalesce(get_aggregate(Round(Avg("rate"), 2)), Value(5.0), output_field=FloatField()),
+            version=F("version") + 1,
+        )
+
+        bump_version(get_app_model())
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt rate aggregates of {updated} products."))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from apps.products.utils.services.recommendation_service import ProductRecommendationService
+
+
+class Command(BaseCommand):
+    """
+    Precomputes related products recommendations
+    """
+
+    help = "Stores the top co-purchased and co-favourite neighbours of each product"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only refreshes products of orders created after the last refresh",
+        )
+
+    def handle(self, *args, **options):
+        service = ProductRecommendationService()
+
+        if options["incremental"]:
+            refresh = service.refresh_from_new_orders()
+        else:
+            refresh = service.rebuild()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{'Full' if refresh.is_full else 'Incremental'} refresh of {refresh.refreshed_products} products "
+            f"up to order product {refresh.last_order_product_id}."
+        ))
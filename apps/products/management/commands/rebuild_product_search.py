@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.products.meta import get_app_model
+from apps.products.utils.services.search_service import ProductSearchService
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds product search documents
+    """
+
+    help = "Rebuilds the search document of every product, needed after changing SEARCH_LANGUAGE"
+
+    def handle(self, *args, **options):
+        updated = ProductSearchService().update_vectors(get_app_model().objects.all())
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt search documents of {updated} products."))
@@ -23,6 +23,20 @@ class ProductSerializer(serializers.ModelSerializer):
         ]
         extra_kwargs = {"id": {"read_only": True}}
 
+        # Queryset needed by representation
+        select_related_fields = ["category"]
+        only_fields = [
+            "id",
+            "title",
+            "description",
+            "price",
+            "images",
+            "stock",
+            "category__title",
+            "sold",
+            "rate",
+        ]
+
     def to_representation(self, instance):
         """
         Custom representation of instance
@@ -0,0 +1,63 @@
+from django.db.models import F
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .meta import get_app_model
+from .utils.services.search_service import ProductSearchService
+from apps.api_root.response_cache import bump_version
+from apps.categories.meta import get_app_model as get_category_model
+
+
+@receiver(pre_save, sender=get_app_model())
+def increase_product_version(sender, instance, **kwargs):
+    """
+    Increases the version of an updated product in the same statement
+    """
+    if not instance._state.adding:
+        instance.version = F("version") + 1
+
+
+@receiver(post_save, sender=get_app_model())
+def refresh_saved_product_version(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Increases the version of a product saved without it in update_fields and
+    reads the increased version, so the instance doesn't keep the expression
+    """
+    if created:
+        return
+
+    if update_fields is not None and "version" not in update_fields:
+        sender.objects.filter(pk=instance.pk).update(version=F("version") + 1)
+
+    instance.refresh_from_db(fields=["version"])
+
+
+@receiver(post_save, sender=get_app_model())
+def update_product_search_vector(sender, instance, update_fields=None, **kwargs):
+    """
+    Updates the search document of the saved product
+    """
+    if update_fields is not None and not {"title", "description", "category"} & set(update_fields):
+        return
+
+    ProductSearchService().update_vectors(sender.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=get_category_model())
+def update_category_products_search_vector(sender, instance, created, **kwargs):
+    """
+    Updates the search document of the products in the saved category
+    """
+    if not created:
+        products = get_app_model().objects.filter(category=instance)
+
+        ProductSearchService().update_vectors(products)
+        products.update(version=F("version") + 1)  # category title is in the representation
+
+
+@receiver([post_save, post_delete], sender=get_app_model())
+def bump_product_version(sender, **kwargs):
+    """
+    Discards the cached responses with products
+    """
+    bump_version(sender)
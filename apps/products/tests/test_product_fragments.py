@@ -0,0 +1,200 @@
+import json
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.orders.utils.services.stock_reservation_service import StockReservationService
+from apps.products.meta import get_app_model
+from apps.products.serializers import ProductSerializer
+from apps.products.utils.services.fragment_service import ProductFragmentService
+from core.settings.base import RESPONSE_CACHE_CONFIG
+from db.models import Category
+
+PRODUCTS_LIST_URL = reverse("api:product-list")  # products list api url
+
+
+class ProductFragmentTests(TestCase):
+    """
+    Tests pre-rendered product fragments
+    """
+
+    def setUp(self):
+        cache.clear()
+
+        patcher = patch.dict(RESPONSE_CACHE_CONFIG, {"ENABLED": False})  # every request reaches the view
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.client = APIClient()
+
+        self.model = get_app_model()  # product model
+
+        self.service = ProductFragmentService()
+
+        self.category = Category.objects.create(title="TestCategory")
+
+        self.mock_product = {
+            "title": "Test title",
+            "description": "Test description",
+            "price": 1111,
+            "images": [
+                "testimgurl.com/1",
+                "testimgurl.com/2",  # Mock product data
+                "testimgurl.com/3",
+            ],
+            "stock": 11,
+            "category": self.category,
+            "sold": 11,
+        }
+
+        self.products = [
+            self.model.objects.create(**{**self.mock_product, "title": f"Test title {index}"}) for index in range(5)
+        ]
+
+    def get_listed(self, product):
+        """
+        Gets the listed representation of entered product
+        """
+        res = self.client.get(PRODUCTS_LIST_URL)
+
+        return next(item for item in res.data["data"] if item["id"] == product.id)
+
+    def get_version(self, product):
+        """
+        Gets the stored version of entered product
+        """
+        return self.model.objects.values_list("version", flat=True).get(pk=product.pk)
+
+    def test_fragments_list_equals_serializer_successful(self):
+        """
+        Tests if the list assembled from fragments equals the serialized list
+        """
+        res = self.client.get(PRODUCTS_LIST_URL)
+
+        serialized = ProductSerializer(self.model.objects.order_by("pk"), many=True).data
+
+        self.assertEqual(res["Content-Type"], "application/json")
+        self.assertEqual(json.loads(res.content)["data"], json.loads(JSONRenderer().render(serialized)))
+        self.assertEqual(res.data["results"], 5)
+
+    def test_warm_fragments_skip_serializer_successful(self):
+        """
+        Tests if cached fragments are not serialized again
+        """
+        self.client.get(PRODUCTS_LIST_URL)
+
+        with patch.object(ProductSerializer, "to_representation") as to_representation:
+            res = self.client.get(PRODUCTS_LIST_URL)
+
+        to_representation.assert_not_called()
+        self.assertEqual(len(res.data["data"]), 5)
+
+    def test_missing_fragments_filled_in_one_query_successful(self):
+        """
+        Tests if fragment misses are rendered from a single query
+        """
+        page = self.service.get_page(self.model.objects.order_by("pk"), None)
+
+        with self.assertNumQueries(1):
+            fragments = self.service.get_fragments(page, ProductSerializer)
+
+        with self.assertNumQueries(0):
+            self.service.get_fragments(page, ProductSerializer)
+
+        self.assertEqual([json.loads(fragment)["id"] for fragment in fragments], [p.id for p in self.products])
+
+    def test_product_save_changes_version_successful(self):
+        """
+        Tests if saving a product, fully or partially, changes its version
+        """
+        product = self.products[0]
+
+        product.title = "Changed title"
+        product.save()
+
+        self.assertEqual(self.get_version(product), 1)
+        self.assertEqual(product.version, 1)
+
+        product.stock = 1
+        product.save(update_fields=["stock"])
+
+        self.assertEqual(self.get_version(product), 2)
+        self.assertEqual(product.version, 2)
+
+        listed = self.get_listed(product)
+
+        self.assertEqual(listed["title"], "Changed title")
+        self.assertEqual(listed["stock"], 1)
+
+    def test_comment_and_stock_change_version_successful(self):
+        """
+        Tests if comments and stock discounts change product version
+        """
+        product = self.products[0]
+
+        self.client.get(PRODUCTS_LIST_URL)
+
+        user = get_user_model().objects.create_user(email="testuser@test.com")
+        product.create_comment(user=user, subject="Test", content="Test", rate=1)
+
+        StockReservationService().discount_stock({product.id: 10})
+
+        self.assertEqual(self.get_version(product), 2)
+
+        listed = self.get_listed(product)
+
+        self.assertEqual(listed["rate"], 1)
+        self.assertEqual(listed["stock"], 1)
+
+    def test_category_title_change_version_successful(self):
+        """
+        Tests if renaming a category changes the version of its products
+        """
+        self.client.get(PRODUCTS_LIST_URL)
+
+        self.category.title = "ChangedCategory"
+        self.category.save()
+
+        res = self.client.get(PRODUCTS_LIST_URL)
+
+        self.assertEqual({product["category"] for product in res.data["data"]}, {"ChangedCategory"})
+
+    def test_fragments_disabled_successful(self):
+        """
+        Tests if the list is serialized when fragments are disabled
+        """
+        fragments_res = self.client.get(PRODUCTS_LIST_URL)
+
+        with patch.dict(RESPONSE_CACHE_CONFIG, {"FRAGMENTS_ENABLED": False}):
+            res = self.client.get(PRODUCTS_LIST_URL)
+
+        self.assertEqual(json.loads(res.content), json.loads(fragments_res.content))
+
+
+class BenchmarkProductFragmentsCommandTests(TestCase):
+    """
+    Tests benchmark product fragments command
+    """
+
+    def test_benchmark_product_fragments_command_successful(self):
+        """
+        Tests if command times every case and rolls back seeded products
+        """
+        out = StringIO()
+        call_command("benchmark_product_fragments", rows=20, rounds=2, stdout=out)
+
+        output = out.getvalue()
+
+        self.assertIn("Serialized", output)
+        self.assertIn("Cold fragments", output)
+        self.assertIn("Warm fragments", output)
+
+        self.assertFalse(get_app_model().objects.exists())
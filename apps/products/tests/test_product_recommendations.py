@@ -0,0 +1,273 @@
+from io import StringIO
+from unittest.mock import patch
+
+from asgiref.sync import sync_to_async
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import AsyncRequestFactory, TestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.api_root.async_views import get_route_view
+from apps.api_root.pagination import encode_cursor
+from apps.products.meta import get_app_model
+from apps.products.routers import router as products_router
+from apps.products.views.async_views import AsyncRelatedProductsView
+from apps.products.utils.services.recommendation_service import ProductRecommendationService
+from core.settings.base import RECOMMENDATION_CONFIG
+from db.models import (
+    Category,
+    FavouriteItem,
+    Order,
+    ProductRecommendation,
+    ProductRecommendationRefresh,
+    ShippingInfo,
+)
+
+
+def get_related_products_url(product_id: int) -> str:
+    """
+    Gets the related products url of entered product
+    """
+    return reverse("api:product-get-related-products", kwargs={"pk": product_id})
+
+
+class ProductRecommendationsTests(TestCase):
+    """
+    Tests precomputed related products
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.service = ProductRecommendationService()
+
+        self.category = Category.objects.create(title="Test Category")
+        other_category = Category.objects.create(title="Other Test Category")
+
+        self.products = [
+            get_app_model().objects.create(
+                title=f"Test title {number}",
+                description="Test description",
+                price=10,
+                images=["testimgurl.com/1"],
+                stock=100,
+                category=self.category if number < 3 else other_category,
+                sold=number,
+            )
+            for number in range(6)
+        ]
+
+        self.users = [get_user_model().objects.create_user(email=f"user{number}@test.com") for number in range(3)]
+
+        self.shipping_infos = [
+            ShippingInfo.objects.create(user=user, address="Test address", receiver="Test", receiver_dni=12345678)
+            for user in self.users
+        ]
+
+    def create_order(self, user_index: int, *product_indexes):
+        """
+        Creates an order of entered products
+        """
+        return Order.objects.create(
+            buyer=self.users[user_index],
+            shipping_info=self.shipping_infos[user_index],
+            products=[{"product": self.products[index].id, "count": 1} for index in product_indexes],
+        )
+
+    def get_recommended_ids(self, product_index: int) -> list:
+        """
+        Gets the stored neighbours of entered product, best first
+        """
+        return list(
+            ProductRecommendation.objects.filter(product=self.products[product_index])
+            .order_by("rank")
+            .values_list("related_product_id", flat=True)
+        )
+
+    def test_rebuild_scores_co_purchases_and_favourites(self):
+        """
+        Tests if neighbours are ranked by co-purchases and co-favourites
+        """
+        self.create_order(0, 0, 3, 4)
+        self.create_order(1, 0, 3)
+        FavouriteItem.objects.create(user=self.users[2], product=self.products[0])
+        FavouriteItem.objects.create(user=self.users[2], product=self.products[5])
+
+        refresh = self.service.rebuild()
+
+        self.assertTrue(refresh.is_full)
+        self.assertEqual(
+            self.get_recommended_ids(0), [self.products[3].id, self.products[4].id, self.products[5].id]
+        )
+
+        recommendation = ProductRecommendation.objects.get(product=self.products[0], related_product=self.products[3])
+
+        self.assertEqual(recommendation.score, 2 * RECOMMENDATION_CONFIG["PURCHASE_WEIGHT"])
+        self.assertEqual(self.get_recommended_ids(5), [self.products[0].id])
+        self.assertEqual(self.get_recommended_ids(1), [])
+
+    def test_rebuild_keeps_top_k(self):
+        """
+        Tests if only the top 'TOP_K' neighbours are stored
+        """
+        self.create_order(0, 0, 1, 2, 3, 4, 5)
+        self.create_order(1, 0, 5)
+
+        with patch.dict(RECOMMENDATION_CONFIG, {"TOP_K": 2}):
+            self.service.rebuild()
+
+        self.assertEqual(self.get_recommended_ids(0), [self.products[5].id, self.products[1].id])
+        self.assertEqual(ProductRecommendation.objects.filter(product=self.products[1]).count(), 2)
+
+    @patch.dict(RECOMMENDATION_CONFIG, {"REFRESH_OVERLAP": 0})
+    def test_incremental_refresh_only_new_orders(self):
+        """
+        Tests if incremental refresh only recomputes products of new orders
+        """
+        self.create_order(0, 0, 3)
+        self.service.rebuild()
+
+        # favourites are left for the next rebuild
+        FavouriteItem.objects.create(user=self.users[2], product=self.products[1])
+        FavouriteItem.objects.create(user=self.users[2], product=self.products[2])
+
+        self.create_order(1, 0, 4)
+        self.create_order(1, 0, 4)
+
+        refresh = self.service.refresh_from_new_orders()
+
+        self.assertFalse(refresh.is_full)
+        self.assertEqual(refresh.refreshed_products, 2)
+        self.assertEqual(self.get_recommended_ids(0), [self.products[4].id, self.products[3].id])
+        self.assertEqual(self.get_recommended_ids(4), [self.products[0].id])
+        self.assertEqual(self.get_recommended_ids(1), [])
+
+        refresh = self.service.refresh_from_new_orders()
+
+        self.assertEqual(refresh.refreshed_products, 0)
+
+    def test_incremental_refresh_rescans_overlap(self):
+        """
+        Tests if incremental refresh scores orders committed with ids below the last mark
+        """
+        self.create_order(0, 0, 3)
+        refresh = self.service.rebuild()
+
+        self.create_order(1, 0, 4)
+
+        # the order was still uncommitted when the last refresh took the mark
+        refresh.last_order_product_id = self.service.get_last_order_product_id()
+        refresh.save()
+
+        with patch.dict(RECOMMENDATION_CONFIG, {"REFRESH_OVERLAP": 0}):
+            self.service.refresh_from_new_orders()
+
+        self.assertEqual(self.get_recommended_ids(4), [])
+
+        self.service.refresh_from_new_orders()
+
+        self.assertEqual(self.get_recommended_ids(4), [self.products[0].id])
+
+    def test_incremental_refresh_without_refreshes_rebuilds(self):
+        """
+        Tests if the first incremental refresh is a full one
+        """
+        self.create_order(0, 0, 3)
+
+        refresh = self.service.refresh_from_new_orders()
+
+        self.assertTrue(refresh.is_full)
+        self.assertEqual(self.get_recommended_ids(3), [self.products[0].id])
+
+    def test_related_products_served_from_recommendations(self):
+        """
+        Tests if related products api picks the stored neighbours and serves them in one query
+        """
+        self.create_order(0, 0, 4, 5)
+        self.create_order(1, 0, 5)
+        self.service.rebuild()
+
+        with self.assertNumQueries(2):
+            res = self.client.get(get_related_products_url(self.products[0].id))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([product["id"] for product in res.data], [self.products[5].id, self.products[4].id])
+
+        res = self.client.get(get_related_products_url(self.products[0].id) + "?limit=1")
+
+        self.assertEqual([product["id"] for product in res.data], [self.products[5].id])
+
+    def test_related_products_page_past_recommendations_not_found(self):
+        """
+        Tests if pages after the last recommendation don't fall back to the category
+        """
+        self.create_order(0, 0, 4, 5)
+        self.create_order(1, 0, 5)
+        self.service.rebuild()
+
+        cursor = encode_cursor(["recommendation_rank", "pk"], [2, self.products[4].id])
+
+        res = self.client.get(get_related_products_url(self.products[0].id), {"cursor": cursor, "limit": 2})
+
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+
+    async def test_async_related_products_page_past_recommendations_not_found(self):
+        """
+        Tests if async pages after the last recommendation don't fall back to the category
+        """
+        await sync_to_async(self.create_order)(0, 0, 4, 5)
+        await sync_to_async(self.service.rebuild)()
+
+        view = AsyncRelatedProductsView.as_view(fallback=get_route_view(products_router, "product-get-related-products"))
+        cursor = encode_cursor(["recommendation_rank", "pk"], [2, self.products[5].id])
+
+        with patch.object(
+            ProductRecommendationService, "get_same_category", wraps=self.service.get_same_category
+        ) as get_same_category:
+            res = await view(AsyncRequestFactory().get("/", {"cursor": cursor}), pk=str(self.products[0].id))
+
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        get_same_category.assert_not_called()
+
+    def test_related_products_category_fallback(self):
+        """
+        Tests if products without recommendations get their category best sellers
+        """
+        self.service.rebuild()
+
+        res = self.client.get(get_related_products_url(self.products[0].id))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([product["id"] for product in res.data], [self.products[2].id, self.products[1].id])
+
+    def test_related_products_no_existing_product(self):
+        """
+        Tests if related products of no existent products are not found
+        """
+        res = self.client.get(get_related_products_url(0))
+
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_rebuild_product_recommendations_command_successful(self):
+        """
+        Tests if the command rebuilds or refreshes recommendations
+        """
+        self.create_order(0, 0, 3)
+
+        out = StringIO()
+        call_command("rebuild_product_recommendations", stdout=out)
+
+        self.assertIn("Full refresh of 2 products", out.getvalue())
+
+        self.create_order(1, 1, 2)
+
+        out = StringIO()
+        call_command("rebuild_product_recommendations", "--incremental", stdout=out)
+
+        self.assertIn("Incremental refresh of 4 products", out.getvalue())  # the first order is in the overlap
+        self.assertEqual(ProductRecommendationRefresh.objects.count(), 2)
+        self.assertEqual(self.get_recommended_ids(1), [self.products[2].id])
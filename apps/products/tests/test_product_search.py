@@ -0,0 +1,150 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from apps.products.meta import get_app_model
+from apps.products.utils.services.search_service import ProductSearchService
+from db.models import Category
+
+PRODUCTS_LIST_URL = reverse("api:product-list")  # products list api url
+
+
+def get_search_url(value):
+    """
+    Gets the search url
+    """
+    return PRODUCTS_LIST_URL + f"?search={value}"
+
+
+class ProductSearchTests(TestCase):
+    """
+    Tests product full text search
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.model = get_app_model()  # product model
+
+        self.service = ProductSearchService()
+
+        self.category = Category.objects.create(title="Keyboards")
+
+        self.mock_product = {
+            "title": "Test title",
+            "description": "Test description",
+            "price": 1111,
+            "images": [
+                "testimgurl.com/1",
+                "testimgurl.com/2",  # Mock product data
+                "testimgurl.com/3",
+            ],
+            "stock": 11,
+            "category": self.category,
+            "sold": 11,
+        }
+
+    def get_ids(self, res):
+        """
+        Gets the product ids of the response
+        """
+        return [product["id"] for product in res.data["data"]]
+
+    def test_search_vector_created_with_product_successful(self):
+        """
+        Tests if product search document is filled on creation
+        """
+        product = self.model.objects.create(**self.mock_product)
+
+        product.refresh_from_db()
+
+        self.assertIn("keyboards", product.search_vector)
+        self.assertIn("title", product.search_vector)
+
+    def test_search_vector_updated_with_category_title_successful(self):
+        """
+        Tests if product search document follows its category title
+        """
+        product = self.model.objects.create(**self.mock_product)
+
+        self.category.title = "Mouses"
+        self.category.save()
+
+        res = self.client.get(get_search_url("mouses"))
+
+        self.assertEqual(self.get_ids(res), [product.id])
+
+    def test_search_prefix_terms_successful(self):
+        """
+        Tests if search matches partial words
+        """
+        product = self.model.objects.create(**{**self.mock_product, "title": "Mechanical keyboard"})
+
+        res = self.client.get(get_search_url("mechan keyb"))
+
+        self.assertEqual(self.get_ids(res), [product.id])
+
+    def test_search_ranks_title_over_description_successful(self):
+        """
+        Tests if title matches are ranked over description matches
+        """
+        description_product = self.model.objects.create(
+            **{**self.mock_product, "title": "Test title 1", "description": "Wireless mouse"}
+        )
+        title_product = self.model.objects.create(**{**self.mock_product, "title": "Wireless headset"})
+
+        res = self.client.get(get_search_url("wireless"))
+
+        self.assertEqual(self.get_ids(res), [title_product.id, description_product.id])
+
+    def test_search_ranks_sold_products_first_successful(self):
+        """
+        Tests if equally relevant products are ranked by sold units
+        """
+        first_product = self.model.objects.create(**{**self.mock_product, "title": "Gaming chair 1", "sold": 1})
+        second_product = self.model.objects.create(
+            **{**self.mock_product, "title": "Gaming chair 2", "sold": 1000}
+        )
+
+        res = self.client.get(get_search_url("gaming chair"))
+
+        self.assertEqual(self.get_ids(res), [second_product.id, first_product.id])
+
+    def test_search_fallback_without_trigram_successful(self):
+        """
+        Tests if search falls back to substring search without pg_trgm
+        """
+        product = self.model.objects.create(**{**self.mock_product, "title": "Headset"})
+
+        with patch.object(self.service, "has_trigram", False):
+            res = self.client.get(get_search_url("eadse"))
+
+        self.assertEqual(self.get_ids(res), [product.id])
+
+    def test_search_fallback_typos_successful(self):
+        """
+        Tests if search finds products with typos in the searched title
+        """
+        if not self.service.is_trigram_available():
+            self.skipTest("pg_trgm is not installed")
+
+        product = self.model.objects.create(**{**self.mock_product, "title": "Headset"})
+
+        res = self.client.get(get_search_url("headsret"))
+
+        self.assertEqual(self.get_ids(res), [product.id])
+
+    def test_search_without_results_successful(self):
+        """
+        Tests if search returns no content without matches
+        """
+        self.model.objects.create(**self.mock_product)
+
+        with patch.object(self.service, "has_trigram", False):
+            res = self.client.get(get_search_url("nothing"))
+
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
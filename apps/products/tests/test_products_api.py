@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
@@ -898,6 +900,94 @@ class PublicProductsAPITests(TestCase):
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
 
+    def test_products_limit_filter_next_cursor_successful(self):
+        """
+        Tests if products list with limit returns the next page cursor
+        """
+        first_new_product = self.model.objects.create(**{**self.mock_product, "title": "Test First New Product"})
+        second_new_product = self.model.objects.create(**{**self.mock_product, "title": "Test Second New Product"})
+
+        res = self.client.get(get_filter_url("limit", "2"))
+
+        self.assertEqual(res.data["results"], 3)
+        self.assertTrue(res.data["next_cursor"])
+
+        next_page_url = get_filter_url("limit", "2") + f"&cursor={res.data['next_cursor']}"
+
+        res = self.client.get(next_page_url)
+
+        self.assertNotContains(res, self.product)
+        self.assertNotContains(res, first_new_product)
+        self.assertContains(res, second_new_product)
+
+        self.assertEqual(res.data["results"], 3)
+        self.assertIsNone(res.data["next_cursor"])
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_products_cursor_filter_with_order_successful(self):
+        """
+        Tests if cursor pages follow the active order filter
+        """
+        first_new_product = self.model.objects.create(
+            **{**self.mock_product, "title": "Test First New Product", "price": 1113}
+        )
+        second_new_product = self.model.objects.create(
+            **{**self.mock_product, "title": "Test Second New Product", "price": 1112}
+        )
+
+        order_filter_url = get_filter_url("price_order", "desc") + "&limit=1"
+
+        res = self.client.get(order_filter_url)
+
+        self.assertEqual(res.data["data"][0]["id"], first_new_product.id)
+
+        res = self.client.get(order_filter_url + f"&cursor={res.data['next_cursor']}")
+
+        self.assertEqual(res.data["data"][0]["id"], second_new_product.id)
+
+        res = self.client.get(order_filter_url + f"&cursor={res.data['next_cursor']}")
+
+        self.assertEqual(res.data["data"][0]["id"], self.product.id)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_products_cursor_filter_order_mismatch_reject(self):
+        """
+        Tests if a cursor can't be used with other order filter
+        """
+        self.model.objects.create(**{**self.mock_product, "title": "Test First New Product"})
+
+        res = self.client.get(get_filter_url("price_order", "desc") + "&limit=1")
+
+        cursor_url = get_filter_url("title_order", "asc") + f"&limit=1&cursor={res.data['next_cursor']}"
+
+        res = self.client.get(cursor_url)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_products_cursor_filter_invalid_cursor_reject(self):
+        """
+        Tests if api rejects an invalid cursor
+        """
+        res = self.client.get(get_filter_url("cursor", "invalid-cursor"))
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_products_list_estimated_results_successful(self):
+        """
+        Tests if unfiltered results use the table estimate above threshold
+        """
+        with patch.dict("apps.api_root.pagination.PAGINATION_CONFIG", {"ESTIMATED_COUNT_THRESHOLD": 100}), \
+                patch("apps.api_root.pagination.get_estimated_count", return_value=500000):
+            res = self.client.get(PRODUCTS_LIST_URL)
+
+            self.assertEqual(res.data["results"], 500000)
+
+            res = self.client.get(get_filter_url("title", "Test title"))
+
+            self.assertEqual(res.data["results"], 1)
+
 
 class PrivateUserProductsAPITests(TestCase):
     """
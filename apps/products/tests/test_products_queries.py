@@ -0,0 +1,162 @@
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from apps.api_root.tests.utils import assert_constant_query_count
+from apps.products.filters import ProductsFilterSet
+from apps.products.meta import get_app_model
+from apps.products.utils.services.search_service import ProductSearchService
+from db.models import Category
+
+PRODUCTS_LIST_URL = reverse("api:product-list")  # products list api url
+
+
+class ProductsQueryCountTests(TestCase):
+    """
+    Tests products api query count does not grow with page size
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.model = get_app_model()
+
+        self.created = 0
+
+        self.mock_product = {
+            "title": "Test title",
+            "description": "Test description",
+            "price": 1111,
+            "images": [
+                "testimgurl.com/1",
+                "testimgurl.com/2",  # Mock product data
+                "testimgurl.com/3",
+            ],
+            "stock": 11,
+            "sold": 11,
+        }
+
+        self.product = self.create_products(1)[0]
+
+    def create_products(self, quantity: int):
+        """
+        Creates products, each one in its own category
+        """
+        product_list = []
+
+        for _ in range(quantity):
+            self.created += 1
+
+            category = Category.objects.create(title=f"Test Category {self.created}")
+
+            product = self.model.objects.create(
+                **{**self.mock_product, "title": f"Test title {self.created}", "category": category}
+            )
+            product_list.append(product)
+
+        return product_list
+
+    def create_related_products(self, quantity: int):
+        """
+        Creates products in the same category of the main product
+        """
+        for _ in range(quantity):
+            self.created += 1
+
+            self.model.objects.create(
+                **{**self.mock_product, "title": f"Test title {self.created}", "category": self.product.category}
+            )
+
+    def test_products_list_query_count_successful(self):
+        """
+        Tests if products list query count is constant
+        """
+        res = assert_constant_query_count(self, PRODUCTS_LIST_URL, self.create_products)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_products_detail_query_count_successful(self):
+        """
+        Tests if products detail query count is constant
+        """
+        detail_url = reverse("api:product-detail", kwargs={"pk": self.product.id})
+
+        res = assert_constant_query_count(self, detail_url, self.create_products)
+
+        self.assertEqual(res.data["category"], self.product.category.title)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_related_products_query_count_successful(self):
+        """
+        Tests if related products query count is constant
+        """
+        related_url = reverse("api:product-get-related-products", kwargs={"pk": self.product.id})
+
+        res = assert_constant_query_count(self, related_url, self.create_related_products, sizes=(1, 8))
+
+        self.assertEqual(len(res.data), 9)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+
+class ProductsFilterPlanTests(TestCase):
+    """
+    Tests products filters are planned over indexes
+    """
+
+    def setUp(self):
+        self.model = get_app_model()
+
+        category = Category.objects.create(title="Keyboards")
+
+        mock_product = {
+            "description": "Test description",
+            "price": 1111,
+            "images": ["testimgurl.com/1"],
+            "stock": 11,
+            "category": category,
+            "sold": 11,
+        }
+
+        self.model.objects.bulk_create(
+            [self.model(**mock_product, title=f"Test keyboard {index}") for index in range(50)]
+        )
+
+        # tables are tiny, sequential scans must be discarded to see the usable indexes
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE db_product")
+            cursor.execute("SET enable_seqscan = off")
+
+        self.addCleanup(self.reset_seqscan)
+
+    @staticmethod
+    def reset_seqscan():
+        with connection.cursor() as cursor:
+            cursor.execute("RESET enable_seqscan")
+
+    def test_category_filter_uses_index_without_join_successful(self):
+        """
+        Tests if category filter is resolved to ids and scans the category index
+        """
+        filterset = ProductsFilterSet(data={}, queryset=self.model.objects.all())
+
+        with self.assertNumQueries(1):  # category tree load
+            queryset = filterset.query_category(self.model.objects.all(), "category", "keyboards")
+
+        plan = queryset.explain()
+
+        self.assertIn("db_product_category_id", plan)
+        self.assertNotIn("db_category", plan)
+
+    def test_title_filter_uses_trigram_index_successful(self):
+        """
+        Tests if title filter scans the trigram index
+        """
+        if not ProductSearchService().is_trigram_available():
+            self.skipTest("pg_trgm is not installed")
+
+        plan = self.model.objects.filter(title__icontains="keyboard 1").explain()
+
+        self.assertIn("db_product_title_trgm", plan)
@@ -0,0 +1,72 @@
+from io import StringIO
+
+from django.test import TestCase
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+
+from apps.products.meta import get_app_model
+from db.models import Category, Comment
+
+
+class RebuildProductRatesCommandTests(TestCase):
+    """
+    Tests rebuild_product_rates command
+    """
+
+    def setUp(self):
+        self.model = get_app_model()
+
+        category = Category.objects.create(title="TestCategory")
+
+        self.mock_product = {
+            "title": "Test title",
+            "description": "Test description",
+            "price": 1111,
+            "images": [
+                "testimgurl.com/1",
+                "testimgurl.com/2",
+                "testimgurl.com/3",
+            ],
+            "stock": 11,
+            "category": category,
+            "sold": 11,
+        }
+
+        self.product = self.model.objects.create(**self.mock_product)
+        self.no_comments_product = self.model.objects.create(**{**self.mock_product, "title": "Test title 2"})
+
+        user = get_user_model().objects.create_user(email="testuser@test.com")
+
+        mock_comment = {
+            "user": user,
+            "product": self.product,
+            "subject": "Test comment subject",
+            "content": "Test comment content",
+        }
+
+        Comment.objects.create(**mock_comment, rate=4.3)
+        Comment.objects.create(**mock_comment, rate=2.4)
+
+    def test_rebuild_product_rates_successful(self):
+        """
+        Tests if command rebuilds stale product rate aggregates
+        """
+        self.model.objects.update(rate_sum=100, rate_count=100, rate=1)
+
+        out = StringIO()
+
+        with self.assertNumQueries(1):
+            call_command("rebuild_product_rates", stdout=out)
+
+        self.product.refresh_from_db()
+        self.no_comments_product.refresh_from_db()
+
+        self.assertAlmostEqual(self.product.rate_sum, 6.7)
+        self.assertEqual(self.product.rate_count, 2)
+        self.assertEqual(self.product.rate, 3.35)
+
+        self.assertEqual(self.no_comments_product.rate_sum, 0)
+        self.assertEqual(self.no_comments_product.rate_count, 0)
+        self.assertEqual(self.no_comments_product.rate, 5)
+
+        self.assertIn("2 products", out.getvalue())
@@ -1,3 +1,25 @@
+from django.urls import re_path
+
+from apps.api_root.async_views import get_route_view
+from core.settings.base import ASYNC_CONFIG
 from .routers import router
+from .views.async_views import AsyncProductsListView, AsyncProductDetailView, AsyncRelatedProductsView
 
 urlpatterns = router.urls
+
+if ASYNC_CONFIG["ENABLED"]:
+    # async read paths, routed before the viewset ones
+    urlpatterns = [
+        re_path(
+            r"^products/$",
+            AsyncProductsListView.as_view(fallback=get_route_view(router, "product-list")),
+        ),
+        re_path(
+            r"^products/(?P<pk>[^/.]+)/$",
+            AsyncProductDetailView.as_view(fallback=get_route_view(router, "product-detail")),
+        ),
+        re_path(
+            r"^products/(?P<pk>[^/.]+)/related-products/$",
+            AsyncRelatedProductsView.as_view(fallback=get_route_view(router, "product-get-related-products")),
+        ),
+    ] + urlpatterns
@@ -0,0 +1,153 @@
+from django.core.cache import cache
+
+from apps.api_root.renderers import FastJSONRenderer
+from apps.api_root.utils import plan_queryset
+from core.settings.base import RESPONSE_CACHE_CONFIG
+
+
+class ProductFragmentService:
+    """
+    Pre-rendered product representation service
+
+    Fragments are keyed by product id and version, a changed product gets a new
+    key, so stale fragments are never read and expire by themselves
+    """
+    __instance = None
+
+    cache_key = "products:fragment:{id}:{version}"
+
+    def __new__(cls, *args, **kwargs):
+        if not ProductFragmentService.__instance:
+            ProductFragmentService.__instance = object.__new__(cls)
+        return ProductFragmentService.__instance
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """
+        Checks if lists are assembled from fragments
+        """
+        return RESPONSE_CACHE_CONFIG.get("FRAGMENTS_ENABLED", True)
+
+    def get_key(self, product_id: int, version: int) -> str:
+        """
+        Gets the cache key of a product fragment
+        """
+        return self.cache_key.format(id=product_id, version=version)
+
+    def get_page_queryset(self, queryset, ordering: list):
+        """
+        Gets the products page queryset loading only ids, versions and order fields
+
+        Args:
+            queryset(QuerySet): filtered products
+            ordering(list<str>): active order fields
+
+        Returns:
+            page queryset
+        """
+        fields = {"id", "version"}
+
+        for field in ordering or []:
+            name = field.lstrip("-")
+
+            if name in {f.name for f in queryset.model._meta.concrete_fields}:
+                fields.add(name)
+
+        return queryset.select_related(None).only(*fields)
+
+    def get_page(self, queryset, ordering: list):
+        """
+        Evaluates the products page loading only ids, versions and order fields
+        """
+        return list(self.get_page_queryset(queryset, ordering))
+
+    async def aget_page(self, queryset, ordering: list):
+        """
+        Evaluates the products page loading only ids, versions and order fields
+        """
+        return [product async for product in self.get_page_queryset(queryset, ordering)]
+
+    def render(self, products, serializer_class) -> dict:
+        """
+        Renders products representation
+
+        Args:
+            products(list<Product>): products to render
+            serializer_class(Serializer): product serializer
+
+        Returns:
+            dict with rendered fragments by cache key
+        """
+        renderer = FastJSONRenderer()
+
+        return {
+            self.get_key(product.id, product.version): renderer.render(serializer_class(product).data)
+            for product in products
+        }
+
+    def get_missing_queryset(self, serializer_class, missing_ids: list):
+        """
+        Gets the queryset of the products to render
+        """
+        queryset = plan_queryset(serializer_class.Meta.model.objects.all(), serializer_class)
+
+        return queryset.only("version", *serializer_class.Meta.only_fields).filter(pk__in=missing_ids)
+
+    def merge(self, page: list, keys: list, fragments: dict, products: dict, rendered: dict) -> list:
+        """
+        Merges cached and rendered fragments in page order
+
+        A product changed after the page was read is served with its new version
+        """
+        for product, key in zip(page, keys):
+            if key not in fragments and product.id in products:
+                fragments[key] = rendered[self.get_key(product.id, products[product.id].version)]
+
+        return [fragments[key] for key in keys if key in fragments]
+
+    def get_fragments(self, page: list, serializer_class) -> list:
+        """
+        Gets the rendered fragments of the page, misses are rendered from one query
+
+        Args:
+            page(list<Product>): products with id and version
+            serializer_class(Serializer): product serializer
+
+        Returns:
+            fragments list in page order
+        """
+        keys = [self.get_key(product.id, product.version) for product in page]
+
+        fragments = cache.get_many(keys)
+
+        missing_ids = [product.id for product, key in zip(page, keys) if key not in fragments]
+        products, rendered = {}, {}
+
+        if missing_ids:
+            products = {product.id: product for product in self.get_missing_queryset(serializer_class, missing_ids)}
+
+            rendered = self.render(products.values(), serializer_class)
+            cache.set_many(rendered, RESPONSE_CACHE_CONFIG.get("FRAGMENT_TIMEOUT", None))
+
+        return self.merge(page, keys, fragments, products, rendered)
+
+    async def aget_fragments(self, page: list, serializer_class) -> list:
+        """
+        Gets the rendered fragments of the page with the async cache and ORM
+        """
+        keys = [self.get_key(product.id, product.version) for product in page]
+
+        fragments = await cache.aget_many(keys)
+
+        missing_ids = [product.id for product, key in zip(page, keys) if key not in fragments]
+        products, rendered = {}, {}
+
+        if missing_ids:
+            products = {
+                product.id: product async for product in self.get_missing_queryset(serializer_class, missing_ids)
+            }
+
+            rendered = self.render(products.values(), serializer_class)
+            await cache.aset_many(rendered, RESPONSE_CACHE_CONFIG.get("FRAGMENT_TIMEOUT", None))
+
+        return self.merge(page, keys, fragments, products, rendered)
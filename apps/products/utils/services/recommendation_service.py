@@ -0,0 +1,221 @@
+from django.apps import apps
+from django.db import connection, transaction
+from django.db.models import F, Max, Subquery
+
+from core.settings.base import RECOMMENDATION_CONFIG
+
+
+class ProductRecommendationService:
+    """
+    Product recommendations service
+
+    Scores every pair of products bought in the same order or marked as
+    favourite by the same user, and keeps the top neighbours of each
+    product so related products are read with one indexed lookup
+    """
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if not ProductRecommendationService.__instance:
+            ProductRecommendationService.__instance = object.__new__(cls)
+        return ProductRecommendationService.__instance
+
+    @staticmethod
+    def get_model(model_name: str):
+        return apps.get_model("db", model_name)
+
+    def get_table(self, model_name: str) -> str:
+        """
+        Gets the quoted table name of entered model
+        """
+        return connection.ops.quote_name(self.get_model(model_name)._meta.db_table)
+
+    def get_last_order_product_id(self) -> int:
+        """
+        Gets the newest order product id
+        """
+        return self.get_model("OrderProduct").objects.aggregate(last_id=Max("pk"))["last_id"] or 0
+
+    def store_top_neighbours(self, product_ids: list = None) -> int:
+        """
+        Replaces the stored neighbours of entered products, or of every
+        product if they aren't entered, in a single insert
+
+        Args:
+            product_ids(list<int>): refreshed product ids
+
+        Returns:
+            stored recommendations
+        """
+        recommendation_model = self.get_model("ProductRecommendation")
+
+        product_filter = "TRUE" if product_ids is None else "a.product_id = ANY(%(product_ids)s)"
+
+        query = (
+            "WITH pairs AS ("
+            "SELECT a.product_id, b.product_id AS related_product_id, "
+            "COUNT(DISTINCT a.order_id) * %(purchase_weight)s AS score "
+            f"FROM {self.get_table('OrderProduct')} AS a "
+            f"JOIN {self.get_table('OrderProduct')} AS b ON a.order_id = b.order_id AND a.product_id <> b.product_id "
+            f"WHERE {product_filter} GROUP BY a.product_id, b.product_id "
+            "UNION ALL "
+            "SELECT a.product_id, b.product_id AS related_product_id, "
+            "COUNT(DISTINCT a.user_id) * %(favourite_weight)s AS score "
+            f"FROM {self.get_table('FavouriteItem')} AS a "
+            f"JOIN {self.get_table('FavouriteItem')} AS b ON a.user_id = b.user_id AND a.product_id <> b.product_id "
+            f"WHERE {product_filter} GROUP BY a.product_id, b.product_id"
+            "), ranked AS ("
+            "SELECT product_id, related_product_id, SUM(score) AS score, "
+            "ROW_NUMBER() OVER ("
+            "PARTITION BY product_id ORDER BY SUM(score) DESC, related_product_id"
+            ") AS rank "
+            "FROM pairs GROUP BY product_id, related_product_id"
+            ") "
+            f"INSERT INTO {self.get_table('ProductRecommendation')} (product_id, related_product_id, score, rank) "
+            "SELECT product_id, related_product_id, score, rank FROM ranked WHERE rank <= %(top_k)s"
+        )
+
+        params = {
+            "product_ids": product_ids,
+            "purchase_weight": RECOMMENDATION_CONFIG["PURCHASE_WEIGHT"],
+            "favourite_weight": RECOMMENDATION_CONFIG["FAVOURITE_WEIGHT"],
+            "top_k": RECOMMENDATION_CONFIG["TOP_K"],
+        }
+
+        with transaction.atomic():
+            if product_ids is None:
+                recommendation_model.objects.all().delete()
+            else:
+                recommendation_model.objects.filter(product_id__in=product_ids).delete()
+
+            with connection.cursor() as cursor:
+                cursor.execute(query, params)
+                return cursor.rowcount
+
+    def rebuild(self):
+        """
+        Recomputes the neighbours of every product
+
+        Returns:
+            refresh log
+        """
+        with transaction.atomic():
+            last_order_product_id = self.get_last_order_product_id()
+
+            self.store_top_neighbours()
+
+            return self.get_model("ProductRecommendationRefresh").objects.create(
+                last_order_product_id=last_order_product_id,
+                is_full=True,
+                refreshed_products=self.get_model("ProductRecommendation").objects.values("product").distinct().count(),
+            )
+
+    def refresh_from_new_orders(self):
+        """
+        Recomputes only the neighbours of products in orders created after
+        the last refresh, every new pair has both products in a new order.
+        Favourite changes are scored by the next rebuild
+
+        Order products are found by id, and an order committed after a
+        refresh may have ids below its mark. The last 'REFRESH_OVERLAP' ids
+        below the mark are scanned again to catch them, only a full rebuild
+        scores orders committed later than that
+
+        Returns:
+            refresh log
+        """
+        refresh_model = self.get_model("ProductRecommendationRefresh")
+        order_product_model = self.get_model("OrderProduct")
+
+        last_refresh = refresh_model.objects.order_by("-pk").first()
+
+        if not last_refresh:
+            return self.rebuild()
+
+        with transaction.atomic():
+            last_order_product_id = self.get_last_order_product_id()
+
+            first_order_product_id = last_refresh.last_order_product_id - RECOMMENDATION_CONFIG["REFRESH_OVERLAP"]
+
+            new_orders = order_product_model.objects.filter(
+                pk__gt=first_order_product_id, pk__lte=last_order_product_id
+            ).values("order_id")
+
+            product_ids = list(
+                order_product_model.objects.filter(order_id__in=Subquery(new_orders))
+                .order_by()
+                .values_list("product_id", flat=True)
+                .distinct()
+            )
+
+            if product_ids:
+                self.store_top_neighbours(product_ids)
+
+            return refresh_model.objects.create(
+                last_order_product_id=max(last_order_product_id, last_refresh.last_order_product_id),
+                is_full=False,
+                refreshed_products=len(product_ids),
+            )
+
+    @staticmethod
+    def get_recommended(queryset, product_id):
+        """
+        Gets the stored neighbours of entered product, best first
+
+        Args:
+            queryset(QuerySet): products queryset
+            product_id(int): recommended product id
+
+        Returns:
+            filtered queryset
+        """
+        return (
+            queryset.filter(recommended_for__product_id=product_id)
+            .annotate(recommendation_rank=F("recommended_for__rank"))
+            .order_by("recommendation_rank")
+        )
+
+    def get_same_category(self, queryset, product_id):
+        """
+        Gets the other products of the category of entered product, best sellers first
+
+        Args:
+            queryset(QuerySet): products queryset
+            product_id(int): recommended product id
+
+        Returns:
+            filtered queryset
+        """
+        category_id = self.get_model("Product").objects.filter(pk=product_id).values("category_id")[:1]
+
+        return queryset.filter(category_id=Subquery(category_id)).exclude(pk=product_id).order_by("-sold", "pk")
+
+    def get_related(self, queryset, product_id):
+        """
+        Gets the stored neighbours of entered product, or the other products
+        of its category when it has no recommendations yet
+
+        The source is picked before the request filters, so filters or
+        offsets that skip every recommendation give an empty page instead
+        of falling back to the category
+
+        Args:
+            queryset(QuerySet): products queryset
+            product_id(int): recommended product id
+
+        Returns:
+            filtered queryset
+        """
+        if self.get_model("ProductRecommendation").objects.filter(product_id=product_id).exists():
+            return self.get_recommended(queryset, product_id)
+
+        return self.get_same_category(queryset, product_id)
+
+    async def aget_related(self, queryset, product_id):
+        """
+        Gets the related products of entered product without blocking the event loop
+        """
+        if await self.get_model("ProductRecommendation").objects.filter(product_id=product_id).aexists():
+            return self.get_recommended(queryset, product_id)
+
+        return self.get_same_category(queryset, product_id)
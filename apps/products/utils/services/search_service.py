@@ -0,0 +1,141 @@
+import re
+
+from django.apps import apps
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramWordSimilarity
+from django.db import connection
+from django.db.models import F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Log
+
+from core.settings.base import SEARCH_CONFIG
+
+SEARCH_TERM_PATTERN = re.compile(r"\w+")
+
+
+class ProductSearchService:
+    """
+    Product full text search service
+    """
+    __instance = None
+
+    has_trigram = None
+
+    def __new__(cls, *args, **kwargs):
+        if not ProductSearchService.__instance:
+            ProductSearchService.__instance = object.__new__(cls)
+        return ProductSearchService.__instance
+
+    @staticmethod
+    def get_language():
+        """
+        Returns the text search configuration
+        """
+        return SEARCH_CONFIG.get("LANGUAGE", "simple")
+
+    def get_search_vector(self):
+        """
+        Gets the weighted product document, title > category > description
+
+        Category title is read with a subquery so the expression can be used in updates
+        """
+        category_title = Subquery(
+            apps.get_model("db", "Category").objects.filter(pk=OuterRef("category_id")).values("title")[:1]
+        )
+
+        return (
+            SearchVector("title", weight="A", config=self.get_language())
+            + SearchVector(category_title, weight="B", config=self.get_language())
+            + SearchVector("description", weight="C", config=self.get_language())
+        )
+
+    def update_vectors(self, queryset):
+        """
+        Updates the search document of the entered products in one statement
+
+        Args:
+            queryset(QuerySet): products to update
+
+        Returns:
+            updated products
+        """
+        return queryset.update(search_vector=self.get_search_vector())
+
+    def get_search_query(self, value: str):
+        """
+        Gets a prefix query with every entered term, so partial words match while typing
+
+        Args:
+            value(str): searched text
+
+        Returns:
+            SearchQuery or None if there aren't terms
+        """
+        terms = SEARCH_TERM_PATTERN.findall(value.lower())
+
+        if not terms:
+            return None
+
+        raw_query = " & ".join(f"{term}:*" for term in terms)
+
+        return SearchQuery(raw_query, search_type="raw", config=self.get_language())
+
+    def is_trigram_available(self) -> bool:
+        """
+        Checks once if pg_trgm extension is installed
+        """
+        if self.has_trigram is None:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                self.has_trigram = cursor.fetchone() is not None
+
+        return self.has_trigram
+
+    def search(self, queryset, value: str):
+        """
+        Searches products ranked by relevance and sold units
+
+        Falls back to trigram similarity of the title when no product matches,
+        or to a substring search when pg_trgm is not installed
+
+        Args:
+            queryset(QuerySet): products queryset
+            value(str): searched text
+
+        Returns:
+            ordered queryset
+        """
+        search_query = self.get_search_query(value)
+
+        if search_query is not None:
+            products = queryset.filter(search_vector=search_query)
+
+            if products.exists():
+                # every order of magnitude in sold units adds one time the rank
+                return products.annotate(
+                    search_rank=SearchRank(F("search_vector"), search_query) * Log(Value(10), F("sold") + 10)
+                ).order_by("-search_rank", "-sold")
+
+        return self.fallback_search(queryset, value)
+
+    def fallback_search(self, queryset, value: str):
+        """
+        Searches products with typos in their title
+
+        Args:
+            queryset(QuerySet): products queryset
+            value(str): searched text
+
+        Returns:
+            ordered queryset
+        """
+        if not self.is_trigram_available():
+            return queryset.filter(
+                Q(title__icontains=value)
+                | Q(description__icontains=value)
+                | Q(category__title__icontains=value)
+            ).order_by("-sold")
+
+        return (
+            queryset.annotate(search_similarity=TrigramWordSimilarity(value, "title"))
+            .filter(search_similarity__gt=SEARCH_CONFIG.get("TRIGRAM_THRESHOLD", 0.3))
+            .order_by("-search_similarity", "-sold")
+        )
@@ -0,0 +1,138 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import HttpResponse
+
+from apps.api_root.async_views import AsyncReadView, Delegate
+from apps.api_root.pagination import get_next_cursor
+from apps.api_root.response_cache import cache_async_response
+from apps.api_root.responses import render_fragments
+from apps.api_root.utils import plan_queryset
+from apps.products.filters import ProductsFilterSet, RelatedProductsFilterset
+from apps.products.serializers import ProductSerializer
+from apps.products.utils.services.fragment_service import ProductFragmentService
+from apps.products.utils.services.recommendation_service import ProductRecommendationService
+from db.models import Category, Comment
+
+
+class AsyncProductsView(AsyncReadView):
+    """
+    Products async read path
+    """
+
+    serializer_class = ProductSerializer
+
+    def get_queryset(self):
+        """
+        Gets the products queryset planned by the serializer
+        """
+        return plan_queryset(self.serializer_class.Meta.model.objects.all(), self.serializer_class)
+
+
+class AsyncProductsListView(AsyncProductsView):
+    """
+    Products list async read path
+    """
+
+    filterset_class = ProductsFilterSet
+
+    fragment_service = ProductFragmentService()
+
+    @cache_async_response(ProductSerializer.Meta.model, Category, Comment)
+    async def get(self, request, *args, **kwargs):
+        """
+        Gets products and results quantity
+        """
+        filter_data = await self.filter_queryset(request, self.get_queryset())
+
+        products = filter_data["queryset"]
+        fragments_enabled = self.fragment_service.is_enabled()
+
+        if fragments_enabled:
+            page = await self.fragment_service.aget_page(products, filter_data["ordering"])
+        else:
+            page = [product async for product in products]
+
+        if not page:
+            return self.render({"results": 0, "message": "Not found products."}, status=204)
+
+        export_data = {
+            "results": filter_data["results"],
+            "data": None,
+            "next_cursor": get_next_cursor(page, filter_data["ordering"], filter_data["limit"]),
+        }
+
+        if fragments_enabled:
+            fragments = await self.fragment_service.aget_fragments(page, self.serializer_class)
+
+            return HttpResponse(
+                render_fragments(export_data, "data", fragments), content_type=self.renderer.media_type
+            )
+
+        export_data["data"] = self.serializer_class(page, many=True).data
+
+        return self.render(export_data)
+
+
+class AsyncProductDetailView(AsyncProductsView):
+    """
+    Product detail async read path
+    """
+
+    @cache_async_response(ProductSerializer.Meta.model, Category, Comment)
+    async def get(self, request, pk, *args, **kwargs):
+        """
+        Gets product detail
+        """
+        if request.GET:
+            raise Delegate  # the viewset filters detail lookups too
+
+        try:
+            product = await self.get_queryset().filter(pk=pk).afirst()
+        except (ValueError, TypeError, DjangoValidationError):
+            raise Delegate
+
+        if product is None:
+            raise Delegate
+
+        return self.render(self.serializer_class(product).data)
+
+
+class AsyncRelatedProductsView(AsyncProductsView):
+    """
+    Related products async read path
+    """
+
+    filterset_class = RelatedProductsFilterset
+
+    recommendation_service = ProductRecommendationService()
+
+    async def get_related_page(self, request, queryset):
+        """
+        Gets the filtered related products or the first ten
+        """
+        if request.GET:
+            queryset = (await self.filter_queryset(request, queryset))["queryset"]
+        else:
+            queryset = queryset[:10]
+
+        return [related_product async for related_product in queryset]
+
+    async def get(self, request, pk, *args, **kwargs):
+        """
+        Gets related products from pk
+
+        Precomputed recommendations are served, or products of the same
+        category when the product has none
+        """
+        try:
+            int(pk)
+        except ValueError:
+            raise Delegate
+
+        related_products = await self.get_related_page(
+            request, await self.recommendation_service.aget_related(self.get_queryset(), pk)
+        )
+
+        if related_products:
+            return self.render(self.serializer_class(related_products, many=True).data)
+
+        return self.render({"message": "Not found related products"}, status=204)
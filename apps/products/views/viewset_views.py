@@ -5,7 +5,12 @@ from rest_framework import status
 
 from apps.products.filters import ProductsFilterSet, RelatedProductsFilterset
 from apps.products.serializers import ProductSerializer
+from apps.products.utils.services.fragment_service import ProductFragmentService
+from apps.products.utils.services.recommendation_service import ProductRecommendationService
 from apps.api_root.utils import FilterMethodsViewset
+from apps.api_root.response_cache import cache_response
+from apps.api_root.responses import RenderedResponse, render_fragments
+from db.models import Category, Comment
 
 
 class ProductsViewSet(FilterMethodsViewset):
@@ -18,6 +23,11 @@ class ProductsViewSet(FilterMethodsViewset):
     serializer_class = ProductSerializer
     filterset_class = ProductsFilterSet
 
+    planned_actions = ("list", "retrieve", "get_related_products")
+
+    fragment_service = ProductFragmentService()
+    recommendation_service = ProductRecommendationService()
+
     def get_permissions(self):
         """
         Gets custom permission for the view
@@ -32,18 +42,23 @@ class ProductsViewSet(FilterMethodsViewset):
             permission_classes = [IsAuthenticated, IsAdminUser]
         return [permission() for permission in permission_classes]
 
+    @cache_response(ProductSerializer.Meta.model, Category, Comment)
     def list(self, request, *args, **kwargs):
         """
         Gets products and results quantity
         """
         products = self.filter_queryset(self.get_queryset())
 
+        if self.fragment_service.is_enabled() and request.accepted_renderer.format == "json":
+            return self.list_from_fragments(products)
+
         if products:
             serializer = self.serializer_class(products, many=True)
 
             export_data = {
                 "results": self.get_query_results(),
                 "data": serializer.data,
+                "next_cursor": self.get_next_cursor(products),
             }
 
             return Response(export_data, status=status.HTTP_200_OK)
@@ -53,6 +68,43 @@ class ProductsViewSet(FilterMethodsViewset):
             status=status.HTTP_204_NO_CONTENT,
         )
 
+    def list_from_fragments(self, products):
+        """
+        Gets products list assembled from pre-rendered products
+        """
+        page = self.fragment_service.get_page(products, self.ordering)
+
+        if page:
+            export_data = {
+                "results": self.get_query_results(),
+                "data": None,
+                "next_cursor": self.get_next_cursor(page),
+            }
+            fragments = self.fragment_service.get_fragments(page, self.serializer_class)
+
+            return RenderedResponse(render_fragments(export_data, "data", fragments), status=status.HTTP_200_OK)
+
+        return Response(
+            {"results": 0, "message": "Not found products."},
+            status=status.HTTP_204_NO_CONTENT,
+        )
+
+    @cache_response(ProductSerializer.Meta.model, Category, Comment)
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Gets product detail
+        """
+        return super().retrieve(request, *args, **kwargs)
+
+    def get_related_page(self, related_products):
+        """
+        Gets the filtered related products or the first ten
+        """
+        if self.request.query_params:
+            return self.filter_queryset(related_products)
+
+        return related_products[:10]
+
     @action(
         detail=True,
         methods=["get", "post"],
@@ -62,6 +114,9 @@ class ProductsViewSet(FilterMethodsViewset):
     def get_related_products(self, request, pk, *args, **kwargs):
         """
         Gets related products from pk
+
+        Precomputed recommendations are served, or products of the same
+        category when the product has none
         """
 
         if request.method == "GET":
@@ -74,20 +129,9 @@ class ProductsViewSet(FilterMethodsViewset):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            product = self.get_queryset().filter(pk=pk).first()
-
-            params = request.query_params
-
-            if params:
-                related_products = self.filter_queryset(
-                    self.get_queryset().filter(category=product.category).exclude(pk=pk)
-                )
-            else:
-                related_products = (
-                    self.get_queryset()
-                    .filter(category=product.category)
-                    .exclude(pk=pk)[:10]
-                )
+            related_products = self.get_related_page(
+                self.recommendation_service.get_related(self.get_queryset(), pk)
+            )
 
             if related_products:
                 serializer = self.serializer_class(related_products, many=True)
@@ -0,0 +1,35 @@
+from apps.api_root.async_views import AsyncReadView
+from apps.api_root.pagination import get_next_cursor
+from apps.api_root.response_cache import cache_async_response
+
+from .serializers import PromoSerializer
+from .filters import PromoFilterSet
+
+
+class AsyncPromosListView(AsyncReadView):
+    """
+    Promos list async read path
+    """
+
+    serializer_class = PromoSerializer
+    filterset_class = PromoFilterSet
+
+    @cache_async_response(PromoSerializer.Meta.model)
+    async def get(self, request, *args, **kwargs):
+        """
+        Returns promos list
+        """
+        filter_data = await self.filter_queryset(request, self.serializer_class.Meta.model.objects.all())
+
+        promos = [promo async for promo in filter_data["queryset"]]
+
+        if not promos:
+            return self.render({"message": "Not found promos."})
+
+        format_response = {
+            "results": filter_data["results"],
+            "data": self.serializer_class(promos, many=True).data,
+            "next_cursor": get_next_cursor(promos, filter_data["ordering"], filter_data["limit"]),
+        }
+
+        return self.render(format_response)
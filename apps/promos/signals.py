@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .meta import get_app_model
+from apps.api_root.response_cache import bump_version
+
+
+@receiver([post_save, post_delete], sender=get_app_model())
+def bump_promo_version(sender, **kwargs):
+    """
+    Discards the cached responses with promos
+    """
+    bump_version(sender)
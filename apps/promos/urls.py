@@ -1,3 +1,17 @@
+from django.urls import re_path
+
+from apps.api_root.async_views import get_route_view
+from core.settings.base import ASYNC_CONFIG
 from .routers import router
+from .async_views import AsyncPromosListView
 
 urlpatterns = router.urls
+
+if ASYNC_CONFIG["ENABLED"]:
+    # async read paths, routed before the viewset ones
+    urlpatterns = [
+        re_path(
+            r"^promos/$",
+            AsyncPromosListView.as_view(fallback=get_route_view(router, "promo-list")),
+        ),
+    ] + urlpatterns
@@ -3,6 +3,7 @@ from rest_framework.response import Response
 from rest_framework import status
 
 from apps.api_root.utils import FilterMethodsViewset
+from apps.api_root.response_cache import cache_response
 
 from .serializers import PromoSerializer
 from .filters import PromoFilterSet
@@ -28,6 +29,7 @@ class PromoAPIViewset(FilterMethodsViewset):
             permission_classes = [IsAuthenticated, IsAdminUser]
         return [permission() for permission in permission_classes]
 
+    @cache_response(PromoSerializer.Meta.model)
     def list(self, request, *args, **kwargs):
         """
         Returns Api list view
@@ -38,7 +40,8 @@ class PromoAPIViewset(FilterMethodsViewset):
 
             format_response = {
                 "results": self.get_query_results(),
-                "data": serializer.data
+                "data": serializer.data,
+                "next_cursor": self.get_next_cursor(promos)
             }
             return Response(format_response, status=status.HTTP_200_OK)
 
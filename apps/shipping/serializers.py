@@ -35,6 +35,29 @@ class ShippingInfoSerializer(serializers.ModelSerializer):
 
         return instance
 
+    def update(self, instance, validated_data):
+        """
+        Updates shipping info, selecting it through the manager to keep one selected by user
+
+        Args:
+            instance(ShippingInfo): instance to update
+            validated_data: data of shipping info
+
+        Returns:
+            updated instance
+        """
+        is_selected = validated_data.get("is_selected", False)
+
+        if is_selected:
+            del validated_data["is_selected"]  # deselecting is a plain update
+
+        instance = super().update(instance, validated_data)
+
+        if is_selected:
+            self.Meta.model.objects.select_shipping_info(instance)
+
+        return instance
+
     def validate_user(self, value):
         """
         Validates if user is creating own shipping info or is superuser
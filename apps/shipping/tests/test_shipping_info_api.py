@@ -624,6 +624,30 @@ class PrivateSuperuserShippingInfoAPITests(TestCase):
         self.assertEqual(self.shipping_info.receiver_dni, payload["receiver_dni"])
         self.assertEqual(self.shipping_info.address, payload["address"])
 
+    def test_ship_info_retrieve_view_superuser_patch_is_selected_successful(self):
+        """
+        Tests if superuser can select and deselect other user shipping info api
+        """
+        other_ship_info = self.model.objects.create(**self.mock_shipping_info)
+        self.model.objects.select_shipping_info(other_ship_info)
+
+        retrieve_url = get_shipping_info_url(self.shipping_info)
+
+        res = self.client.patch(retrieve_url, {"is_selected": True}, HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        other_ship_info.refresh_from_db()
+        self.assertFalse(other_ship_info.is_selected)
+
+        res = self.client.patch(retrieve_url, {"is_selected": False}, HTTP_AUTHORIZATION=f"Bearer {self.user_token}")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertFalse(res.data["is_selected"])
+
+        self.shipping_info.refresh_from_db()
+        self.assertFalse(self.shipping_info.is_selected)
+
     def test_ship_info_retrieve_view_superuser_delete_reject(self):
         """
         Tests if superuser can't delete retrieve shipping info api
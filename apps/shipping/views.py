@@ -3,13 +3,14 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework import status
 
+from apps.api_root.exports import StreamingExportMixin
 from apps.api_root.utils import FilterMethodsViewset
 
 from .serializers import ShippingInfoSerializer, MyInfoSerializer
 from .filters import ShippingInfoFilterset, MyInfoFilterset
 
 
-class ShippingInfoViewset(FilterMethodsViewset):
+class ShippingInfoViewset(StreamingExportMixin, FilterMethodsViewset):
     """
     Shipping Info Viewset
     """
@@ -43,12 +44,16 @@ class ShippingInfoViewset(FilterMethodsViewset):
         """
         ship_info_list = self.filter_queryset(self.get_queryset())
 
+        if self.is_export():
+            return self.export(ship_info_list)
+
         if ship_info_list:
             ship_info_serializer = self.serializer_class(ship_info_list, many=True)
 
             response_data = {
                 "results": self.get_query_results(),
-                "data": ship_info_serializer.data
+                "data": ship_info_serializer.data,
+                "next_cursor": self.get_next_cursor(ship_info_list)
             }
 
             return Response(response_data, status=status.HTTP_200_OK)
@@ -87,7 +92,8 @@ class ShippingInfoViewset(FilterMethodsViewset):
 
                 response_data = {
                     "results": self.get_query_results(),
-                    "data": serializer.data
+                    "data": serializer.data,
+                    "next_cursor": self.get_next_cursor(user_ship_info)
                 }
                 return Response(response_data, status=status.HTTP_200_OK)
             return Response({"message": "User has not shipping info."}, status=status.HTTP_404_NOT_FOUND)
@@ -81,7 +81,7 @@ class ResetPasswordSerializer(serializers.Serializer):
 
     def save(self, **kwargs):
         """
-        Sends an email for user to restart password
+        Queues an email for user to restart password
         """
         email = self.validated_data["email"]
 
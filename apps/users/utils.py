@@ -1,8 +1,8 @@
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
-from django.core.mail import send_mail
 
+from apps.customer_messages.utils.services.outbox_service import OutboxService
 from core.settings import base
 from .meta import get_app_model
 
@@ -26,7 +26,7 @@ def get_reset_password_url(email):
 
 def send_reset_password_url_to(email):
     """
-    Sends an email for a user with the reset password url
+    Queues an email for a user with the reset password url
     """
 
     RESET_URL = get_reset_password_url(email)
@@ -39,4 +39,4 @@ def send_reset_password_url_to(email):
 
     recipient_list = [email]
 
-    send_mail(subject, message, email_from, recipient_list)
+    OutboxService.enqueue(subject, message, email_from, recipient_list)
@@ -5,12 +5,13 @@ from rest_framework.response import Response
 from rest_framework import status
 
 from apps.api_root.permissions import IsOwnData
+from apps.api_root.exports import StreamingExportMixin
 from apps.api_root.utils import FilterMethodsViewset
 from apps.users.serializers import UserAccountSerializer
 from apps.users.filters import UserAccountFilterset
 
 
-class UserAccountViewset(FilterMethodsViewset):
+class UserAccountViewset(StreamingExportMixin, FilterMethodsViewset):
     """
     User Account Viewset
     """
@@ -57,12 +58,16 @@ class UserAccountViewset(FilterMethodsViewset):
         """
         users = self.filter_queryset(self.get_queryset())
 
+        if self.is_export():
+            return self.export(users)
+
         if users:
             serializer = self.serializer_class(users, many=True)
 
             export_data = {
                 "results": self.get_query_results(),
                 "data": serializer.data,
+                "next_cursor": self.get_next_cursor(users),
             }
 
             return Response(export_data, status=status.HTTP_200_OK)
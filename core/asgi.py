@@ -3,5 +3,6 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings.local")
+os.environ.setdefault("ASYNC_VIEWS_ENABLED", "True")  # catalogue reads are served by async views
 
 application = get_asgi_application()
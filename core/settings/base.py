@@ -35,6 +35,7 @@ ECOMMERCE_APPS = [
     "apps.shipping",
     "apps.favourites",
     "apps.promos",
+    "apps.customer_messages",
 ]
 
 THIRD_PARTY_APPS = [
@@ -49,6 +50,7 @@ THIRD_PARTY_APPS = [
 INSTALLED_APPS = DJANGO_APPS + PROJECT_APPS + ECOMMERCE_APPS + THIRD_PARTY_APPS
 
 MIDDLEWARE = [
+    "apps.api_root.middleware.ProfilingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.security.SecurityMiddleware",
@@ -121,6 +123,72 @@ REST_FRAMEWORK = {
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
+    "DEFAULT_RENDERER_CLASSES": (
+        "apps.api_root.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "apps.api_root.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+}
+
+CACHE_URL = env("CACHE_URL", default=None)  # redis url of the cache shared by every worker process
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": CACHE_URL,
+    }
+    if CACHE_URL
+    else {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",  # one cache by process
+    },
+}
+
+SHARED_CACHE = CACHE_URL is not None
+
+CATEGORY_TREE_CONFIG = {
+    "TIMEOUT": None if SHARED_CACHE else 30,  # seconds other processes may use a stale tree without a shared cache
+}
+
+PAGINATION_CONFIG = {
+    "ESTIMATED_COUNT_THRESHOLD": env.int("ESTIMATED_COUNT_THRESHOLD", default=100000),
+}
+
+RESPONSE_CACHE_CONFIG = {
+    "ENABLED": env.bool("RESPONSE_CACHE_ENABLED", default=SHARED_CACHE),  # versions must reach every worker
+    "TIMEOUT": timedelta(hours=1).total_seconds(),
+    "FRAGMENTS_ENABLED": env.bool("FRAGMENT_CACHE_ENABLED", default=True),  # pre-rendered list items
+    "FRAGMENT_TIMEOUT": timedelta(days=1).total_seconds(),
+}
+
+ASYNC_CONFIG = {
+    "ENABLED": env.bool("ASYNC_VIEWS_ENABLED", default=False),  # enabled by the ASGI application
+}
+
+EXPORT_CONFIG = {
+    "CHUNK_SIZE": env.int("EXPORT_CHUNK_SIZE", default=2000),  # rows fetched by server side cursor
+    "RENDER_CHUNK_SIZE": 100,  # rows rendered by streamed chunk
+}
+
+SEARCH_CONFIG = {
+    "LANGUAGE": env("SEARCH_LANGUAGE", default="simple"),  # text search configuration
+    "TRIGRAM_THRESHOLD": env.float("SEARCH_TRIGRAM_THRESHOLD", default=0.3),
+}
+
+RECOMMENDATION_CONFIG = {
+    "TOP_K": env.int("RECOMMENDATION_TOP_K", default=20),  # neighbours stored by product
+    "PURCHASE_WEIGHT": 1.0,  # score of each order with both products
+    "FAVOURITE_WEIGHT": 0.5,  # score of each user with both products as favourites
+    "REFRESH_OVERLAP": env.int("RECOMMENDATION_REFRESH_OVERLAP", default=1000),  # order product ids scanned again
+}
+
+PROFILING_CONFIG = {
+    "ENABLED": env.bool("PROFILING_ENABLED", default=False),
+    "WINDOW": env.int("PROFILING_WINDOW", default=100),  # samples kept by route
+    "TIMEOUT": timedelta(days=1).total_seconds(),
 }
 
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
@@ -130,8 +198,33 @@ EMAIL_USE_TLS = env("EMAIL_USE_TLS")
 EMAIL_HOST_USER = env("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = "qhvnilqmludrrakd"
 
+OUTBOX_CONFIG = {
+    "BATCH_SIZE": env.int("OUTBOX_BATCH_SIZE", default=50),  # emails sent by smtp connection
+    "MAX_ATTEMPTS": env.int("OUTBOX_MAX_ATTEMPTS", default=5),
+    "BACKOFF": 30,  # seconds of the first retry, doubled by attempt
+    "MAX_BACKOFF": timedelta(hours=1).total_seconds(),
+    "POLL_INTERVAL": env.float("OUTBOX_POLL_INTERVAL", default=5),  # seconds between empty drains
+}
+
 MERCADO_PAGO_CONFIG = {
     "ACCESS_TOKEN": env("MP_ACCESS_TOKEN"),
     "DATE_OF_EXPIRATION": timedelta(days=3),
     "NOTIFICATION_URL": f"{env('BACK_END_URL')}/api/checkout/notify/mp/",
+    "API_BASE_URL": env("MP_API_BASE_URL", default=None),  # like a local stub server
+    "TIMEOUT": (env.float("MP_CONNECT_TIMEOUT", default=3.05), env.float("MP_READ_TIMEOUT", default=10)),
+    "MAX_RETRIES": env.int("MP_MAX_RETRIES", default=2),
+    "BACKOFF": 0.2,  # seconds of the first retry, doubled by attempt
+    "POOL_SIZE": env.int("MP_POOL_SIZE", default=10),
+    "ITEM_TITLE_CACHE_SIZE": 256,  # title -> product id of legacy paid items
+    "PREFERENCE_CACHE_MARGIN": timedelta(hours=1),  # stops reusing preferences before they expire
+}
+
+PAYMENT_NOTIFICATION_CONFIG = {
+    "BATCH_SIZE": env.int("PAYMENT_NOTIFICATION_BATCH_SIZE", default=50),  # notifications by worker round
+    "WORKERS": env.int("PAYMENT_NOTIFICATION_WORKERS", default=4),
+    "MAX_ATTEMPTS": env.int("PAYMENT_NOTIFICATION_MAX_ATTEMPTS", default=8),
+    "BACKOFF": 10,  # seconds of the first retry, doubled by attempt
+    "MAX_BACKOFF": timedelta(hours=1).total_seconds(),
+    "POLL_INTERVAL": env.float("PAYMENT_NOTIFICATION_POLL_INTERVAL", default=1),  # seconds between empty rounds
+    "LEASE": env.float("PAYMENT_NOTIFICATION_LEASE", default=120),  # seconds before another worker may reclaim it
 }
@@ -347,6 +347,55 @@ class PromoAdmin(admin.ModelAdmin):
     list_per_page = 10
 
 
+class OutboundEmailAdmin(admin.ModelAdmin):
+    """
+    Outbound Email model admin configuration
+    """
+
+    ordering = ["-id"]
+    list_display = ["id", "subject", "status", "attempts", "available_at", "sent_at"]
+    list_display_links = ["subject"]
+
+    search_fields = ["subject", "recipient_list"]
+
+    list_filter = ["status"]
+
+    readonly_fields = ["created_at", "sent_at"]
+
+    list_per_page = 10
+
+
+class PaymentNotificationAdmin(admin.ModelAdmin):
+    """
+    Payment Notification model admin configuration
+    """
+
+    ordering = ["-id"]
+    list_display = ["id", "provider", "payment_id", "status", "attempts", "received_at", "processed_at"]
+    list_display_links = ["payment_id"]
+
+    search_fields = ["payment_id"]
+
+    list_filter = ["provider", "status"]
+
+    readonly_fields = ["received_at", "processed_at", "order"]
+
+    list_per_page = 10
+
+
+class ProductRecommendationRefreshAdmin(admin.ModelAdmin):
+    """
+    Product Recommendation Refresh model admin configuration
+    """
+
+    ordering = ["-id"]
+    list_display = ["id", "is_full", "refreshed_products", "last_order_product_id", "created_at"]
+
+    list_filter = ["is_full"]
+
+    list_per_page = 10
+
+
 admin.site.register(models.UserAccount, UserAdmin)  # user admin register
 admin.site.register(models.Category, CategoryAdmin)  # category admin register
 admin.site.register(models.Product, ProductAdmin)  # product admin register
@@ -360,3 +409,8 @@ admin.site.register(models.Cart, CartAdmin)  # cart admin register
 admin.site.register(models.CartItem, CartItemAdmin)  # cart item admin register
 admin.site.register(models.FavouriteItem, FavouriteItemAdmin)  # fav item admin register
 admin.site.register(models.Promo, PromoAdmin)  # promo admin register
+admin.site.register(models.OutboundEmail, OutboundEmailAdmin)  # outbound email admin register
+admin.site.register(models.PaymentNotification, PaymentNotificationAdmin)  # payment notification admin register
+admin.site.register(
+    models.ProductRecommendationRefresh, ProductRecommendationRefreshAdmin  # recommendation refresh admin register
+)
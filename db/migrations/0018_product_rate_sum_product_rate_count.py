@@ -0,0 +1,34 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0017_promo_alter_favouriteitem_options"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="rate_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="rate_sum",
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE db_product AS product
+                SET rate_sum = comment.rate_sum, rate_count = comment.rate_count
+                FROM (
+                    SELECT product_id, SUM(rate) AS rate_sum, COUNT(*) AS rate_count
+                    FROM db_comment
+                    GROUP BY product_id
+                ) AS comment
+                WHERE product.id = comment.product_id
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0018_product_rate_sum_product_rate_count"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="orderproduct",
+            index=models.Index(
+                fields=["order", "product"], name="db_orderproduct_order_product"
+            ),
+        ),
+    ]
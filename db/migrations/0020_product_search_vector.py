@@ -0,0 +1,58 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+from core.settings.base import SEARCH_CONFIG
+
+
+def create_trigram_extension(apps, schema_editor):
+    """
+    Creates pg_trgm extension when the server provides it
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+
+        if cursor.fetchone():
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+def populate_search_vectors(apps, schema_editor):
+    """
+    Populates the search document of existing products
+    """
+    Product = apps.get_model("db", "Product")
+    Category = apps.get_model("db", "Category")
+
+    language = SEARCH_CONFIG.get("LANGUAGE", "simple")
+    category_title = Subquery(Category.objects.filter(pk=OuterRef("category_id")).values("title")[:1])
+
+    Product.objects.update(
+        search_vector=SearchVector("title", weight="A", config=language)
+        + SearchVector(category_title, weight="B", config=language)
+        + SearchVector("description", weight="C", config=language)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0019_orderproduct_db_orderproduct_order_product"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="db_product_search_vector"
+            ),
+        ),
+        migrations.RunPython(create_trigram_extension, migrations.RunPython.noop),
+        migrations.RunPython(populate_search_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+from django.db import migrations
+
+
+def create_title_trigram_index(apps, schema_editor):
+    """
+    Creates the trigram index used by title icontains lookups when pg_trgm is installed
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+
+        if cursor.fetchone():
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS db_product_title_trgm "
+                'ON db_product USING gin (UPPER("title"::text) gin_trgm_ops)'
+            )
+
+
+def drop_title_trigram_index(apps, schema_editor):
+    """
+    Drops the title trigram index
+    """
+    schema_editor.execute("DROP INDEX IF EXISTS db_product_title_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0020_product_search_vector"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_title_trigram_index, drop_title_trigram_index),
+    ]
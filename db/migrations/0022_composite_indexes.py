@@ -0,0 +1,54 @@
+from django.db import migrations, models
+
+
+def unselect_duplicated_shipping_info(apps, schema_editor):
+    """
+    Keeps only the last selected shipping info of every user
+    """
+    ShippingInfo = apps.get_model("db", "ShippingInfo")
+
+    last_selected = (
+        ShippingInfo.objects.filter(is_selected=True)
+        .values("user")
+        .annotate(last_id=models.Max("id"))
+        .values("last_id")
+    )
+
+    ShippingInfo.objects.filter(is_selected=True).exclude(id__in=last_selected).update(is_selected=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0021_product_title_trigram_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(unselect_duplicated_shipping_info, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="shippinginfo",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_selected", True)),
+                fields=("user",),
+                name="db_shippinginfo_user_selected",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="cartitem",
+            index=models.Index(fields=["cart", "product"], name="db_cartitem_cart_product"),
+        ),
+        migrations.AddIndex(
+            model_name="favouriteitem",
+            index=models.Index(fields=["user", "product"], name="db_favouriteitem_user_product"),
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(fields=["product", "rate"], name="db_comment_product_rate"),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["category", "-sold"], include=("price", "rate"), name="db_product_category_sold"
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0024_outboundemail"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PaymentNotification",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("provider", models.CharField(max_length=20)),
+                ("payment_id", models.CharField(max_length=64)),
+                ("payload", models.JSONField(default=dict)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("processed", "Processed"),
+                            ("ignored", "Ignored"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("available_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("received_at", models.DateTimeField(auto_now_add=True)),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "order",
+                    models.OneToOneField(
+                        blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to="db.order"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Payment Notification",
+                "verbose_name_plural": "Payment Notifications",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="paymentnotification",
+            constraint=models.UniqueConstraint(fields=("provider", "payment_id"), name="db_paymentnotification_payment"),
+        ),
+        migrations.AddIndex(
+            model_name="paymentnotification",
+            index=models.Index(fields=["status", "available_at"], name="db_paymentnotif_status_avail"),
+        ),
+    ]
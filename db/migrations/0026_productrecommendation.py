@@ -0,0 +1,58 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0025_paymentnotification"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductRecommendation",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("score", models.FloatField()),
+                ("rank", models.PositiveSmallIntegerField()),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="recommendations", to="db.product"
+                    ),
+                ),
+                (
+                    "related_product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="recommended_for", to="db.product"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Product Recommendation",
+                "verbose_name_plural": "Product Recommendations",
+            },
+        ),
+        migrations.CreateModel(
+            name="ProductRecommendationRefresh",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("last_order_product_id", models.BigIntegerField(default=0)),
+                ("is_full", models.BooleanField(default=True)),
+                ("refreshed_products", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "Product Recommendation Refresh",
+                "verbose_name_plural": "Product Recommendation Refreshes",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="productrecommendation",
+            constraint=models.UniqueConstraint(fields=("product", "related_product"), name="db_productrecommendation_pair"),
+        ),
+        migrations.AddIndex(
+            model_name="productrecommendation",
+            index=models.Index(fields=["product", "rank"], name="db_productrec_product_rank"),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from uuid import uuid4
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Round
 from django.db.utils import DataError, IntegrityError
 from django.contrib.auth.models import (
     AbstractBaseUser,
@@ -8,11 +9,17 @@ from django.contrib.auth.models import (
     PermissionsMixin,
 )
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import get_user_model
 
 from simple_history.models import HistoricalRecords
 from apps.shipping.utils.services.shipping_price_service import ShippingPriceService
+from apps.orders.utils.services.stock_reservation_service import StockReservationService
+from apps.orders.utils.services.purchase_service import PurchaseService
+from apps.cart.utils.services.cart_stock_service import CartStockService
 
 
 class UserAccountManager(BaseUserManager):
@@ -114,6 +121,38 @@ class CommentManager(models.Manager):
             return round(rate_avg["rate__avg"], 2)
         return 5
 
+    @staticmethod
+    def update_rate_of(product_id: int, rate: float, count: int):
+        """
+        Adds entered rate and count to product rate aggregates
+        and derives its rate in a single update
+
+        Args:
+            product_id(int): product to update
+            rate(float): rate to add or subtract from rate sum
+            count(int): comments to add or subtract from rate count
+
+        Returns:
+            updated rows
+        """
+        rate_sum = models.F("rate_sum") + rate
+        rate_count = models.F("rate_count") + count
+
+        rate_avg = Round(
+            models.ExpressionWrapper(rate_sum / rate_count, output_field=models.FloatField()), 2
+        )
+
+        return Product.objects.filter(pk=product_id).update(
+            rate_sum=rate_sum,
+            rate_count=rate_count,
+            version=models.F("version") + 1,
+            rate=models.Case(
+                models.When(rate_count__lte=-count, then=models.Value(5.0)),
+                default=rate_avg,
+                output_field=models.FloatField(),
+            ),
+        )
+
 
 class Comment(models.Model):
     """
@@ -132,6 +171,7 @@ class Comment(models.Model):
     class Meta:
         verbose_name = _("Comment")
         verbose_name_plural = _("Comments")
+        indexes = [models.Index(fields=["product", "rate"], name="db_comment_product_rate")]
 
     def __str__(self):
         return self.subject
@@ -150,27 +190,34 @@ class Product(models.Model):
     category = models.ForeignKey("Category", on_delete=models.CASCADE)
     sold = models.PositiveBigIntegerField()
     rate = models.FloatField(default=5.0, editable=False)
+    rate_sum = models.FloatField(default=0, editable=False)
+    rate_count = models.PositiveIntegerField(default=0, editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
+    version = models.PositiveIntegerField(default=0, editable=False)  # changes with the representation
 
     class Meta:
         verbose_name = _("Product")
         verbose_name_plural = _("Products")
+        indexes = [
+            GinIndex(fields=["search_vector"], name="db_product_search_vector"),
+            models.Index(
+                fields=["category", "-sold"], include=["price", "rate"], name="db_product_category_sold"
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
     def create_comment(self, user: UserAccount, subject: str, content: str, rate: float):
         """
-        Creates a comment and update rate with avg
+        Creates a comment and refresh rate updated by comment signals
         """
         if not 0.1 <= rate <= 5:
             raise ValueError("Rate must be between 0.0 and 5.0")
 
         comment = Comment.objects.create(product=self, user=user, subject=subject, content=content, rate=rate)
 
-        product_rate_avg = Comment.objects.get_rate_avg_of(self)
-
-        self.rate = product_rate_avg
-        self.save()
+        self.refresh_from_db(fields=["rate", "rate_sum", "rate_count"])
 
         return comment
 
@@ -240,14 +287,14 @@ class ShippingInfoManager(models.Manager):
         Returns:
             instance
         """
+        is_selected = kwargs.pop("is_selected", False)  # only one selected by user
+
         ship_info = super().create(*args, **kwargs)
 
         user = kwargs.get("user", None)
 
-        selected = self.get_selected_shipping_info(user)
-
-        if not selected:
-            self.__set_is_selected_to(ship_info, True)
+        if is_selected or not self.get_selected_shipping_info(user):
+            self.select_shipping_info(ship_info)
 
         address_zip_code = self.ship_service.get_zip_code_of(ship_info.address)
 
@@ -310,6 +357,11 @@ class ShippingInfo(models.Model):
     class Meta:
         verbose_name = _("Shipping Information")
         verbose_name_plural = _("Shippings Information")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user"], condition=models.Q(is_selected=True), name="db_shippinginfo_user_selected"
+            ),
+        ]
 
     def __str__(self):
         if self.user.first_name and self.user.last_name:
@@ -326,6 +378,8 @@ class OrderManager(models.Manager):
         """
         Custom order creation
 
+        Order, order products and total price are saved in one transaction
+
         Returns:
             order instance
         """
@@ -333,38 +387,47 @@ class OrderManager(models.Manager):
         buyer = kwargs.get("buyer", None)
         shipping_info = kwargs.get("shipping_info", None)
 
-        instance = super().create(*args, id=id, buyer=buyer, shipping_info=shipping_info)
+        ship_price = kwargs.get("ship_price", None)
 
-        products = kwargs.get("products", None)
+        if not ship_price and shipping_info.ship_price > 0:
+            ship_price = shipping_info.ship_price
 
-        if products:
-            instance.create_order_products(products)
+        with transaction.atomic(using=self.db):
+            instance = super().create(
+                *args, id=id, buyer=buyer, shipping_info=shipping_info, total_price=ship_price or 0
+            )
 
-        ship_price = kwargs.get("ship_price", None)
+            products = kwargs.get("products", None)
 
-        if ship_price:
-            instance.set_ship_amount(ship_price)
-        elif shipping_info.ship_price > 0:
-            instance.set_ship_amount(shipping_info.ship_price)
+            if products:
+                instance.create_order_products(products)
 
         return instance
 
+    stock_service = StockReservationService()
+
     def discount_stock_of(self, order):
         """
-        Discount stock of each product in order
+        Discount stock and add sold units of each product in order
+        in a single update
 
         Args:
             order(Order): order to iterate
 
         Returns:
-            None
+            order lines without enough stock
         """
-        order_products = order.get_order_products()
+        order_products = (
+            OrderProduct.objects.filter(order=order)
+            .values("product_id")
+            .annotate(total_count=models.Sum("count"))
+        )
+
+        product_counts = {
+            order_product["product_id"]: order_product["total_count"] for order_product in order_products
+        }
 
-        for order_product in order_products:
-            product = order_product.product
-            product.stock = product.stock - order_product.count
-            product.save()
+        return self.stock_service.discount_stock(product_counts)
 
 
 class Order(models.Model):
@@ -407,33 +470,47 @@ class Order(models.Model):
         """
         Creates order products related with current order
 
+        Products are fetched in one query and order products are inserted
+        in bulk, then total price is updated once
+
         Args:
             product_list(list<dict>): products to add in the order
 
         Returns:
             order products list
         """
-        order_product_list = []
+        product_pk = Product._meta.pk
+
+        order_lines = [
+            (product_pk.to_python(product.get("product", None)), product.get("count", None))
+            for product in product_list
+        ]
+
+        with transaction.atomic():
+            products = Product.objects.in_bulk([product_id for product_id, count in order_lines])
+
+            order_product_list = []
+            total_price = self.total_price
 
-        for product in product_list:
-            count = product.get("count", None)
+            for product_id, count in order_lines:
+                product = products.get(product_id, None)
 
-            product_id = product.get("product", None)
-            product = Product.objects.filter(pk=product_id).first()
+                if not product:
+                    raise Product.DoesNotExist(f"Product {product_id} does not exist.")
 
-            self.total_price += product.price * count  # update order price
+                total_price += product.price * count  # update order price
 
-            payload = {
-                "count": count,
-                "product": product,
-                "order": self
-            }
-            order_product = OrderProduct.objects.create(**payload)  # create order product
-            order_product.save()
+                order_product_list.append(OrderProduct(count=count, product=product, order=self))
 
-            order_product_list.append(order_product)
+            OrderProduct.objects.bulk_create(order_product_list)  # create order products
 
-        self.save()  # save model changes
+            self.total_price = total_price
+            self.save(update_fields=["total_price"])  # save model changes
+
+            # refresh buyer purchased products
+            purchase_service = PurchaseService()
+            purchase_service.invalidate(self.buyer_id)
+            transaction.on_commit(lambda: purchase_service.refresh(self.buyer_id))
 
         return order_product_list  # created order products
 
@@ -505,6 +582,9 @@ class OrderProduct(models.Model):
     class Meta:
         verbose_name = _("Order Product")
         verbose_name_plural = _("Order Products")
+        indexes = [
+            models.Index(fields=["order", "product"], name="db_orderproduct_order_product"),
+        ]
 
     def __str__(self):
         return f"{self.count} of {self.product.title}"
@@ -518,6 +598,8 @@ class Cart(models.Model):
     total_items = models.IntegerField(default=0)
     last_modification = models.DateField(auto_now=True)
 
+    stock_service = CartStockService()
+
     class Meta:
         verbose_name = _("Cart")
         verbose_name_plural = _("Carts")
@@ -534,27 +616,48 @@ class Cart(models.Model):
 
     def get_products(self):
         """
-        Gets own products
+        Gets own products with their product and category
         """
-        self.refresh_from_db()
-
-        products = self.get_cart_item_model().objects.filter(cart=self)
+        products = (
+            self.get_cart_item_model().objects.filter(cart=self).select_related("product__category").order_by("pk")
+        )
 
         return products
 
+    @staticmethod
+    def get_items_price():
+        """
+        Returns the summed price of cart items expression
+        """
+        return models.Sum(
+            models.F("count") * models.F("product__price"),
+            output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        )
+
     def get_total_price(self):
         """
         Calculates total price
         """
-        self.refresh_from_db()
+        price = self.get_products().aggregate(total_price=self.get_items_price())["total_price"]
 
-        cart_items = self.get_cart_item_model().objects.filter(cart=self)
+        return price or 0
+
+    def get_summary(self):
+        """
+        Gets own items and cart totals in a single query
 
-        products_price = [item.product.price * item.count for item in cart_items]
+        Returns:
+            dict with items, total_items and total_price
+        """
+        items = list(self.get_products().annotate(cart_total_price=models.Window(expression=self.get_items_price())))
 
-        price = sum(products_price)
+        summary = {
+            "items": items,
+            "total_items": self.total_items,
+            "total_price": items[0].cart_total_price if items else 0,
+        }
 
-        return price
+        return summary
 
     def add_product(self, product: Product = None, count: int = None):
         """
@@ -617,11 +720,11 @@ class Cart(models.Model):
     def refresh_products(self):
         """
         Refreshes all cart items in cart if is necesary
-        """
 
-        cart_items = self.get_products()
-
-        [cart_item.update_item_count() for cart_item in cart_items]
+        Returns:
+            adjusted items list with item id, product id and new count
+        """
+        return self.stock_service.reconcile(self.pk)
 
 
 class CartItem(models.Model):
@@ -636,6 +739,7 @@ class CartItem(models.Model):
     class Meta:
         verbose_name = _("Cart Item")
         verbose_name_plural = _("Cart Items")
+        indexes = [models.Index(fields=["cart", "product"], name="db_cartitem_cart_product")]
 
     def __str__(self):
         return f"{self.product.title} to {self.cart.user.email}'s Cart"
@@ -698,6 +802,7 @@ class FavouriteItem(models.Model):
     class Meta:
         verbose_name = "Favourite Item"
         verbose_name_plural = "Favourite Items"
+        indexes = [models.Index(fields=["user", "product"], name="db_favouriteitem_user_product")]
 
     def __str__(self):
         """
@@ -729,3 +834,215 @@ class Promo(models.Model):
             Model str representation
         """
         return self.title
+
+
+class OutboundEmailManager(models.Manager):
+    """
+    Custom Manager to Outbound Email model
+    """
+
+    def enqueue(self, subject: str, message: str, email_from: str, recipient_list: list):
+        """
+        Stores an email to be sent by the outbox worker
+
+        The row is written in the current transaction, so it's only sent if
+        the request that queued it commits
+
+        Returns:
+            Queued outbound email
+        """
+        return self.create(subject=subject, message=message, email_from=email_from, recipient_list=recipient_list)
+
+    def get_pending(self, now):
+        """
+        Gets pending emails ready to be sent
+
+        Args:
+            now(datetime): current time
+
+        Returns:
+            Queryset of pending emails, oldest first
+        """
+        return self.filter(status=OutboundEmail.PENDING, available_at__lte=now).order_by("available_at", "pk")
+
+
+class OutboundEmail(models.Model):
+    """
+    Outbound Email model, the outbox drained by the email worker
+    """
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+    STATUS_CHOICES = [
+        (PENDING, _("Pending")),
+        (SENT, _("Sent")),
+        (FAILED, _("Failed")),
+    ]
+
+    subject = models.TextField()  # queued subjects may add the sender to a 255 chars subject
+    message = models.TextField()
+    email_from = models.EmailField()
+    recipient_list = ArrayField(
+        models.EmailField()
+    )
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    available_at = models.DateTimeField(default=timezone.now)  # next time the worker may send it
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    objects = OutboundEmailManager()  # custom manager
+
+    class Meta:
+        verbose_name = _("Outbound Email")
+        verbose_name_plural = _("Outbound Emails")
+        indexes = [
+            models.Index(fields=["status", "available_at"], name="db_outboundemail_status_avail"),
+        ]
+
+    def __str__(self):
+        """
+        Returns:
+            Model str representation
+        """
+        return f"{self.subject} to {', '.join(self.recipient_list)}"
+
+
+class PaymentNotificationManager(models.Manager):
+    """
+    Custom Manager to Payment Notification model
+    """
+
+    def receive(self, provider: str, payment_id: str, payload: dict):
+        """
+        Stores a payment notification in a single upsert
+
+        Repeated notifications of a payment reuse its row and queue it again
+        with its attempts reset, so the worker can see later payment status
+        changes and retry failed payments
+
+        Args:
+            provider(str): payment provider tag
+            payment_id(str): provider payment id
+            payload(dict): raw notification
+        """
+        self.bulk_create(
+            [self.model(provider=provider, payment_id=str(payment_id), payload=payload)],
+            update_conflicts=True,
+            unique_fields=["provider", "payment_id"],
+            update_fields=["payload", "status", "attempts", "available_at"],
+        )
+
+    def get_pending(self, now):
+        """
+        Gets pending notifications ready to be processed, including
+        processing ones whose worker lease expired
+
+        Args:
+            now(datetime): current time
+
+        Returns:
+            Queryset of pending notifications, oldest first
+        """
+        return self.filter(
+            status__in=[PaymentNotification.PENDING, PaymentNotification.PROCESSING], available_at__lte=now
+        ).order_by("available_at", "pk")
+
+
+class PaymentNotification(models.Model):
+    """
+    Payment Notification model, the inbox of payment provider webhooks
+    """
+    PENDING = "pending"
+    PROCESSING = "processing"
+    PROCESSED = "processed"
+    IGNORED = "ignored"
+    FAILED = "failed"
+
+    STATUS_CHOICES = [
+        (PENDING, _("Pending")),
+        (PROCESSING, _("Processing")),
+        (PROCESSED, _("Processed")),
+        (IGNORED, _("Ignored")),
+        (FAILED, _("Failed")),
+    ]
+
+    provider = models.CharField(max_length=20)
+    payment_id = models.CharField(max_length=64)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    available_at = models.DateTimeField(default=timezone.now)  # next time the worker may process or reclaim it
+    received_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    order = models.OneToOneField("Order", null=True, blank=True, on_delete=models.SET_NULL)
+
+    objects = PaymentNotificationManager()  # custom manager
+
+    class Meta:
+        verbose_name = _("Payment Notification")
+        verbose_name_plural = _("Payment Notifications")
+        constraints = [
+            models.UniqueConstraint(fields=["provider", "payment_id"], name="db_paymentnotification_payment"),
+        ]
+        indexes = [
+            models.Index(fields=["status", "available_at"], name="db_paymentnotif_status_avail"),
+        ]
+
+    def __str__(self):
+        """
+        Returns:
+            Model str representation
+        """
+        return f"{self.provider} payment {self.payment_id}"
+
+
+class ProductRecommendation(models.Model):
+    """
+    Product Recommendation model, the precomputed top neighbours of a product
+    """
+    product = models.ForeignKey("Product", on_delete=models.CASCADE, related_name="recommendations")
+    related_product = models.ForeignKey("Product", on_delete=models.CASCADE, related_name="recommended_for")
+    score = models.FloatField()
+    rank = models.PositiveSmallIntegerField()  # 1 is the best neighbour
+
+    class Meta:
+        verbose_name = _("Product Recommendation")
+        verbose_name_plural = _("Product Recommendations")
+        constraints = [
+            models.UniqueConstraint(fields=["product", "related_product"], name="db_productrecommendation_pair"),
+        ]
+        indexes = [
+            models.Index(fields=["product", "rank"], name="db_productrec_product_rank"),
+        ]
+
+    def __str__(self):
+        """
+        Returns:
+            Model str representation
+        """
+        return f"{self.related_product_id} for {self.product_id}"
+
+
+class ProductRecommendationRefresh(models.Model):
+    """
+    Product Recommendation Refresh model, the log of recommendation refreshes
+    """
+    last_order_product_id = models.BigIntegerField(default=0)  # newest order product scored
+    is_full = models.BooleanField(default=True)
+    refreshed_products = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Product Recommendation Refresh")
+        verbose_name_plural = _("Product Recommendation Refreshes")
+
+    def __str__(self):
+        """
+        Returns:
+            Model str representation
+        """
+        return f"{'Full' if self.is_full else 'Incremental'} refresh up to order product {self.last_order_product_id}"
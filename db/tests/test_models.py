@@ -2,6 +2,8 @@ import datetime
 from uuid import uuid4
 
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
 from django.contrib.auth import get_user_model
 from django.db.utils import IntegrityError, DataError
 from django.core.exceptions import ObjectDoesNotExist
@@ -397,6 +399,28 @@ class ShippingInfoModelTest(TestCase):
 
         self.assertEqual(selected_ship_info.id, shipping_info.id)
 
+    def test_create_selected_shipping_info_deselects_current_successful(self):
+        """
+        Tests if manager deselects the current shipping info when creates a selected one
+        """
+        first_shipping_info = ShippingInfo.objects.create(**self.mock_shipping_info)
+        second_shipping_info = ShippingInfo.objects.create(**self.mock_shipping_info, is_selected=True)
+
+        first_shipping_info.refresh_from_db()
+
+        self.assertFalse(first_shipping_info.is_selected)
+        self.assertTrue(second_shipping_info.is_selected)
+
+    def test_two_selected_shipping_info_reject(self):
+        """
+        Tests if database rejects two selected shipping info of the same user
+        """
+        ShippingInfo.objects.create(**self.mock_shipping_info)
+        second_shipping_info = ShippingInfo.objects.create(**self.mock_shipping_info)
+
+        with self.assertRaises(IntegrityError):
+            ShippingInfo.objects.filter(pk=second_shipping_info.pk).update(is_selected=True)
+
 
 class OrderProductModelTests(TestCase):
     """
@@ -920,6 +944,115 @@ class OrderModelTest(TestCase):
         self.assertEqual(updated_stock, product_stock - order_products_payload[0]["count"])
 
 
+    def test_order_model_manager_discount_stock_of_updates_sold_successful(self):
+        """
+        Tests if discount_stock_of adds sold units in a single update
+        """
+        second_product = Product.objects.create(**{**self.mock_product, "title": "Test second product"})
+
+        mock_order = {
+            "buyer": self.user,
+            "shipping_info": self.shipping_info,
+            "products": [
+                {"product": self.product.id, "count": 5},
+                {"product": second_product.id, "count": 3},
+            ],
+        }
+        order = Order.objects.create(**mock_order)
+
+        with self.assertNumQueries(2):
+            failed_lines = Order.objects.discount_stock_of(order)
+
+        self.assertEqual(failed_lines, [])
+
+        self.product.refresh_from_db()
+        second_product.refresh_from_db()
+
+        self.assertEqual(self.product.stock, self.mock_product["stock"] - 5)
+        self.assertEqual(self.product.sold, self.mock_product["sold"] + 5)
+        self.assertEqual(second_product.stock, self.mock_product["stock"] - 3)
+        self.assertEqual(second_product.sold, self.mock_product["sold"] + 3)
+
+    def test_order_model_manager_discount_stock_of_insufficient_stock_reject(self):
+        """
+        Tests if discount_stock_of doesn't discount lines without enough stock
+        """
+        second_product = Product.objects.create(**{**self.mock_product, "title": "Test second product"})
+
+        mock_order = {
+            "buyer": self.user,
+            "shipping_info": self.shipping_info,
+            "products": [
+                {"product": self.product.id, "count": self.mock_product["stock"] + 1},
+                {"product": second_product.id, "count": 3},
+            ],
+        }
+        order = Order.objects.create(**mock_order)
+
+        failed_lines = Order.objects.discount_stock_of(order)
+
+        self.assertEqual(failed_lines, [{"product": self.product.id, "count": self.mock_product["stock"] + 1}])
+
+        self.product.refresh_from_db()
+        second_product.refresh_from_db()
+
+        self.assertEqual(self.product.stock, self.mock_product["stock"])
+        self.assertEqual(self.product.sold, self.mock_product["sold"])
+        self.assertEqual(second_product.stock, self.mock_product["stock"] - 3)
+
+
+    def test_order_create_order_products_constant_queries_successful(self):
+        """
+        Tests if order creation makes the same queries whatever the products quantity
+        """
+        query_counts = []
+
+        for quantity in (1, 10):
+            products = [
+                Product.objects.create(**{**self.mock_product, "title": f"Test product {quantity}-{index}"})
+                for index in range(quantity)
+            ]
+
+            mock_order = {
+                "buyer": self.user,
+                "shipping_info": self.shipping_info,
+                "ship_price": 1,
+                "products": [{"product": product.id, "count": 2} for product in products],
+            }
+
+            with CaptureQueriesContext(connection) as context:
+                order = Order.objects.create(**mock_order)
+
+            query_counts.append(len(context.captured_queries))
+
+            self.assertEqual(len(order.get_order_products()), quantity)
+            self.assertEqual(order.total_price, sum(product.price * 2 for product in products) + 1)
+
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_order_create_order_products_no_existing_product_reject(self):
+        """
+        Tests if order products creation is rolled back with a no existing product
+        """
+        order = Order.objects.create(buyer=self.user, shipping_info=self.shipping_info)
+        total_price = order.total_price
+
+        order_products_payload = [
+            {"product": self.product.id, "count": 1},
+            {"product": self.product.id + 100, "count": 1},
+        ]
+
+        with self.assertRaises(ObjectDoesNotExist):
+            order.create_order_products(order_products_payload)
+
+        self.assertFalse(OrderProduct.objects.filter(order=order).exists())
+
+        self.assertEqual(order.total_price, total_price)
+
+        order.refresh_from_db()
+        self.assertEqual(order.total_price, total_price)
+
+
 class CommentModelTest(TestCase):
     """
     Tests Comment model
@@ -971,6 +1104,77 @@ class CommentModelTest(TestCase):
 
         self.assertTrue(comment.created_at)
 
+    def test_create_comment_updates_product_rate_aggregates_successful(self):
+        """
+        Tests if comment creation updates product rate sum and count
+        """
+        mock_comment = {
+            "user": self.user,
+            "product": self.product,
+            "subject": "Test comment subject",
+            "content": "Test comment content",
+            "rate": 4.3,
+        }
+
+        Comment.objects.create(**mock_comment)
+        Comment.objects.create(**{**mock_comment, "rate": 2.4})
+
+        self.product.refresh_from_db()
+
+        self.assertAlmostEqual(self.product.rate_sum, 6.7)
+        self.assertEqual(self.product.rate_count, 2)
+        self.assertEqual(self.product.rate, 3.35)
+
+    def test_update_comment_updates_product_rate_successful(self):
+        """
+        Tests if comment rate update changes product rate without rescan
+        """
+        mock_comment = {
+            "user": self.user,
+            "product": self.product,
+            "subject": "Test comment subject",
+            "content": "Test comment content",
+            "rate": 2,
+        }
+
+        comment = Comment.objects.create(**mock_comment)
+        Comment.objects.create(**{**mock_comment, "rate": 4})
+
+        comment.rate = 5
+        comment.save()
+
+        self.product.refresh_from_db()
+
+        self.assertEqual(self.product.rate_count, 2)
+        self.assertEqual(self.product.rate, 4.5)
+
+    def test_delete_comment_updates_product_rate_successful(self):
+        """
+        Tests if comment deletion changes product rate and resets it without comments
+        """
+        mock_comment = {
+            "user": self.user,
+            "product": self.product,
+            "subject": "Test comment subject",
+            "content": "Test comment content",
+            "rate": 2,
+        }
+
+        first_comment = Comment.objects.create(**mock_comment)
+        second_comment = Comment.objects.create(**{**mock_comment, "rate": 4})
+
+        first_comment.delete()
+        self.product.refresh_from_db()
+
+        self.assertEqual(self.product.rate_count, 1)
+        self.assertEqual(self.product.rate, 4)
+
+        second_comment.delete()
+        self.product.refresh_from_db()
+
+        self.assertEqual(self.product.rate_count, 0)
+        self.assertEqual(self.product.rate, 5)
+
     def test_create_comment_with_uuid_successful(self):
         """
         Tests if can create a comment with uuid
@@ -1460,6 +1664,64 @@ class CartModelTest(TestCase):
             + second_product.price * second_cart_item.count,
         )
 
+    def test_get_summary_in_cart_method_successful(self):
+        """
+        Test if cart has get_summary method and return items and totals in a single query
+        """
+        # Cart creation
+        mock_cart = {"user": self.user}
+        cart = Cart.objects.create(**mock_cart)
+
+        # Product creation
+        category = Category.objects.create(title="TestCategory")
+        mock_product = {
+            "title": "Test title",
+            "description": "Test description",
+            "price": 1111,
+            "images": [
+                "testimgurl.com/1",
+                "testimgurl.com/2",
+                "testimgurl.com/3",
+            ],
+            "stock": 11,
+            "category": category,
+            "sold": 11,
+        }
+        first_product = Product.objects.create(**mock_product)
+
+        mock_product["title"] = "Test Title 2"
+        mock_product["price"] = 232
+        second_product = Product.objects.create(**mock_product)
+
+        # Cart item creation
+        cart.add_product(first_product, 5)
+        cart.add_product(second_product, 2)
+
+        with CaptureQueriesContext(connection) as context:
+            summary = cart.get_summary()
+            categories = [item.product.category.title for item in summary["items"]]
+
+        self.assertEqual(len(context.captured_queries), 1)
+
+        self.assertEqual(len(summary["items"]), 2)
+        self.assertEqual(categories, [category.title, category.title])
+        self.assertEqual(summary["total_items"], 7)
+        self.assertEqual(summary["total_price"], first_product.price * 5 + second_product.price * 2)
+
+    def test_get_summary_in_cart_method_without_products_successful(self):
+        """
+        Test if cart has get_summary method and return empty totals without products
+        """
+        # Cart creation
+        mock_cart = {"user": self.user}
+        cart = Cart.objects.create(**mock_cart)
+
+        summary = cart.get_summary()
+
+        self.assertEqual(summary["items"], [])
+        self.assertEqual(summary["total_items"], 0)
+        self.assertEqual(summary["total_price"], 0)
+
     def test_remove_all_products_in_cart_method_successful(self):
         """
         Test if cart has remove_all_products method and update total items